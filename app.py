@@ -1,7 +1,14 @@
-from flask import Flask, render_template, jsonify, request, session
+from flask import Flask, Response, g, render_template, jsonify, request, session, stream_with_context
 import random
 import hashlib
+import secrets
 import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from datetime import date, datetime, timedelta
 from pathlib import Path
 
@@ -9,245 +16,279 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-from services.claude_client import ClaudeClient, ClaudeClientError
+from services.claude_client import ClaudeClientError, ClaudeUnavailableError, get_shared_async_client, get_shared_client
+from services.daily_store import DailyStore
+from services.game_delta import new_changes, record_change, respond as delta_respond
+from services.category_registry import CategoryRegistry
+from services.hint_pool import HintPool, reveal_bucket
+from services.hint_prefetch import HintPrefetcher
+from services.learning_cache import LearningCache
+from services.metrics import REGISTRY as METRICS
+from services.text_stream import TextStream
+from services.topic_bank import TopicWordBank, clean_topic
+from services.session_store import MemorySessionBackend, ServerSideSessionInterface, SQLiteSessionBackend
+from services.word_mask import apply_guess, is_guessed, new_mask
+from services.word_sources import (
+    BASE_CATEGORIES,
+    CURRICULUM_PATH,
+    DIFFICULTY_SETTINGS,
+    LEARNING_CONTENT_PATH,
+    build_snapshot,
+    snapshot_fingerprint,
+    word_bands,
+    word_sources,
+)
+from services.word_store import (
+    CategoryWords,
+    load_categories,
+    open_snapshot,
+    pack_categories,
+    write_snapshot,
+)
 
 app = Flask(__name__)
 app.secret_key = 'supersecretkey'  # Required for session management
 
-# Difficulty settings
-DIFFICULTY_SETTINGS = {
-    'easy': {
-        'attempts': 8,
-        'word_length': (3, 6),  # 3-6 letters
-        'ai_hint_cost': 0,  # Free hints
-    },
-    'medium': {
-        'attempts': 6,
-        'word_length': (5, 10),  # 5-10 letters
-        'ai_hint_cost': 0,  # Free hints
-    },
-    'hard': {
-        'attempts': 4,
-        'word_length': (8, 20),  # 8+ letters
-        'ai_hint_cost': 1,  # Costs 1 attempt
-    }
-}
-
-BASE_CATEGORIES = {
-    "Technology": [
-        {"word": "PYTHON", "hint": "A popular programming language named after a snake"},
-        {"word": "FLASK", "hint": "A micro web framework written in Python"},
-        {"word": "DEVELOPER", "hint": "Someone who writes code"},
-        {"word": "HANGMAN", "hint": "The name of this game"},
-        {"word": "CODING", "hint": "The act of writing computer programs"},
-        {"word": "ALGORITHM", "hint": "A step-by-step procedure for calculations"},
-        {"word": "DATABASE", "hint": "An organized collection of structured information"},
-        {"word": "SERVER", "hint": "Provides functionality for other programs or devices"},
-        {"word": "BROWSER", "hint": "Application for accessing the World Wide Web"},
-        {"word": "VARIABLE", "hint": "A container for storing data values"},
-        {"word": "INTERNET", "hint": "Global network of computers"},
-        {"word": "KEYBOARD", "hint": "Input device with keys"},
-        {"word": "MONITOR", "hint": "Output device that displays video"},
-        {"word": "SOFTWARE", "hint": "Instructions that tell a computer what to do"},
-        {"word": "HARDWARE", "hint": "Physical parts of a computer"},
-        {"word": "JAVASCRIPT", "hint": "Language of the web"},
-        {"word": "COMPILER", "hint": "Translates code into machine language"},
-        {"word": "ENCRYPTION", "hint": "Scrambling data for security"},
-        {"word": "FIREWALL", "hint": "Network security system"},
-        {"word": "ROBOTICS", "hint": "Branch of technology dealing with robots"},
-        {"word": "ARTIFICIAL INTELLIGENCE", "hint": "Simulation of human intelligence by machines"},
-        {"word": "CLOUD COMPUTING", "hint": "Delivery of computing services over the internet"},
-        {"word": "DEBUGGING", "hint": "Finding and fixing errors in code"},
-        {"word": "PIXEL", "hint": "Smallest unit of a digital image"},
-        {"word": "BANDWIDTH", "hint": "Maximum data transfer rate of a network"},
-        {"word": "CACHE", "hint": "Hardware or software component that stores data"},
-        {"word": "LINUX", "hint": "Open source operating system"},
-        {"word": "WINDOWS", "hint": "Operating system developed by Microsoft"},
-        {"word": "APPLE", "hint": "Tech company known for iPhones and Macs"}
-    ],
-    "Animals": [
-        {"word": "ELEPHANT", "hint": "The largest land animal"},
-        {"word": "GIRAFFE", "hint": "Has a very long neck"},
-        {"word": "PENGUIN", "hint": "A flightless bird that lives in the cold"},
-        {"word": "DOLPHIN", "hint": "A highly intelligent marine mammal"},
-        {"word": "KANGAROO", "hint": "A marsupial from Australia that hops"},
-        {"word": "LION", "hint": "The king of the jungle"},
-        {"word": "ZEBRA", "hint": "A horse-like animal with black and white stripes"},
-        {"word": "OCTOPUS", "hint": "A sea creature with eight arms"},
-        {"word": "SQUIRREL", "hint": "Small rodent with a bushy tail"},
-        {"word": "CHAMELEON", "hint": "Lizard known for changing colors"},
-        {"word": "CHEETAH", "hint": "Fastest land animal"},
-        {"word": "WHALE", "hint": "Largest marine mammal"},
-        {"word": "EAGLE", "hint": "Large bird of prey"},
-        {"word": "SHARK", "hint": "Predatory fish with cartilage skeleton"},
-        {"word": "PANDA", "hint": "Bear native to China that eats bamboo"},
-        {"word": "KOALA", "hint": "Australian marsupial that eats eucalyptus"},
-        {"word": "GORILLA", "hint": "Largest living primate"},
-        {"word": "WOLF", "hint": "Wild dog that travels in packs"},
-        {"word": "TIGER", "hint": "Largest cat species"},
-        {"word": "POLAR BEAR", "hint": "White bear from the Arctic"},
-        {"word": "RHINOCEROS", "hint": "Large herbivore with a horn on its nose"},
-        {"word": "HIPPOPOTAMUS", "hint": "Large semi-aquatic mammal from Africa"},
-        {"word": "CROCODILE", "hint": "Large aquatic reptile"},
-        {"word": "FLAMINGO", "hint": "Pink wading bird"},
-        {"word": "OWL", "hint": "Nocturnal bird of prey"},
-        {"word": "BUTTERFLY", "hint": "Insect with colorful wings"},
-        {"word": "TURTLE", "hint": "Reptile with a shell"},
-        {"word": "SLOTH", "hint": "Slow-moving tropical mammal"},
-        {"word": "OTTER", "hint": "Playful semi-aquatic mammal"}
-    ],
-    "Fruits": [
-        {"word": "BANANA", "hint": "A long curved yellow fruit"},
-        {"word": "STRAWBERRY", "hint": "Red fruit with seeds on the outside"},
-        {"word": "PINEAPPLE", "hint": "Tropical fruit with spiky skin"},
-        {"word": "WATERMELON", "hint": "Large green fruit with red flesh"},
-        {"word": "ORANGE", "hint": "A citrus fruit that shares its name with a color"},
-        {"word": "GRAPES", "hint": "Small round fruit used to make wine"},
-        {"word": "MANGO", "hint": "Tropical stone fruit with sweet yellow flesh"},
-        {"word": "AVOCADO", "hint": "Green fruit with a large pit, used in guacamole"},
-        {"word": "BLUEBERRY", "hint": "Small blue round berry"},
-        {"word": "KIWI", "hint": "Small brown fuzzy fruit with green flesh"},
-        {"word": "APPLE", "hint": "Common round fruit, red or green"},
-        {"word": "PEAR", "hint": "Sweet fruit with a narrow top and wide bottom"},
-        {"word": "CHERRY", "hint": "Small red stone fruit"},
-        {"word": "LEMON", "hint": "Sour yellow citrus fruit"},
-        {"word": "LIME", "hint": "Sour green citrus fruit"},
-        {"word": "PEACH", "hint": "Soft fuzzy fruit with a stone"},
-        {"word": "PLUM", "hint": "Purple fruit with a stone"},
-        {"word": "RASPBERRY", "hint": "Red aggregate fruit"},
-        {"word": "BLACKBERRY", "hint": "Dark purple aggregate fruit"},
-        {"word": "COCONUT", "hint": "Large seed with hard shell and white meat"},
-        {"word": "PAPAYA", "hint": "Tropical fruit with orange flesh and black seeds"},
-        {"word": "POMEGRANATE", "hint": "Fruit with many red juicy seeds"},
-        {"word": "DRAGONFRUIT", "hint": "Cactus fruit with pink skin and scales"},
-        {"word": "FIG", "hint": "Sweet fruit with many tiny seeds"},
-        {"word": "GUAVA", "hint": "Tropical fruit with pink or white flesh"},
-        {"word": "APRICOT", "hint": "Small orange fruit similar to a peach"},
-        {"word": "CANTALOUPE", "hint": "Melon with orange flesh"},
-        {"word": "GRAPEFRUIT", "hint": "Large sour citrus fruit"},
-        {"word": "LYCHEE", "hint": "Small fruit with rough red skin and white flesh"}
-    ],
-    "Countries": [
-        {"word": "FRANCE", "hint": "Home to the Eiffel Tower"},
-        {"word": "JAPAN", "hint": "Island nation known for sushi and anime"},
-        {"word": "BRAZIL", "hint": "Largest country in South America"},
-        {"word": "EGYPT", "hint": "Famous for pyramids and pharaohs"},
-        {"word": "AUSTRALIA", "hint": "Country and continent known for the Outback"},
-        {"word": "CANADA", "hint": "North American country known for maple syrup"},
-        {"word": "ITALY", "hint": "Boot-shaped country famous for pizza and pasta"},
-        {"word": "INDIA", "hint": "South Asian country with the Taj Mahal"},
-        {"word": "GERMANY", "hint": "European country known for Oktoberfest"},
-        {"word": "MEXICO", "hint": "North American country known for tacos and mariachi"},
-        {"word": "CHINA", "hint": "Most populous country in Asia"},
-        {"word": "UNITED STATES", "hint": "Country with 50 states"},
-        {"word": "UNITED KINGDOM", "hint": "Island nation in Europe"},
-        {"word": "RUSSIA", "hint": "Largest country by land area"},
-        {"word": "SPAIN", "hint": "European country known for bullfighting"},
-        {"word": "ARGENTINA", "hint": "South American country famous for tango"},
-        {"word": "SOUTH AFRICA", "hint": "Country at the southern tip of Africa"},
-        {"word": "THAILAND", "hint": "Southeast Asian country known for beaches and temples"},
-        {"word": "VIETNAM", "hint": "Southeast Asian country known for pho"},
-        {"word": "GREECE", "hint": "Cradle of Western civilization"},
-        {"word": "TURKEY", "hint": "Country bridging Europe and Asia"},
-        {"word": "SWEDEN", "hint": "Scandinavian country known for IKEA"},
-        {"word": "NORWAY", "hint": "Scandinavian country known for fjords"},
-        {"word": "SWITZERLAND", "hint": "Neutral country known for watches and chocolate"},
-        {"word": "NETHERLANDS", "hint": "Country known for tulips and windmills"},
-        {"word": "PERU", "hint": "Home to Machu Picchu"},
-        {"word": "NEW ZEALAND", "hint": "Island nation near Australia"},
-        {"word": "IRELAND", "hint": "The Emerald Isle"},
-        {"word": "PORTUGAL", "hint": "Country on the Iberian Peninsula"}
-    ]
-}
+# Prometheus-format metrics, served at /metrics (Claude calls are timed in services.claude_client)
+REQUEST_LATENCY = METRICS.histogram(
+    "http_request_duration_seconds",
+    "Time to build a response (streamed bodies excluded), by route",
+    ("route", "method", "status"),
+)
+AI_FAILURES = METRICS.counter(
+    "ai_generation_failures_total", "AI generations that failed and fell back", ("kind",)
+)
+
+
+@app.before_request
+def _start_request_timer():
+    g.request_started = time.perf_counter()
+
+
+@app.after_request
+def _record_request_latency(response):
+    started = g.pop('request_started', None)
+    if started is not None:
+        REQUEST_LATENCY.observe(
+            time.perf_counter() - started,
+            route=request.url_rule.rule if request.url_rule else "unmatched",
+            method=request.method,
+            status=str(response.status_code),
+        )
+    return response
 
 BASE_DIR = Path(__file__).resolve().parent
-CURRICULUM_PATH = BASE_DIR / "data" / "curriculum_words.json"
+INSTANCE_DIR = BASE_DIR / "instance"
+# Compiled, memory-mapped copy of all word data, rebuilt whenever its sources
+# change (see build_word_snapshot). An empty WORD_SNAPSHOT_PATH disables it.
+WORD_SNAPSHOT_PATH = os.getenv("WORD_SNAPSHOT_PATH", str(INSTANCE_DIR / "word_snapshot.bin"))
+# category -> metadata dict (the same object its CategoryWords shares with every word)
 CATEGORY_METADATA = {}
+# category -> difficulty -> eligible words (index-backed views), built at load time
+WORD_INDEX = {}
+# Source fingerprint CATEGORIES was loaded from (see reload_categories)
+_loaded_fingerprint = None
+
+# Game state lives server-side; the cookie only carries a signed session id.
+# SESSION_BACKEND=memory suits a single dev process, "cookie" restores Flask's default.
+SESSION_BACKEND = os.getenv("SESSION_BACKEND", "sqlite")
+if SESSION_BACKEND == "memory":
+    app.session_interface = ServerSideSessionInterface(MemorySessionBackend())
+elif SESSION_BACKEND == "sqlite":
+    app.session_interface = ServerSideSessionInterface(
+        SQLiteSessionBackend(os.getenv("SESSION_DB_PATH", INSTANCE_DIR / "sessions.sqlite3"))
+    )
+
+# Bump whenever the learning-info prompt changes so cached answers are refreshed.
+LEARNING_PROMPT_VERSION = "v1"
+LEARNING_CACHE = LearningCache(
+    os.getenv("LEARNING_CACHE_PATH", INSTANCE_DIR / "learning_cache.sqlite3"),
+    ttl_seconds=int(os.getenv("LEARNING_CACHE_TTL", 30 * 24 * 3600)),
+    max_entries=int(os.getenv("LEARNING_CACHE_MAX_ENTRIES", 50_000)),
+)
+
+
+def _difficulty_bands(words):
+    """Split words into per-difficulty bands by stripped length (all words if a tier is empty).
+
+    Packed categories get index-backed ``WordSubset`` views, anything else tuples.
+    """
+    if isinstance(words, CategoryWords) and words.bands:
+        # Indexed when the words were packed, so nothing to scan here
+        return {difficulty: words.bands.get(difficulty) or words for difficulty in DIFFICULTY_SETTINGS}
+    if not isinstance(words, CategoryWords):
+        words = tuple(words)
+    lengths = [len(w["word"].replace(' ', '')) for w in words]
+    bands = {}
+    for difficulty, settings in DIFFICULTY_SETTINGS.items():
+        min_len, max_len = settings['word_length']
+        picked = [i for i, length in enumerate(lengths) if min_len <= length <= max_len]
+        if not picked:
+            bands[difficulty] = words
+        elif isinstance(words, CategoryWords):
+            bands[difficulty] = words.subset(picked)
+        else:
+            bands[difficulty] = tuple(words[i] for i in picked)
+    return bands
 
 
-def _copy_base_categories():
-    categories = {}
-    for name, words in BASE_CATEGORIES.items():
-        CATEGORY_METADATA[name] = {
-            "subject": "General Knowledge",
-            "grade_band": "K-8",
-            "standard": None,
-            "description": f"Fun vocabulary about {name.lower()}",
-        }
-        categories[name] = [dict(word) for word in words]
-    return categories
+# AI custom topics are indexed like curriculum categories, one runtime category
+# per topic bank (see TOPIC_BANK), rebuilt whenever the bank's version changes.
+RUNTIME_CATEGORIES = CategoryRegistry(band_builder=_difficulty_bands, max_categories=200)
+CUSTOM_CATEGORY_PREFIX = "AI: "
 
 
-def load_curriculum_categories():
-    categories = _copy_base_categories()
+def _custom_category_metadata(topic):
+    return {
+        "subject": "Custom AI Topic",
+        "grade_band": "K-8",
+        "standard": None,
+        "description": f"AI-generated vocabulary about {topic}",
+    }
 
-    if not CURRICULUM_PATH.exists():
-        return categories
 
-    try:
-        payload = json.loads(CURRICULUM_PATH.read_text(encoding="utf-8"))
-    except Exception as exc:
-        print(f"Failed to load curriculum categories: {exc}")
-        return categories
-
-    for cat in payload.get("categories", []):
-        name = (cat.get("name") or "").strip()
-        if not name:
-            continue
+def _category_metadata(category):
+    if category.startswith(CUSTOM_CATEGORY_PREFIX):
+        return _custom_category_metadata(category[len(CUSTOM_CATEGORY_PREFIX):])
+    return CATEGORY_METADATA.get(category, {})
 
-        words = []
-        for entry in cat.get("words", []):
-            normalized_word = (entry.get("word") or "").strip().upper()
-            if not normalized_word:
-                continue
 
-            word_record = {
-                "word": normalized_word,
-                "hint": entry.get("hint") or entry.get("definition") or "",
-            }
-
-            for field in ("definition", "fun_fact", "essential_question"):
-                value = entry.get(field)
-                if value:
-                    word_record[field] = value
-
-            # Attach category-level metadata so every word knows its context
-            for field, value in (
-                ("subject", cat.get("subject")),
-                ("grade_band", cat.get("grade_band")),
-                ("standard", cat.get("standard")),
-                ("description", cat.get("description")),
-            ):
-                if value:
-                    word_record[field] = value
-
-            words.append(word_record)
-
-        if words:
-            categories[name] = words
-            CATEGORY_METADATA[name] = {
-                "subject": cat.get("subject"),
-                "grade_band": cat.get("grade_band"),
-                "standard": cat.get("standard"),
-                "description": cat.get("description"),
-            }
+def _custom_category(topic, difficulty):
+    """Indexed words of a topic's bank, or None before anything was generated for it."""
+    version, bank = TOPIC_BANK.snapshot(topic, difficulty)
+    if not bank:
+        return None
+    key = _custom_topic_key(topic, difficulty)
+    category = RUNTIME_CATEGORIES.get(key)
+    if category is None or category.version != version:
+        category = RUNTIME_CATEGORIES.register(key, bank, _custom_category_metadata(topic), version=version)
+    return category
+
+
+def _pick_word(candidates, previous_word=None):
+    """Pick a random entry in O(1), avoiding an immediate repeat of previous_word."""
+    count = len(candidates)
+    idx = random.randrange(count)
+    if count > 1 and candidates[idx]["word"] == previous_word:
+        # Shift to one of the other count - 1 slots, uniformly
+        idx = (idx + random.randrange(1, count)) % count
+    return candidates[idx]
+
+
+def _word_sources(strict=False):
+    """Built-in plus curriculum categories as (name, metadata, records) triples."""
+    return word_sources(CURRICULUM_PATH, LEARNING_CONTENT_PATH, strict)
+
+
+def _word_snapshot_fingerprint():
+    return snapshot_fingerprint(CURRICULUM_PATH, LEARNING_CONTENT_PATH)
+
 
+def build_word_snapshot(force=False):
+    """Compile the word data into WORD_SNAPSHOT_PATH unless it is current; True if written."""
+    return build_snapshot(WORD_SNAPSHOT_PATH, CURRICULUM_PATH, LEARNING_CONTENT_PATH, force)
+
+
+def _load_word_snapshot(fingerprint):
+    """Map the word snapshot, compiling it first if missing or stale; None if unusable.
+
+    When the sources cannot be compiled, the last good snapshot is used instead.
+    """
+    if not WORD_SNAPSHOT_PATH:
+        return None
+    categories = open_snapshot(WORD_SNAPSHOT_PATH, fingerprint)
+    if categories is None:
+        try:
+            write_snapshot(WORD_SNAPSHOT_PATH, _word_sources(strict=True), fingerprint, word_bands())
+        except (OSError, ValueError) as exc:
+            print(f"Failed to compile word snapshot: {exc}")
+            return open_snapshot(WORD_SNAPSHOT_PATH, None)
+        # The JSON was parsed and dropped while writing; only the mapped file survives.
+        categories = open_snapshot(WORD_SNAPSHOT_PATH, fingerprint)
+    return categories
+
+
+def load_curriculum_categories():
+    """Return {category: CategoryWords} and install it with its word indexes."""
+    global _loaded_fingerprint
+    _loaded_fingerprint = _word_snapshot_fingerprint()
+    categories = _load_word_snapshot(_loaded_fingerprint)
+    if categories is None:
+        categories = load_categories(pack_categories(_word_sources(), word_bands()))
+    return _install_categories(categories)
+
+
+def _install_categories(categories):
+    """Swap in a new category table, indexes first.
+
+    Each global is rebound in one step, so readers see the old or the new
+    table, and a category found in CATEGORIES always has its bands indexed.
+    """
+    global WORD_INDEX, CATEGORY_METADATA, CATEGORIES
+    word_index = {name: _difficulty_bands(words) for name, words in categories.items()}
+    WORD_INDEX = word_index
+    CATEGORY_METADATA = {name: words.metadata for name, words in categories.items()}
+    CATEGORIES = categories
     return categories
 
 
 def _lookup_word_entry(category, word):
-    for entry in CATEGORIES.get(category, []):
-        if entry.get("word") == word:
-            return entry
+    words = CATEGORIES.get(category)
+    if words is not None:
+        entry = words.find(word)
+    elif category.startswith(CUSTOM_CATEGORY_PREFIX):
+        entry = _custom_word_entry(category[len(CUSTOM_CATEGORY_PREFIX):], word)
+    else:
+        entry = None
+    if entry is not None:
+        return entry
     return {"word": word, "hint": ""}
 
 
-def generate_learning_info_with_ai(word, category):
-    """Generate definition and fun fact using Claude AI."""
-    try:
-        client = ClaudeClient()
-        
-        prompt = f"""CRITICAL: Create educational content about the EXACT word "{word}" ONLY.
+def _custom_word_entry(topic, word):
+    for difficulty in DIFFICULTY_SETTINGS:
+        category = _custom_category(topic, difficulty)
+        entry = category.by_word.get(word) if category else None
+        if entry is not None:
+            return entry
+    return None
+
+
+# Upper bound in seconds on each kind of Claude call, retries and rate-limit
+# waits included; past it the caller gets its usual non-AI fallback.
+AI_HINT_DEADLINE = float(os.getenv("CLAUDE_HINT_DEADLINE", 8))
+LEARNING_DEADLINE = float(os.getenv("CLAUDE_LEARNING_DEADLINE", 20))
+LEARNING_BATCH_DEADLINE = float(os.getenv("CLAUDE_LEARNING_BATCH_DEADLINE", 45))
+CUSTOM_WORDS_DEADLINE = float(os.getenv("CLAUDE_CUSTOM_WORDS_DEADLINE", 15))
+
+
+def _claude_generate_text(**kwargs):
+    return get_shared_client().generate_text(**kwargs)
+
+
+def _claude_stream_text(**kwargs):
+    """Iterator of text deltas; the client is resolved eagerly so config errors raise here."""
+    return get_shared_client().stream_text(**kwargs)
+
+
+def _parse_learning_fields(text):
+    """Pick DEFINITION/FUN_FACT lines out of a (possibly partial) learning response."""
+    fields = {}
+    for line in text.strip().split('\n'):
+        line = line.strip()
+        if line.startswith('DEFINITION:'):
+            fields['definition'] = line.replace('DEFINITION:', '').strip()
+        elif line.startswith('FUN_FACT:'):
+            fields['fun_fact'] = line.replace('FUN_FACT:', '').strip()
+    return fields
+
+
+def _request_learning_info_from_ai(word, category, stream=None):
+    """Ask Claude for a definition and fun fact; raises on any failure.
+
+    When a ``TextStream`` is given the reply is streamed into it as it arrives.
+    """
+    prompt = f"""CRITICAL: Create educational content about the EXACT word "{word}" ONLY.
 
 THE WORD IS: {word}
 Category: {category}
@@ -262,44 +303,173 @@ DEFINITION: [Write a clear, age-appropriate definition of "{word}" in one senten
 FUN_FACT: [Write an interesting, educational fun fact about "{word}" in one sentence]
 
 Double-check your content is about "{word}" before responding."""
-        
-        response = client.generate_text(
-            prompt=prompt,
-            max_tokens=150,
-            temperature=0.4,
-            system=f"CRITICAL: Generate accurate content exclusively about '{word}'. Verify your response is about '{word}' and not any other word. Be factually correct."
-        )
-        
-        # Parse the response
-        definition = ""
-        fun_fact = ""
-        
-        lines = response.strip().split('\n')
-        for line in lines:
-            line = line.strip()
-            if line.startswith('DEFINITION:'):
-                definition = line.replace('DEFINITION:', '').strip()
-            elif line.startswith('FUN_FACT:'):
-                fun_fact = line.replace('FUN_FACT:', '').strip()
-        
-        return {
-            'definition': definition,
-            'fun_fact': fun_fact
-        }
-        
+
+    request_kwargs = dict(
+        prompt=prompt,
+        max_tokens=150,
+        temperature=0.4,
+        system=f"CRITICAL: Generate accurate content exclusively about '{word}'. Verify your response is about '{word}' and not any other word. Be factually correct.",
+        deadline=LEARNING_DEADLINE,
+    )
+    if stream is None:
+        response = _claude_generate_text(**request_kwargs)
+    else:
+        for delta in _claude_stream_text(**request_kwargs):
+            stream.append(delta)
+        response = stream.text()
+
+    # Parse the response
+    fields = _parse_learning_fields(response)
+    definition = fields.get('definition', "")
+    fun_fact = fields.get('fun_fact', "")
+
+    if not definition and not fun_fact:
+        raise ValueError(f"Unparseable learning info response for {word!r}")
+
+    return {
+        'definition': definition,
+        'fun_fact': fun_fact
+    }
+
+
+def _fallback_learning_info(category):
+    return {
+        'definition': f"A word from the {category} category.",
+        'fun_fact': f"This word is part of the {category} vocabulary."
+    }
+
+
+def get_learning_content(word, category, fallback=True, stream=None):
+    """Return definition/fun fact for a word, consulting the persistent cache first.
+
+    With ``fallback=False`` AI failures are raised instead of replaced by generic text.
+    ``stream`` receives the raw reply as it is generated (see /api/learning/stream).
+    """
+    cached = LEARNING_CACHE.get(word, category, LEARNING_PROMPT_VERSION)
+    if cached is not None:
+        return cached
+
+    try:
+        content = _request_learning_info_from_ai(word, category, stream=stream)
     except Exception as e:
+        if not fallback:
+            raise
         print(f"Failed to generate learning info with AI: {e}")
-        # Fallback to generic content
-        return {
-            'definition': f"A word from the {category} category.",
-            'fun_fact': f"This word is part of the {category} vocabulary."
-        }
+        AI_FAILURES.inc(kind="learning")
+        # Fallbacks are not cached so the next request gets another chance.
+        return _fallback_learning_info(category)
+
+    LEARNING_CACHE.set(word, category, LEARNING_PROMPT_VERSION, content)
+    return content
+
+
+# Learning info for many words is requested this many words per Claude call.
+LEARNING_BATCH_SIZE = max(1, int(os.getenv("LEARNING_BATCH_SIZE", 10)))
+
+
+def _valid_learning_item(item):
+    if not isinstance(item, dict):
+        return None
+    definition, fun_fact = item.get('definition'), item.get('fun_fact')
+    if not (isinstance(definition, str) and definition.strip() and isinstance(fun_fact, str) and fun_fact.strip()):
+        return None
+    return {'definition': definition.strip(), 'fun_fact': fun_fact.strip()}
+
+
+def _request_learning_batch_from_ai(items):
+    """Ask Claude for learning info on several (word, category) pairs in one request.
 
+    Returns a list aligned with ``items``; entries missing or malformed in the
+    reply are None. Raises when the request itself fails.
+    """
+    listing = "\n".join(
+        f'{number}. "{word}" (category: {category})' for number, (word, category) in enumerate(items, 1)
+    )
+    prompt = f"""Create educational content for each of these words:
 
-def generate_custom_words_with_ai(topic, difficulty):
+{listing}
+
+For EACH word, write a clear, age-appropriate definition in one sentence and an interesting, educational fun fact in one sentence. Every entry must be about its EXACT word only.
+
+Respond with only a JSON array containing one object per word, in the same order:
+[{{"word": "WORD", "definition": "...", "fun_fact": "..."}}]"""
+
+    response = _claude_generate_text(
+        prompt=prompt,
+        max_tokens=min(4000, 150 * len(items) + 100),
+        temperature=0.4,
+        system="Generate factually accurate educational content. Each entry must be exclusively about its own word. Respond ONLY with the requested JSON.",
+        deadline=LEARNING_BATCH_DEADLINE,
+    )
+
+    start, end = response.find('['), response.rfind(']')
+    try:
+        data = json.loads(response[start:end + 1]) if 0 <= start < end else None
+    except json.JSONDecodeError:
+        data = None
+    if not isinstance(data, list):
+        print(f"Unparseable batch learning info response for {len(items)} words")
+        return [None] * len(items)
+
+    # Trust positions when the word matches, otherwise find the word anywhere in the reply
+    by_word = {}
+    for item in data:
+        if isinstance(item, dict):
+            by_word.setdefault(str(item.get('word', '')).strip().upper(), item)
+    results = []
+    for index, (word, _category) in enumerate(items):
+        item = data[index] if index < len(data) else None
+        if not isinstance(item, dict) or str(item.get('word', '')).strip().upper() != word.upper():
+            item = by_word.get(word.upper())
+        results.append(_valid_learning_item(item))
+    return results
+
+
+def get_learning_contents(items, fallback=True):
+    """Batch ``get_learning_content`` for an iterable of (word, category) pairs.
+
+    Cache misses are requested LEARNING_BATCH_SIZE words per call; words a batch
+    reply leaves out or garbles are retried on their own. Returns a dict keyed
+    by (word, category); with ``fallback=False`` words that still fail are omitted.
+    """
+    results = {}
+    missing = []
+    for word, category in dict.fromkeys(items):
+        cached = LEARNING_CACHE.get(word, category, LEARNING_PROMPT_VERSION)
+        if cached is not None:
+            results[(word, category)] = cached
+        else:
+            missing.append((word, category))
+
+    for start in range(0, len(missing), LEARNING_BATCH_SIZE):
+        chunk = missing[start:start + LEARNING_BATCH_SIZE]
+        retry_alone = True
+        try:
+            contents = _request_learning_batch_from_ai(chunk) if len(chunk) > 1 else [None]
+        except Exception as e:
+            # The request itself failed; per-word calls would most likely fail too
+            print(f"Failed to generate batch learning info with AI: {e}")
+            contents, retry_alone = [None] * len(chunk), False
+
+        for (word, category), content in zip(chunk, contents):
+            if content is None and retry_alone:
+                try:
+                    content = _request_learning_info_from_ai(word, category)
+                except Exception as e:
+                    print(f"Failed to generate learning info with AI: {e}")
+            if content is None:
+                AI_FAILURES.inc(kind="learning")
+                if fallback:
+                    results[(word, category)] = _fallback_learning_info(category)
+                continue
+            LEARNING_CACHE.set(word, category, LEARNING_PROMPT_VERSION, content)
+            results[(word, category)] = content
+    return results
+
+
+def generate_custom_words_with_ai(topic, difficulty, avoid_words=None):
     """Generate a list of words for a custom topic using Claude AI."""
     try:
-        client = ClaudeClient()
         diff_settings = DIFFICULTY_SETTINGS.get(difficulty, DIFFICULTY_SETTINGS['medium'])
         min_len, max_len = diff_settings['word_length']
         
@@ -309,6 +479,7 @@ def generate_custom_words_with_ai(topic, difficulty):
         1. Each word/phrase must be between {min_len} and {max_len} characters long (excluding spaces).
         2. Provide a short, helpful hint for each.
         3. The words should be appropriate for a K-8 student.
+        {f"4. Do not use any of these words: {', '.join(avoid_words)}." if avoid_words else ""}
         
         Respond in this exact JSON format:
         {{
@@ -320,11 +491,12 @@ def generate_custom_words_with_ai(topic, difficulty):
         }}
         """
         
-        response = client.generate_text(
+        response = _claude_generate_text(
             prompt=prompt,
             max_tokens=500,
             temperature=0.7,
-            system="You are an educational game designer. Respond ONLY with the requested JSON."
+            system="You are an educational game designer. Respond ONLY with the requested JSON.",
+            deadline=CUSTOM_WORDS_DEADLINE,
         )
         
         # Clean response in case of markdown blocks
@@ -338,23 +510,75 @@ def generate_custom_words_with_ai(topic, difficulty):
         return data.get("words", [])
     except Exception as e:
         print(f"Failed to generate custom words with AI: {e}")
+        AI_FAILURES.inc(kind="custom_words")
         return []
 
 
-def build_learning_info(word_data, category_name):
-    if not word_data:
-        return None
+# Custom topic words are banked per (topic, difficulty) and reused across games;
+# the bank is topped up in the background once a player has few unseen words left.
+TOPIC_BANK = TopicWordBank(os.getenv("TOPIC_BANK_PATH", INSTANCE_DIR / "topic_banks.sqlite3"))
+TOPIC_BANK_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="topic-bank")
+TOPIC_BANK_LOW_WATER = 3
+CUSTOM_SEEN_MAX_TOPICS = 5
 
-    word = word_data.get("word", "")
-    
-    # Generate definition and fun_fact using AI
-    ai_content = generate_learning_info_with_ai(word, category_name)
 
+def _custom_topic_key(topic, difficulty):
+    return "|".join(TOPIC_BANK.key(topic, difficulty))
+
+
+def _generate_topic_words(topic, difficulty, avoid_words=None):
+    """generate_custom_words_with_ai plus one batched learning-info request for the new words."""
+    words = generate_custom_words_with_ai(topic, difficulty, avoid_words)
+    category = f"{CUSTOM_CATEGORY_PREFIX}{topic}"
+    request_learning_batch(
+        [((w.get("word") or "").strip().upper(), category) for w in words if (w.get("word") or "").strip()]
+    )
+    return words
+
+
+def _custom_topic_words(topic, difficulty):
+    """Return words for a custom game, calling Claude only when the bank is empty."""
+    category = _custom_category(topic, difficulty)
+    if category is None:
+        TOPIC_BANK.add(topic, difficulty, _generate_topic_words(topic, difficulty))
+        category = _custom_category(topic, difficulty)
+        if category is None:
+            return ()
+    bank = category.words
+
+    # Prefer banked words this player hasn't had yet
+    seen = set(session.get('custom_seen', {}).get(_custom_topic_key(topic, difficulty), []))
+    fresh = tuple(w for w in bank if w["word"] not in seen)
+    if len(fresh) <= TOPIC_BANK_LOW_WATER:
+        TOPIC_BANK.refill_async(topic, difficulty, _generate_topic_words, TOPIC_BANK_EXECUTOR)
+    return fresh or bank
+
+
+def _mark_custom_word_seen(topic, difficulty, word):
+    key = _custom_topic_key(topic, difficulty)
+    seen_by_topic = session.get('custom_seen', {})
+    seen = seen_by_topic.pop(key, [])
+    if word in seen:
+        seen = []  # the player has cycled through the whole bank; start over
+    seen_by_topic[key] = seen + [word]
+    while len(seen_by_topic) > CUSTOM_SEEN_MAX_TOPICS:
+        seen_by_topic.pop(next(iter(seen_by_topic)))
+    session['custom_seen'] = seen_by_topic
+
+    # The player's own recent topics, for /api/categories?include_custom=1
+    topics = [t for t in session.get('custom_topics', []) if t != topic] + [topic]
+    session['custom_topics'] = topics[-CUSTOM_SEEN_MAX_TOPICS:]
+
+
+def _has_own_learning_content(word_data):
+    return bool(word_data.get("definition") and word_data.get("fun_fact"))
+
+
+def _compose_learning_info(word_data, category_name, ai_content):
     info = {"category": category_name}
-    
-    # Use AI-generated content
-    info["definition"] = ai_content.get("definition", "")
-    info["fun_fact"] = ai_content.get("fun_fact", "")
+
+    info["definition"] = word_data.get("definition") or ai_content.get("definition", "")
+    info["fun_fact"] = word_data.get("fun_fact") or ai_content.get("fun_fact", "")
     
     # Keep other metadata from word_data or category defaults
     fields = [
@@ -365,7 +589,7 @@ def build_learning_info(word_data, category_name):
         "essential_question",
     ]
 
-    category_defaults = CATEGORY_METADATA.get(category_name, {})
+    category_defaults = _category_metadata(category_name)
     for field in fields:
         value = word_data.get(field) or category_defaults.get(field)
         if value:
@@ -375,6 +599,109 @@ def build_learning_info(word_data, category_name):
     return info
 
 
+# Background generation of learning info so starting a game never waits on Claude.
+LEARNING_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("LEARNING_WORKERS", 4)),
+    thread_name_prefix="learning-info",
+)
+LEARNING_JOB_RETENTION = 60  # seconds a job's result (incl. fallbacks) is reused
+LEARNING_LONG_POLL_MAX = 10  # seconds /api/learning may hold a request open
+# Long polls hold a server thread each; beyond this many at once they answer
+# straight away and the client retries after LEARNING_POLL_RETRY_AFTER seconds.
+_LEARNING_POLL_SLOTS = threading.BoundedSemaphore(int(os.getenv("LEARNING_POLL_SLOTS", 4)))
+LEARNING_POLL_RETRY_AFTER = 2
+LEARNING_STREAM_TIMEOUT = 30  # seconds /api/learning/stream relays a job before giving up
+_LEARNING_JOBS = {}
+_LEARNING_JOBS_LOCK = threading.Lock()
+
+
+def _run_learning_job(word, category_name, stream):
+    try:
+        return get_learning_content(word, category_name, stream=stream)
+    finally:
+        stream.close()
+
+
+def _learning_job_for(word, category_name):
+    """Return the in-flight (or recently finished) job for a word, submitting one if needed.
+
+    A job is a ``(future, stream)`` pair; the stream carries Claude's reply as it
+    is generated so SSE clients can relay it without a second request.
+    """
+    key = (word, category_name)
+    now = time.monotonic()
+    with _LEARNING_JOBS_LOCK:
+        # Finished jobs linger briefly so pollers (and fallbacks) don't resubmit immediately
+        for job_key, (future, _stream, submitted_at) in list(_LEARNING_JOBS.items()):
+            if future.done() and now - submitted_at > LEARNING_JOB_RETENTION:
+                del _LEARNING_JOBS[job_key]
+
+        job = _LEARNING_JOBS.get(key)
+        if job is None:
+            stream = TextStream()
+            future = LEARNING_EXECUTOR.submit(_run_learning_job, word, category_name, stream)
+            job = (future, stream, now)
+            _LEARNING_JOBS[key] = job
+        return job[0], job[1]
+
+
+def _run_learning_batch(jobs):
+    try:
+        contents = get_learning_contents([key for key, _job in jobs])
+    except Exception as e:
+        print(f"Failed to generate batch learning info with AI: {e}")
+        contents = {}
+    for (word, category_name), (future, stream, _submitted_at) in jobs:
+        stream.close()
+        future.set_result(contents.get((word, category_name)) or _fallback_learning_info(category_name))
+
+
+def request_learning_batch(items):
+    """Queue background learning info for many (word, category) pairs as one batch.
+
+    Each word gets an ordinary learning job entry, so a game that starts on one
+    of them waits for the batch instead of sending its own request.
+    """
+    now = time.monotonic()
+    jobs = []
+    with _LEARNING_JOBS_LOCK:
+        for key in dict.fromkeys(items):
+            if key in _LEARNING_JOBS:
+                continue
+            job = (Future(), TextStream(), now)
+            _LEARNING_JOBS[key] = job
+            jobs.append((key, job))
+    if jobs:
+        LEARNING_EXECUTOR.submit(_run_learning_batch, jobs)
+
+
+def request_learning_info(word_data, category_name, wait=0):
+    """Return a word's learning info without blocking on Claude.
+
+    Returns the learning info when it can be produced from local data (curriculum,
+    pre-generated content or the cache). Otherwise generation is queued on the
+    background pool and ``None`` is returned, optionally after waiting up to
+    ``wait`` seconds for the job to finish.
+    """
+    if not word_data:
+        return None
+
+    word = word_data.get("word", "")
+    if _has_own_learning_content(word_data):
+        return _compose_learning_info(word_data, category_name, {})
+
+    cached = LEARNING_CACHE.get(word, category_name, LEARNING_PROMPT_VERSION)
+    if cached is not None:
+        return _compose_learning_info(word_data, category_name, cached)
+
+    future, _stream = _learning_job_for(word, category_name)
+    try:
+        ai_content = future.result(timeout=max(0, wait))
+    except FuturesTimeoutError:
+        return None
+    return _compose_learning_info(word_data, category_name, ai_content)
+
+
 CATEGORIES = load_curriculum_categories()
 
 
@@ -383,12 +710,31 @@ def _ensure_session_learning_info(category, word):
     if info:
         return info
     entry = _lookup_word_entry(category, word)
-    info = build_learning_info(entry, category)
-    session['learning_info'] = info
+    info = request_learning_info(entry, category)
+    if info:
+        session['learning_info'] = info
+        session['changes'] = record_change(session.get('changes'), "learning")
     return info
 
-def get_masked_word(word, guesses):
-    return " ".join([letter if (letter in guesses or not letter.isalpha()) else "_" for letter in word])
+
+def _game_mask(game):
+    """Incremental mask of a game (session or daily state); rebuilt for games saved without one."""
+    mask = game.get("mask")
+    if mask is None:
+        mask = new_mask(game["word"], game.get("guesses", []))
+    return mask
+
+
+def _game_response(response, game_id, changes, data=None):
+    """jsonify a game response, trimmed to a delta when the client asked for one.
+
+    Clients opt in with ``delta`` (JSON body or query string) and pass the
+    ``state`` token of their last response as ``since`` (see services.game_delta).
+    """
+    source = request.args if data is None else data
+    if source.get('delta') in (True, 1, '1', 'true'):
+        response = delta_respond(response, game_id, changes, source.get('since'))
+    return jsonify(response)
 
 
 def _today_str() -> str:
@@ -406,6 +752,234 @@ def _daily_word_for(category: str, day_str: str):
     return words[idx]
 
 
+# Daily challenges are precomputed into a day-keyed table so rollover costs no AI latency.
+DAILY_STORE = DailyStore(os.getenv("DAILY_DB_PATH", INSTANCE_DIR / "daily.sqlite3"))
+DAILY_PRECOMPUTE_LEAD_MINUTES = int(os.getenv("DAILY_PRECOMPUTE_LEAD_MINUTES", 15))
+DAILY_RETENTION_DAYS = 7
+
+
+def _daily_challenge_for(category: str, day_str: str):
+    """Return the day's word, hint and learning info, preferring the precomputed table."""
+    record = DAILY_STORE.get(day_str, category)
+    if record is not None:
+        return record
+    word_data = _daily_word_for(category, day_str)
+    return {"word": word_data["word"], "hint": word_data["hint"], "learning": None}
+
+
+def precompute_daily(day_str: str, force: bool = False):
+    """Store the daily word and learning info for every category on ``day_str``.
+
+    Returns the number of categories written. Words whose learning info can't be
+    generated are stored without it and picked up lazily by _ensure_daily_game.
+    """
+    todo = {}
+    for category in list(CATEGORIES):
+        existing = DAILY_STORE.get(day_str, category)
+        if existing and existing.get("learning") and not force:
+            continue
+        todo[category] = _daily_word_for(category, day_str)
+
+    # One batched request covers every category's word
+    contents = get_learning_contents(
+        [(word_data["word"], category) for category, word_data in todo.items()
+         if not _has_own_learning_content(word_data)],
+        fallback=False,
+    )
+
+    written = 0
+    for category, word_data in todo.items():
+        if _has_own_learning_content(word_data):
+            learning_info = _compose_learning_info(word_data, category, {})
+        elif (word_data["word"], category) in contents:
+            learning_info = _compose_learning_info(word_data, category, contents[(word_data["word"], category)])
+        else:
+            print(f"Failed to precompute learning info for {category}/{word_data['word']}")
+            learning_info = None
+
+        DAILY_STORE.put(day_str, category, {
+            "word": word_data["word"],
+            "hint": word_data["hint"],
+            "learning": learning_info,
+        })
+        written += 1
+
+    oldest_kept = date.fromisoformat(day_str) - timedelta(days=DAILY_RETENTION_DAYS)
+    DAILY_STORE.prune(oldest_kept.isoformat())
+    return written
+
+
+def _seconds_until_daily_precompute(now: datetime) -> float:
+    midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+    target = midnight - timedelta(minutes=DAILY_PRECOMPUTE_LEAD_MINUTES)
+    if target <= now:
+        target += timedelta(days=1)
+    return (target - now).total_seconds()
+
+
+def _daily_precompute_loop(stop_event):
+    # Warm today on boot, then tomorrow shortly before every midnight.
+    day_str = _today_str()
+    while True:
+        try:
+            precompute_daily(day_str)
+        except Exception as e:
+            print(f"Daily precompute for {day_str} failed: {e}")
+        if stop_event.wait(_seconds_until_daily_precompute(datetime.now())):
+            return
+        day_str = (date.today() + timedelta(days=1)).isoformat()
+
+
+def start_daily_precompute_scheduler():
+    """Run precompute_daily in a daemon thread; returns an Event that stops it."""
+    stop_event = threading.Event()
+    threading.Thread(
+        target=_daily_precompute_loop, args=(stop_event,), name="daily-precompute", daemon=True
+    ).start()
+    return stop_event
+
+
+# Seconds between checks for changed word sources (curriculum, learning
+# content); changes are compiled and swapped in without a restart. 0 disables.
+# The watcher runs in served processes only (init_worker, `python app.py`).
+CURRICULUM_RELOAD_INTERVAL = float(os.getenv("CURRICULUM_RELOAD_INTERVAL", 5))
+CURRICULUM_COMPILE_TIMEOUT = float(os.getenv("CURRICULUM_COMPILE_TIMEOUT", 300))
+CURRICULUM_RELOAD_MAX_BACKOFF = 300  # seconds between retries after repeated compile errors
+CURRICULUM_RELOADS = METRICS.counter(
+    "curriculum_reloads_total", "Curriculum reloads by result", ("result",)
+)
+_RELOAD_LOCK = threading.Lock()
+_reload_failures = 0
+_reload_retry_at = 0.0
+
+
+def _compile_word_snapshot(fingerprint):
+    """Bring the snapshot up to ``fingerprint`` in a child process and map it.
+
+    Parsing a large curriculum would hold the GIL for the whole parse and
+    stall this worker's requests, so it happens in ``scripts.build_word_snapshot``,
+    which compiles from ``services.word_sources`` without importing this module.
+    A lock file makes concurrent workers wait for one compile instead of
+    each running their own.
+    """
+    try:
+        import fcntl
+    except ImportError:
+        fcntl = None
+
+    lock_path = Path(WORD_SNAPSHOT_PATH).with_name(Path(WORD_SNAPSHOT_PATH).name + ".lock")
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, "a") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        categories = open_snapshot(WORD_SNAPSHOT_PATH, fingerprint)
+        if categories is None:
+            result = subprocess.run(
+                [sys.executable, "-m", "scripts.build_word_snapshot"],
+                cwd=BASE_DIR,
+                env=dict(os.environ, WORD_SNAPSHOT_PATH=WORD_SNAPSHOT_PATH, CURRICULUM_PATH=str(CURRICULUM_PATH)),
+                capture_output=True,
+                text=True,
+                timeout=CURRICULUM_COMPILE_TIMEOUT,
+            )
+            if result.returncode != 0:
+                lines = (result.stderr or result.stdout).strip().splitlines()
+                message = lines[-1] if lines else f"exit status {result.returncode}"
+                # Exit status 2: the sources themselves are invalid (see build_word_snapshot)
+                raise (ValueError if result.returncode == 2 else RuntimeError)(message)
+            categories = open_snapshot(WORD_SNAPSHOT_PATH, fingerprint)
+    if categories is None:
+        raise RuntimeError("word sources changed while compiling")
+    return categories
+
+
+def _validate_categories(categories):
+    missing = [name for name in BASE_CATEGORIES if name not in categories]
+    if missing:
+        raise ValueError(f"built-in categories missing: {', '.join(missing)}")
+    empty = [name for name, words in categories.items() if not len(words)]
+    if empty:
+        raise ValueError(f"categories without words: {', '.join(empty)}")
+
+
+def _pin_daily_words(names):
+    """Store today's daily word for ``names`` from the current table before it changes.
+
+    Keeps the day's challenge the same for everyone who plays it after a reload.
+    """
+    day_str = _today_str()
+    for name in names:
+        if name in CATEGORIES and DAILY_STORE.get(day_str, name) is None:
+            word_data = _daily_word_for(name, day_str)
+            DAILY_STORE.put(day_str, name, {"word": word_data["word"], "hint": word_data["hint"], "learning": None})
+
+
+def reload_categories():
+    """Rebuild the category table if its sources changed and swap it in.
+
+    The new table is compiled off the request path, validated, then installed
+    with _install_categories. Games in progress keep their word: sessions
+    store it, and lookups of a word that is gone fall back like unknown ones.
+    Returns the names of added, changed and removed categories.
+
+    Invalid sources (ValueError) are not retried until they change again.
+    Other errors (compile timeout, I/O) are retried with exponential backoff.
+    """
+    global _loaded_fingerprint, _reload_failures, _reload_retry_at
+    with _RELOAD_LOCK:
+        fingerprint = _word_snapshot_fingerprint()
+        if fingerprint == _loaded_fingerprint or time.monotonic() < _reload_retry_at:
+            return []
+        try:
+            if WORD_SNAPSHOT_PATH:
+                categories = _compile_word_snapshot(fingerprint)
+            else:
+                categories = load_categories(pack_categories(_word_sources(strict=True), word_bands()))
+            _validate_categories(categories)
+        except ValueError:
+            # Compiling these sources again would fail the same way
+            _loaded_fingerprint, _reload_failures, _reload_retry_at = fingerprint, 0, 0.0
+            CURRICULUM_RELOADS.inc(result="failed")
+            raise
+        except Exception:
+            _reload_failures += 1
+            delay = max(CURRICULUM_RELOAD_INTERVAL, 1) * 2 ** _reload_failures
+            _reload_retry_at = time.monotonic() + min(delay, CURRICULUM_RELOAD_MAX_BACKOFF)
+            CURRICULUM_RELOADS.inc(result="failed")
+            raise
+
+        current = CATEGORIES
+        changed = sorted(
+            name for name in current.keys() | categories.keys()
+            if name not in current or name not in categories or current[name].digest != categories[name].digest
+        )
+        _pin_daily_words(changed)
+        _install_categories(categories)
+        _loaded_fingerprint, _reload_failures, _reload_retry_at = fingerprint, 0, 0.0
+        CURRICULUM_RELOADS.inc(result="reloaded")
+        return changed
+
+
+def _curriculum_watch_loop(stop_event):
+    while not stop_event.wait(CURRICULUM_RELOAD_INTERVAL):
+        try:
+            changed = reload_categories()
+        except Exception as e:
+            print(f"Curriculum reload failed, keeping the current words: {e}")
+            continue
+        if changed:
+            print(f"Curriculum reloaded; changed categories: {len(changed)}")
+
+
+def start_curriculum_watcher():
+    """Poll the word sources in a daemon thread; returns an Event that stops it."""
+    stop_event = threading.Event()
+    threading.Thread(
+        target=_curriculum_watch_loop, args=(stop_event,), name="curriculum-watcher", daemon=True
+    ).start()
+    return stop_event
+
+
 def _get_daily_state():
     return session.get("daily_state", {})
 
@@ -431,8 +1005,7 @@ def _ensure_daily_game(category: str):
 
     # Start a new daily game if none exists for today.
     if not current or current.get("date") != day_str:
-        word_data = _daily_word_for(category, day_str)
-        learning_info = build_learning_info(word_data, category)
+        word_data = _daily_challenge_for(category, day_str)
         
         word = word_data["word"]
         initial_guesses = list(set(c.upper() for c in word if not c.isalpha()))
@@ -443,27 +1016,41 @@ def _ensure_daily_game(category: str):
             "word": word,
             "hint": word_data["hint"],
             "guesses": initial_guesses,
+            "mask": new_mask(word, initial_guesses),
             "attempts_left": 6,
             "game_over": False,
             "win": False,
             "started_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
-            "learning": learning_info,
+            # Precomputed when available, otherwise filled in below once generated
+            "learning": word_data.get("learning"),
             "ai_hints_history": [],
+            "game_id": secrets.token_hex(8),
         }
         _set_daily_state(daily_state)
 
     refreshed = _get_daily_state()[category]
 
-    # Backfill learning info for games that started before curriculum data existed
+    # Fill in learning info once it is available (generated in the background)
     needs_update = False
     if not refreshed.get("learning"):
         word_entry = _lookup_word_entry(category, refreshed.get("word"))
-        refreshed["learning"] = build_learning_info(word_entry, category)
-        needs_update = True
+        learning_info = request_learning_info(word_entry, category)
+        if learning_info:
+            refreshed["learning"] = learning_info
+            refreshed["changes"] = record_change(refreshed.get("changes"), "learning")
+            needs_update = True
     
     if "ai_hints_history" not in refreshed:
         refreshed["ai_hints_history"] = []
         needs_update = True
+
+    if "game_id" not in refreshed:
+        refreshed["game_id"] = secrets.token_hex(8)
+        needs_update = True
+
+    if "mask" not in refreshed:
+        refreshed["mask"] = _game_mask(refreshed)
+        needs_update = True
         
     if needs_update:
         daily_state[category] = refreshed
@@ -514,44 +1101,35 @@ def start_game():
     if difficulty not in DIFFICULTY_SETTINGS:
         difficulty = 'medium'
         
-    # Get difficulty settings
-    diff_settings = DIFFICULTY_SETTINGS[difficulty]
-    min_len, max_len = diff_settings['word_length']
-    attempts = diff_settings['attempts']
+    attempts = DIFFICULTY_SETTINGS[difficulty]['attempts']
+
+    # Picking a previously generated "AI: <topic>" category replays that topic's bank
+    if category.startswith(CUSTOM_CATEGORY_PREFIX) and not custom_topic:
+        category, custom_topic = 'Custom', category[len(CUSTOM_CATEGORY_PREFIX):]
+    custom_topic = clean_topic(custom_topic or '')
 
-    if category == 'Custom' and custom_topic:
-        available_words = generate_custom_words_with_ai(custom_topic, difficulty)
+    is_custom = category == 'Custom' and bool(custom_topic)
+    if is_custom:
+        available_words = _custom_topic_words(custom_topic, difficulty)
         if not available_words:
             return jsonify({'error': 'Failed to generate words for this topic. Try another one!'}), 500
-        category = f"AI: {custom_topic}"
-    elif category not in CATEGORIES:
-        category = 'Technology'
-        available_words = CATEGORIES[category]
+        category = f"{CUSTOM_CATEGORY_PREFIX}{custom_topic}"
+        candidates = _difficulty_bands(available_words)[difficulty]
     else:
-        available_words = CATEGORIES[category]
-    
-    # Filter words by difficulty (word length)
-    filtered_words = [w for w in available_words if min_len <= len(w["word"].replace(' ', '')) <= max_len]
-    
-    # Fallback to all words if no matches
-    if not filtered_words:
-        filtered_words = available_words
-    
-    previous_word = session.get('word')
-    
-    # Filter out the previous word to avoid immediate repetition
-    if previous_word and len(filtered_words) > 1:
-        candidates = [w for w in filtered_words if w["word"] != previous_word]
-        if candidates:
-            word_data = random.choice(candidates)
-        else:
-            word_data = random.choice(filtered_words)
-    else:
-        word_data = random.choice(filtered_words)
+        # Pre-filtered by word length at load time; one lookup, as a reload may swap the table
+        bands = WORD_INDEX.get(category)
+        if bands is None:
+            category, bands = 'Technology', WORD_INDEX['Technology']
+        candidates = bands[difficulty]
+
+    word_data = _pick_word(candidates, session.get('word'))
+    if is_custom:
+        _mark_custom_word_seen(custom_topic, difficulty, word_data["word"])
 
     word = word_data["word"]
     hint = word_data["hint"]
-    learning_info = build_learning_info(word_data, category)
+    # Never block the first board on Claude; pending info is fetched via /api/learning
+    learning_info = request_learning_info(word_data, category)
     
     # Automatically "guess" spaces and non-alpha characters
     initial_guesses = list(set(c.upper() for c in word if not c.isalpha()))
@@ -561,6 +1139,7 @@ def start_game():
     session['category'] = category
     session['difficulty'] = difficulty
     session['guesses'] = initial_guesses
+    session['mask'] = mask = new_mask(word, initial_guesses)
     session['attempts_left'] = attempts
     session['game_over'] = False
     session['win'] = False
@@ -568,16 +1147,19 @@ def start_game():
     session['ai_hints_used'] = 0
     session['ai_hints_history'] = []
     session['mode'] = 'random'  # Set mode to random
+    session['game_id'] = secrets.token_hex(8)
+    session['changes'] = new_changes()
+    session['hint_prefetch'] = bool(data.get('prefetch_hints', HINT_PREFETCH_DEFAULT))
     
     # Clear daily-specific session data
     session.pop('daily_word', None)
     session.pop('daily_date', None)
     
-    return jsonify({
+    return _game_response({
         "mode": "random",
         "category": category,
         "difficulty": difficulty,
-        "masked_word": get_masked_word(word, initial_guesses),
+        "masked_word": mask["masked"],
         "attempts_left": attempts,
         "max_attempts": attempts,
         "guesses": initial_guesses,
@@ -586,11 +1168,16 @@ def start_game():
         "hint": hint,
         "category": category,
         "learning": learning_info,
-    })
+        "learning_pending": learning_info is None,
+    }, session['game_id'], session['changes'], data)
 
 @app.route('/api/categories', methods=['GET'])
 def get_categories():
-    return jsonify(list(CATEGORIES.keys()))
+    categories = list(CATEGORIES.keys())
+    # The player's own recent AI topics, on request; other players' topics are never listed
+    if request.args.get('include_custom') in ('1', 'true'):
+        categories.extend(f"{CUSTOM_CATEGORY_PREFIX}{topic}" for topic in reversed(session.get('custom_topics', [])))
+    return jsonify(categories)
 
 
 @app.route('/api/daily/start', methods=['POST'])
@@ -601,26 +1188,28 @@ def daily_start():
 
     # Set session mode to daily
     session['mode'] = 'daily'
-    session['category'] = category
+    session['category'] = game["category"]
+    session['hint_prefetch'] = bool(data.get('prefetch_hints', HINT_PREFETCH_DEFAULT))
 
     streaks = _get_streaks().get(game["category"], {"current": 0, "best": 0})
     response = {
         "mode": "daily",
         "date": game["date"],
         "category": game["category"],
-        "masked_word": get_masked_word(game["word"], game["guesses"]),
+        "masked_word": _game_mask(game)["masked"],
         "attempts_left": game["attempts_left"],
         "guesses": game["guesses"],
         "game_over": game["game_over"],
         "win": game["win"],
         "hint": game["hint"],
         "learning": game.get("learning"),
+        "learning_pending": not game.get("learning"),
         "streak_current": streaks.get("current", 0),
         "streak_best": streaks.get("best", 0),
     }
     if game["game_over"]:
         response["word"] = game["word"]
-    return jsonify(response)
+    return _game_response(response, game["game_id"], game.get("changes"), data)
 
 
 @app.route('/api/daily/status', methods=['GET'])
@@ -633,19 +1222,20 @@ def daily_status():
         "mode": "daily",
         "date": game["date"],
         "category": game["category"],
-        "masked_word": get_masked_word(game["word"], game["guesses"]),
+        "masked_word": _game_mask(game)["masked"],
         "attempts_left": game["attempts_left"],
         "guesses": game["guesses"],
         "game_over": game["game_over"],
         "win": game["win"],
         "hint": game["hint"],
         "learning": game.get("learning"),
+        "learning_pending": not game.get("learning"),
         "streak_current": streaks.get("current", 0),
         "streak_best": streaks.get("best", 0),
     }
     if game["game_over"]:
         response["word"] = game["word"]
-    return jsonify(response)
+    return _game_response(response, game["game_id"], game.get("changes"))
 
 
 @app.route('/api/daily/guess', methods=['POST'])
@@ -664,33 +1254,45 @@ def daily_guess():
     guesses = list(game.get("guesses", []))
     word = game.get("word")
     attempts_left = int(game.get("attempts_left", 6))
+    mask = _game_mask(game)
 
-    if letter in guesses:
+    if is_guessed(mask, letter):
         return jsonify({"error": "Already guessed"}), 400
 
     guesses.append(letter)
+    mask, hit = apply_guess(word, mask, letter)
 
-    if letter not in word:
+    if not hit:
         attempts_left -= 1
 
-    masked_word = get_masked_word(word, guesses)
-    win = "_" not in masked_word
+    masked_word = mask["masked"]
+    win = mask["remaining"] == 0
     game_over = win or attempts_left <= 0
 
+    changed = ["mask" if hit else "attempts"] + (["outcome"] if game_over else [])
+    changes = record_change(game.get("changes"), *changed, guess=True)
+
     # Persist back into session state.
     daily_state = _get_daily_state()
     daily_state[game["category"]] = {
         **game,
         "guesses": guesses,
+        "mask": mask,
         "attempts_left": attempts_left,
         "game_over": game_over,
         "win": win,
+        "changes": changes,
     }
     _set_daily_state(daily_state)
 
     if game_over:
         _update_streak_if_finished(game["category"], win=win, attempts_left=attempts_left, guesses=guesses)
 
+    if hit or game_over:
+        _prefetch_next_hint(
+            game["game_id"], word, game["category"], masked_word, game.get("ai_hints_history", []), game_over
+        )
+
     streaks = _get_streaks().get(game["category"], {"current": 0, "best": 0})
     response = {
         "mode": "daily",
@@ -703,6 +1305,7 @@ def daily_guess():
         "win": win,
         "hint": game.get("hint", ""),
         "learning": game.get("learning"),
+        "learning_pending": not game.get("learning"),
         "streak_current": streaks.get("current", 0),
         "streak_best": streaks.get("best", 0),
     }
@@ -710,7 +1313,7 @@ def daily_guess():
     if game_over:
         response["word"] = word
 
-    return jsonify(response)
+    return _game_response(response, game["game_id"], changes, data)
 
 @app.route('/api/guess', methods=['POST'])
 def guess_letter():
@@ -729,28 +1332,38 @@ def guess_letter():
     guesses = session.get('guesses', [])
     word = session.get('word')
     attempts_left = session.get('attempts_left')
+    mask = _game_mask(session)
     
-    if letter in guesses:
+    if is_guessed(mask, letter):
         return jsonify({"error": "Already guessed"}), 400
         
     guesses.append(letter)
     session['guesses'] = guesses
+    mask, hit = apply_guess(word, mask, letter)
+    session['mask'] = mask
     
-    if letter not in word:
+    if not hit:
         attempts_left -= 1
         session['attempts_left'] = attempts_left
         
-    masked_word = get_masked_word(word, guesses)
+    masked_word = mask["masked"]
     
-    win = "_" not in masked_word
+    win = mask["remaining"] == 0
     game_over = win or attempts_left <= 0
     
     session['game_over'] = game_over
     session['win'] = win
+    changed = ["mask" if hit else "attempts"] + (["outcome"] if game_over else [])
+    session['changes'] = record_change(session.get('changes'), *changed, guess=True)
     
     category_name = session.get("category", "Technology")
     learning_info = _ensure_session_learning_info(category_name, word)
 
+    if (hit or game_over) and session.get('game_id'):
+        _prefetch_next_hint(
+            session['game_id'], word, category_name, masked_word, session.get('ai_hints_history', []), game_over
+        )
+
     response = {
         "mode": "random",
         "category": category_name,
@@ -761,12 +1374,13 @@ def guess_letter():
         "win": win,
         "hint": session.get('hint', ''),
         "learning": learning_info,
+        "learning_pending": learning_info is None,
     }
     
     if game_over:
         response["word"] = word  # Reveal the word
         
-    return jsonify(response)
+    return _game_response(response, session.get('game_id'), session.get('changes'), data)
 
 @app.route('/api/status', methods=['GET'])
 def get_status():
@@ -786,50 +1400,125 @@ def get_status():
     response = {
         "mode": "random",
         "category": category_name,
-        "masked_word": get_masked_word(word, guesses),
+        "masked_word": _game_mask(session)["masked"],
         "attempts_left": attempts_left,
         "guesses": guesses,
         "game_over": game_over,
         "win": win,
         "hint": hint,
         "learning": learning_info,
+        "learning_pending": learning_info is None,
     }
     
     if game_over:
         response["word"] = word
         
-    return jsonify(response)
+    return _game_response(response, session.get('game_id'), session.get('changes'))
 
 
-@app.route('/api/ai-hint', methods=['POST'])
-def generate_ai_hint():
-    """Generate a dynamic, engaging hint using Claude AI."""
-    if 'word' not in session:
-        return jsonify({'error': 'No game in progress'}), 400
-    
-    word = session['word']
-    category = session.get('category', 'Unknown')
-    guesses = session.get('guesses', [])
-    masked_word = get_masked_word(word, guesses)
-    attempts_left = session.get('attempts_left', 6)
-    
-    # Handle daily mode history
-    if session.get('mode') == 'daily':
-        daily_state = _get_daily_state()
-        category_state = daily_state.get(category, {})
-        previous_hints = category_state.get('ai_hints_history', [])
-    else:
-        previous_hints = session.get('ai_hints_history', [])
-    
+@app.route('/api/learning', methods=['GET'])
+def get_learning():
+    """Deliver learning info that is still being generated when a game starts.
+
+    Pass ``wait`` (seconds) to long-poll until the background job finishes.
+    Info that arrives while waiting is returned but not stored in the session:
+    the session would be saved when the poll ends, over whatever guesses were
+    made meanwhile. The next status or guess request stores it from the cache.
+    """
     try:
-        client = ClaudeClient()
-        
-        # Build a contextual prompt
-        history_context = ""
-        if previous_hints:
-            history_context = "Avoid repeating these previous hints: " + " | ".join(previous_hints)
+        wait = min(float(request.args.get('wait', 0)), LEARNING_LONG_POLL_MAX)
+    except ValueError:
+        wait = 0
+
+    mode = request.args.get('mode', session.get('mode', 'random'))
+    if mode == 'daily':
+        game = _ensure_daily_game(request.args.get('category', session.get('category', 'Technology')))
+        category, word, learning_info = game['category'], game['word'], game.get('learning')
+    else:
+        if 'word' not in session:
+            return jsonify({"error": "Game not started"}), 400
+        category, word = session.get('category', 'Technology'), session['word']
+        learning_info = _ensure_session_learning_info(category, word)
+
+    response = {"mode": mode, "category": category}
+    # A session changed above (e.g. a daily game just created) is saved when
+    # this request ends, so only wait with nothing to save.
+    if not learning_info and wait > 0 and not session.modified:
+        if _LEARNING_POLL_SLOTS.acquire(blocking=False):
+            try:
+                learning_info = request_learning_info(_lookup_word_entry(category, word), category, wait=wait)
+            finally:
+                _LEARNING_POLL_SLOTS.release()
+        else:
+            response["retry_after"] = LEARNING_POLL_RETRY_AFTER
+
+    return jsonify({**response, "learning": learning_info, "learning_pending": not learning_info})
+
+
+def _sse(event, data):
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
 
-        prompt = f"""CRITICAL: You must give a hint about the EXACT word "{word}". Do not confuse it with other words.
+def _sse_response(events):
+    return Response(
+        events,
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
+
+
+@app.route('/api/learning/stream', methods=['GET'])
+def stream_learning():
+    """Server-sent events variant of /api/learning.
+
+    While Claude is still writing, ``partial`` events carry the definition and
+    fun fact parsed so far; a final ``learning`` event has the complete info
+    (``learning_pending`` stays true if generation outlived the stream).
+    """
+    mode = request.args.get('mode', session.get('mode', 'random'))
+    if mode == 'daily':
+        game = _ensure_daily_game(request.args.get('category', session.get('category', 'Technology')))
+        category, word, learning_info = game['category'], game['word'], game.get('learning')
+    else:
+        if 'word' not in session:
+            return jsonify({"error": "Game not started"}), 400
+        category, word = session.get('category', 'Technology'), session['word']
+        learning_info = _ensure_session_learning_info(category, word)
+
+    payload = {"mode": mode, "category": category}
+    if learning_info:
+        return _sse_response([_sse('learning', {**payload, "learning": learning_info, "learning_pending": False})])
+
+    entry = _lookup_word_entry(category, word)
+    future, stream = _learning_job_for(word, category)
+
+    def events():
+        text, sent = "", {}
+        for delta in stream.iter(timeout=LEARNING_STREAM_TIMEOUT):
+            text += delta
+            fields = _parse_learning_fields(text)
+            if fields and fields != sent:
+                sent = fields
+                yield _sse('partial', {**payload, "learning": fields})
+
+        try:
+            # The job closes its stream just before its future resolves
+            info = _compose_learning_info(entry, category, future.result(timeout=1))
+        except FuturesTimeoutError:
+            info = None
+        yield _sse('learning', {**payload, "learning": info, "learning_pending": not info})
+
+    return _sse_response(events())
+
+
+def _ai_hint_request(word, category, masked_word, previous_hints):
+    # Build a contextual prompt
+    history_context = ""
+    if previous_hints:
+        recent = previous_hints[-AI_HINT_PROMPT_HISTORY:]
+        history_context = "Avoid repeating these previous hints: " + " | ".join(recent)
+
+    prompt = f"""CRITICAL: You must give a hint about the EXACT word "{word}". Do not confuse it with other words.
 
 THE WORD IS: {word}
 Category: {category}
@@ -839,35 +1528,384 @@ Current progress: {masked_word}
 Provide a factually accurate hint that uniquely describes "{word}" and ONLY "{word}". 
 If the word is "{word}", your hint must be specifically about "{word}".
 Maximum 12 words. Start directly with the hint - no preambles. Make this hint different from any previous ones."""
-        
-        hint = client.generate_text(
-            prompt=prompt,
-            max_tokens=80,
-            temperature=0.7,  # Increased temperature for more variety
-            system=f"CRITICAL INSTRUCTION: Give a hint specifically and exclusively about the word '{word}'. Double-check your hint is about '{word}' and not any other word. Be factually accurate. No preambles. Provide a unique perspective compared to previous hints."
+
+    return dict(
+        prompt=prompt,
+        max_tokens=80,
+        temperature=0.7,  # Increased temperature for more variety
+        system=f"CRITICAL INSTRUCTION: Give a hint specifically and exclusively about the word '{word}'. Double-check your hint is about '{word}' and not any other word. Be factually accurate. No preambles. Provide a unique perspective compared to previous hints.",
+        deadline=AI_HINT_DEADLINE,
+    )
+
+
+def _generate_ai_hint_text(word, category, masked_word, previous_hints):
+    return _claude_generate_text(**_ai_hint_request(word, category, masked_word, previous_hints))
+
+
+# Opt-in speculative hint generation: after a guess reveals letters, the next
+# AI hint is generated in the background (AI_HINT_PREFETCH=1 or prefetch_hints
+# in the start request), limited to AI_HINT_PREFETCH_BUDGET prefetches per
+# player every AI_HINT_PREFETCH_WINDOW seconds, however many games they start.
+HINT_PREFETCH_DEFAULT = os.getenv("AI_HINT_PREFETCH", "0").lower() in ("1", "true", "yes")
+HINT_PREFETCH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("AI_HINT_PREFETCH_WORKERS", 4)),
+    thread_name_prefix="hint-prefetch",
+)
+HINT_PREFETCHER = HintPrefetcher(
+    HINT_PREFETCH_EXECUTOR,
+    budget_per_player=int(os.getenv("AI_HINT_PREFETCH_BUDGET", 20)),
+    window=float(os.getenv("AI_HINT_PREFETCH_WINDOW", 3600)),
+)
+HINT_PREFETCH_WAIT = 10  # seconds /api/ai-hint waits on a matching in-flight prefetch
+
+# Hints shared across players: keyed by word, category and how much of the word
+# is revealed, so everyone on the same daily word draws from the same few hints.
+HINT_POOL = HintPool(
+    max_keys=int(os.getenv("AI_HINT_POOL_KEYS", 20000)),
+    max_hints_per_key=int(os.getenv("AI_HINT_POOL_SIZE", 8)),
+)
+# A game remembers at least a full pool bucket of hints, so the pool never
+# serves it one twice; only the latest few go into the prompt.
+AI_HINT_HISTORY = max(5, HINT_POOL.max_hints_per_key)
+AI_HINT_PROMPT_HISTORY = 5
+
+
+def _hint_pool_key(word, category, masked_word):
+    return (word, category, reveal_bucket(masked_word))
+
+
+def _generate_pooled_hint(word, category, masked_word, previous_hints):
+    hint = _generate_ai_hint_text(word, category, masked_word, previous_hints)
+    HINT_POOL.add(_hint_pool_key(word, category, masked_word), hint)
+    return hint
+
+
+def _hint_state_key(masked_word, previous_hints):
+    return (masked_word, tuple(previous_hints))
+
+
+def _prefetch_next_hint(game_id, word, category, masked_word, previous_hints, game_over):
+    if game_over:
+        HINT_PREFETCHER.cancel(game_id)
+        return
+    if not session.get('hint_prefetch'):
+        return
+    previous_hints = list(previous_hints)
+    if HINT_POOL.has_unseen(_hint_pool_key(word, category, masked_word), previous_hints):
+        return  # the pool will serve the next hint without a call
+    if 'player_id' not in session:
+        session['player_id'] = secrets.token_hex(8)
+    HINT_PREFETCHER.schedule(
+        session['player_id'],
+        game_id,
+        _hint_state_key(masked_word, previous_hints),
+        lambda: _generate_pooled_hint(word, category, masked_word, previous_hints),
+    )
+
+
+def _ai_hint_game():
+    """Return the game AI hints apply to (daily state in daily mode), or None."""
+    if session.get('mode') == 'daily':
+        game = _get_daily_state().get(session.get('category', 'Technology'))
+        if not game or game.get('date') != _today_str():
+            return None
+        return game
+    if 'word' not in session:
+        return None
+    return {
+        'game_id': session.get('game_id'),
+        'word': session['word'],
+        'category': session.get('category', 'Unknown'),
+        'guesses': session.get('guesses', []),
+        'mask': session.get('mask'),
+        'hint': session.get('hint'),
+        'ai_hints_history': session.get('ai_hints_history', []),
+    }
+
+
+def _claude_outage(exc):
+    """True when a Claude error means the API is down or overloaded, not that the request was bad."""
+    return isinstance(exc, ClaudeUnavailableError) or exc.retryable
+
+
+def _fallback_hint(game):
+    """The word's built-in hint, served while Claude is unavailable."""
+    return game.get('hint') or _lookup_word_entry(game['category'], game['word']).get('hint')
+
+
+def _ready_ai_hint(game, masked_word, previous_hints):
+    """A hint that needs no new Claude call: pooled, or prefetched for this state."""
+    hint = HINT_POOL.pick(_hint_pool_key(game['word'], game['category'], masked_word), exclude=previous_hints)
+    if not hint and session.get('hint_prefetch') and game.get('game_id'):
+        hint = HINT_PREFETCHER.take(
+            game['game_id'], _hint_state_key(masked_word, previous_hints), timeout=HINT_PREFETCH_WAIT
         )
+    return hint
+
+
+def _record_ai_hint(state, category, hint):
+    """Append ``hint`` to the game's hint history in ``state``.
+
+    ``state`` is the session, or the freshly loaded session data when the hint
+    is recorded after the response went out (see stream_ai_hint).
+    """
+    if state.get('mode') == 'daily':
+        daily_state = dict(state.get('daily_state', {}))
+        game = daily_state.get(category)
+        if game:
+            history = (list(game.get('ai_hints_history', [])) + [hint])[-AI_HINT_HISTORY:]
+            daily_state[category] = {**game, 'ai_hints_history': history}
+            state['daily_state'] = daily_state
+    else:
+        state['ai_hints_history'] = (list(state.get('ai_hints_history', [])) + [hint])[-AI_HINT_HISTORY:]
+
+
+@app.route('/api/ai-hint', methods=['POST'])
+def generate_ai_hint():
+    """Generate a dynamic, engaging hint using Claude AI."""
+    game = _ai_hint_game()
+    if game is None:
+        return jsonify({'error': 'No game in progress'}), 400
+    
+    word = game['word']
+    category = game['category']
+    masked_word = _game_mask(game)['masked']
+    previous_hints = list(game.get('ai_hints_history', []))
+    
+    try:
+        hint = _ready_ai_hint(game, masked_word, previous_hints)
+        if not hint:
+            hint = _generate_pooled_hint(word, category, masked_word, previous_hints)
         
-        # Store hint in history
-        previous_hints.append(hint)
-        history_to_save = previous_hints[-5:]
-        
-        if session.get('mode') == 'daily':
-            daily_state = _get_daily_state()
-            if category in daily_state:
-                daily_state[category]['ai_hints_history'] = history_to_save
-                _set_daily_state(daily_state)
-        else:
-            session['ai_hints_history'] = history_to_save
+        _record_ai_hint(session, category, hint)
         
         return jsonify({'hint': hint, 'success': True})
         
-    except ClaudeClientError as e:
-        return jsonify({'error': f'AI hint generation failed: {str(e)}', 'success': False}), 500
-    except ValueError as e:
+    except Exception as e:
+        return _ai_hint_error(game, e)
+
+
+def _ai_hint_error(game, exc):
+    """Response for a failed AI hint: the built-in hint while Claude is down, else an error."""
+    if isinstance(exc, ClaudeClientError):
+        if not _claude_outage(exc):
+            return jsonify({'error': f'AI hint generation failed: {str(exc)}', 'success': False}), 500
+        hint = _fallback_hint(game)
+        if hint:
+            return jsonify({'hint': hint, 'success': True, 'fallback': True})
+        return jsonify({'error': f'AI hints are temporarily unavailable: {str(exc)}', 'success': False}), 503
+    if isinstance(exc, ValueError):
         return jsonify({'error': 'Claude API not configured', 'success': False}), 503
+    return jsonify({'error': f'Unexpected error: {str(exc)}', 'success': False}), 500
+
+
+async def ai_hint_async(environ):
+    """/api/ai-hint for the ASGI entry point (asgi.py); returns a finished Flask response.
+
+    Behaves like generate_ai_hint, but waits for Claude (or a prefetch) on the
+    event loop through AsyncClaudeClient, so a hint in flight holds no thread.
+    The session is read before the call and updated in a second, short
+    request context after it, so guesses made meanwhile are kept.
+    """
+    started = time.perf_counter()
+    with app.request_context(environ):
+        game = _ai_hint_game()
+        if game is None:
+            return _finish_async_response(started, (jsonify({'error': 'No game in progress'}), 400))
+        word = game['word']
+        category = game['category']
+        masked_word = _game_mask(game)['masked']
+        previous_hints = list(game.get('ai_hints_history', []))
+        hint = HINT_POOL.pick(_hint_pool_key(word, category, masked_word), exclude=previous_hints)
+        prefetch = session.get('hint_prefetch') and game.get('game_id')
+
+    try:
+        if not hint and prefetch:
+            hint = await HINT_PREFETCHER.take_async(
+                game['game_id'], _hint_state_key(masked_word, previous_hints), timeout=HINT_PREFETCH_WAIT
+            )
+        if not hint:
+            request_kwargs = _ai_hint_request(word, category, masked_word, previous_hints)
+            hint = await get_shared_async_client().generate_text(**request_kwargs)
+            HINT_POOL.add(_hint_pool_key(word, category, masked_word), hint)
     except Exception as e:
-        return jsonify({'error': f'Unexpected error: {str(e)}', 'success': False}), 500
+        with app.request_context(environ):
+            return _finish_async_response(started, _ai_hint_error(game, e))
+
+    with app.request_context(environ):
+        _record_ai_hint(session, category, hint)
+        return _finish_async_response(started, jsonify({'hint': hint, 'success': True}))
+
+
+def _finish_async_response(started, rv):
+    # What full_dispatch_request does after the view: after_request hooks
+    # (latency metrics) and saving the session
+    g.request_started = started
+    return app.process_response(app.make_response(rv))
+
+
+@app.route('/api/ai-hint/stream', methods=['POST'])
+def stream_ai_hint():
+    """Server-sent events variant of /api/ai-hint.
+
+    Sends ``delta`` events with the hint text as Claude writes it, then a
+    ``done`` event carrying the whole hint (or an ``error`` event).
+    """
+    game = _ai_hint_game()
+    if game is None:
+        return jsonify({'error': 'No game in progress'}), 400
+
+    word = game['word']
+    category = game['category']
+    masked_word = _game_mask(game)['masked']
+    previous_hints = list(game.get('ai_hints_history', []))
+    # The hint history is written after the headers are sent, which only
+    # server-side sessions allow; cookie sessions get the hint in one piece.
+    can_stream = isinstance(app.session_interface, ServerSideSessionInterface)
+
+    try:
+        hint = _ready_ai_hint(game, masked_word, previous_hints)
+        if not hint and not can_stream:
+            hint = _generate_pooled_hint(word, category, masked_word, previous_hints)
+        deltas = None if hint else _claude_stream_text(
+            **_ai_hint_request(word, category, masked_word, previous_hints)
+        )
+    except ClaudeClientError as e:
+        if not _claude_outage(e):
+            return jsonify({'error': f'AI hint generation failed: {str(e)}', 'success': False}), 500
+        hint = _fallback_hint(game)
+        if not hint:
+            return jsonify({'error': f'AI hints are temporarily unavailable: {str(e)}', 'success': False}), 503
+        done = {'hint': hint, 'success': True, 'fallback': True}
+        return _sse_response([_sse('delta', {'text': hint}), _sse('done', done)])
+    except ValueError:
+        return jsonify({'error': 'Claude API not configured', 'success': False}), 503
+
+    if hint:
+        _record_ai_hint(session, category, hint)
+        return _sse_response([_sse('delta', {'text': hint}), _sse('done', {'hint': hint, 'success': True})])
+
+    def events():
+        parts = []
+        try:
+            for delta in deltas:
+                parts.append(delta)
+                yield _sse('delta', {'text': delta})
+        except ClaudeClientError as e:
+            # Before any delta (circuit open, retries spent) the built-in hint can stand in
+            hint = _fallback_hint(game) if _claude_outage(e) and not parts else None
+            if hint:
+                yield _sse('delta', {'text': hint})
+                yield _sse('done', {'hint': hint, 'success': True, 'fallback': True})
+            elif _claude_outage(e):
+                yield _sse('error', {'error': f'AI hints are temporarily unavailable: {str(e)}', 'success': False})
+            else:
+                yield _sse('error', {'error': f'AI hint generation failed: {str(e)}', 'success': False})
+            return
+        except Exception as e:
+            yield _sse('error', {'error': f'Unexpected error: {str(e)}', 'success': False})
+            return
+
+        hint = "".join(parts).strip()
+        HINT_POOL.add(_hint_pool_key(word, category, masked_word), hint)
+        # Other requests (guesses) may have changed the session while Claude was
+        # writing, so the history is appended to the stored copy, not this snapshot.
+        app.session_interface.update(app, session, lambda data: _record_ai_hint(data, category, hint))
+        yield _sse('done', {'hint': hint, 'success': True})
+
+    return _sse_response(stream_with_context(events()))
+
+
+def _cache_lookup_samples():
+    return {
+        ("learning", "hit"): LEARNING_CACHE.hits,
+        ("learning", "miss"): LEARNING_CACHE.misses,
+        ("hint_pool", "hit"): HINT_POOL.hits,
+        ("hint_pool", "miss"): HINT_POOL.misses,
+        ("hint_prefetch", "hit"): HINT_PREFETCHER.hits,
+        ("hint_prefetch", "miss"): HINT_PREFETCHER.misses,
+    }
+
+
+METRICS.callback(
+    "cache_lookups_total", "Cache lookups by cache and result", _cache_lookup_samples, labelnames=("cache", "result")
+)
+
+
+# With several worker processes (scripts/serve.py sets METRICS_DIR), each one
+# writes its samples there and /metrics serves the sum over all workers.
+METRICS_DIR = os.getenv("METRICS_DIR", "")
+METRICS_SHARE_INTERVAL = float(os.getenv("METRICS_SHARE_INTERVAL", 5))
+
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    text = METRICS.render_directory(METRICS_DIR) if METRICS_DIR else METRICS.render()
+    return Response(text, mimetype='text/plain; version=0.0.4')
+
+
+# Pre-fork servers (scripts/serve.py) import this module once in the master so
+# CATEGORIES and the word indexes are shared copy-on-write, then fork workers.
+# SQLite connections and threads must not cross the fork, so the master calls
+# prepare_for_fork() and every worker calls init_worker().
+PREFORK_SERVER = os.getenv("PREFORK_SERVER", "0").lower() in ("1", "true", "yes")
+DAILY_PRECOMPUTE = os.getenv("DAILY_PRECOMPUTE", "0").lower() in ("1", "true", "yes")
+
+
+def _sqlite_stores():
+    stores = [LEARNING_CACHE, DAILY_STORE, TOPIC_BANK]
+    if isinstance(app.session_interface, ServerSideSessionInterface):
+        stores.append(app.session_interface.backend)
+    return stores
+
+
+def prepare_for_fork():
+    """Close the master's SQLite connections before any worker is forked."""
+    for store in _sqlite_stores():
+        store.close()
+
+
+def _start_elected_daily_precompute():
+    """Run the precompute scheduler in exactly one worker: the one holding a lock file.
+
+    Every worker waits for the lock on a daemon thread, so when the holder
+    exits (reload, crash, max-requests) another worker takes over.
+    """
+    try:
+        import fcntl
+    except ImportError:  # no fork() either, so this is the only process
+        start_daily_precompute_scheduler()
+        return
+
+    def wait_for_lock():
+        lock_path = DAILY_STORE.path.with_name(DAILY_STORE.path.name + ".precompute.lock")
+        with open(lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)  # released when this process exits
+            _daily_precompute_loop(threading.Event())
+
+    threading.Thread(target=wait_for_lock, name="daily-precompute", daemon=True).start()
+
+
+def init_worker():
+    """Per-worker setup after fork: fresh SQLite connections and background threads."""
+    for store in _sqlite_stores():
+        store.reopen()
+    if METRICS_DIR:
+        METRICS.share(METRICS_DIR, interval=METRICS_SHARE_INTERVAL)
+    if DAILY_PRECOMPUTE:
+        _start_elected_daily_precompute()
+    if CURRICULUM_RELOAD_INTERVAL > 0:
+        start_curriculum_watcher()
+
+
+if DAILY_PRECOMPUTE and not PREFORK_SERVER:
+    start_daily_precompute_scheduler()
 
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5050, use_reloader=True)
+    # Development server only; use scripts/serve.py (gunicorn) in production.
+    debug = os.getenv("FLASK_DEBUG", "0").lower() in ("1", "true", "yes")
+    # With the reloader, code changes restart the child; it still watches the word data
+    if CURRICULUM_RELOAD_INTERVAL > 0 and (not debug or os.environ.get("WERKZEUG_RUN_MAIN") == "true"):
+        start_curriculum_watcher()
+    app.run(debug=debug, host=os.getenv("HOST", "0.0.0.0"), port=int(os.getenv("PORT", 5050)), use_reloader=debug)
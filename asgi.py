@@ -0,0 +1,161 @@
+"""ASGI entry point: AI hints on an event loop, every other route through Flask.
+
+    # from the hangman directory (pip install uvicorn, or any ASGI server)
+    uvicorn asgi:app --workers 4 --port 5050
+
+``POST /api/ai-hint`` is served by ``app.ai_hint_async``, which awaits Claude
+through ``AsyncClaudeClient``: a hint waiting on the API costs a coroutine and
+a pooled connection (``CLAUDE_ASYNC_MAX_CONNECTIONS``), not a thread, so a
+few workers can keep hundreds of hint requests in flight. Everything else is
+the unchanged WSGI app, run on a thread pool of ``ASGI_WSGI_THREADS``
+(default 32) threads. Streamed responses are passed on chunk by chunk.
+
+Each worker process calls ``app.init_worker()`` on lifespan startup, as the
+gunicorn workers of ``scripts.serve`` do after forking.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+Scope = Dict[str, Any]
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+
+# Routes answered on the event loop: (method, path) -> coroutine taking a WSGI environ
+ASYNC_ROUTES = {("POST", "/api/ai-hint"): "ai_hint_async"}
+
+
+class HangmanASGI:
+    """ASGI application wrapping the Flask app."""
+
+    def __init__(self, threads: int = 32) -> None:
+        import app as application
+
+        self.application = application
+        self._executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="asgi-wsgi")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return  # no websockets
+        environ = _environ(scope, await _read_body(receive))
+        handler = ASYNC_ROUTES.get((scope["method"], scope["path"]))
+        if handler is not None:
+            response = await getattr(self.application, handler)(environ)
+            await send(_response_start(response.status_code, response.headers.items()))
+            await send({"type": "http.response.body", "body": response.get_data(), "more_body": False})
+        else:
+            await self._call_wsgi(environ, send)
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        from services.claude_client import close_shared_async_client
+
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                self.application.init_worker()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await close_shared_async_client()
+                self._executor.shutdown(wait=False)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _call_wsgi(self, environ: Dict[str, Any], send: Send) -> None:
+        loop = asyncio.get_running_loop()
+        started: List[Tuple[str, List[Tuple[str, str]]]] = []
+
+        def start_response(status: str, headers: List[Tuple[str, str]], exc_info: Any = None) -> Callable[[bytes], None]:
+            started[:] = [(status, headers)]
+            return _no_write
+
+        body = await loop.run_in_executor(
+            self._executor, lambda: iter(self.application.app(environ, start_response))
+        )
+        try:
+            # Flask calls start_response before returning its body iterable
+            chunk = await loop.run_in_executor(self._executor, next, body, None)
+            status, headers = started[0]
+            await send(_response_start(int(status.split(" ", 1)[0]), headers))
+            while chunk is not None:
+                if chunk:
+                    await send({"type": "http.response.body", "body": chunk, "more_body": True})
+                chunk = await loop.run_in_executor(self._executor, next, body, None)
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        finally:
+            close = getattr(body, "close", None)
+            if close is not None:
+                await loop.run_in_executor(self._executor, close)
+
+
+def _no_write(data: bytes) -> None:
+    raise NotImplementedError("the WSGI write() callable is not supported")
+
+
+async def _read_body(receive: Receive) -> bytes:
+    chunks = []
+    while True:
+        message = await receive()
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body"):
+            return b"".join(chunks)
+
+
+def _environ(scope: Scope, body: bytes) -> Dict[str, Any]:
+    """PEP 3333 environ for an ASGI HTTP scope."""
+
+    server = scope.get("server") or ("localhost", 80)
+    client = scope.get("client") or ("", 0)
+    environ: Dict[str, Any] = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": scope.get("root_path", "").encode("utf-8").decode("latin-1"),
+        "PATH_INFO": scope["path"].encode("utf-8").decode("latin-1"),
+        "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+        "SERVER_NAME": server[0],
+        "SERVER_PORT": str(server[1]),
+        "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+        "REMOTE_ADDR": client[0],
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": BytesIO(body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+    }
+    for raw_name, raw_value in scope.get("headers", []):
+        name = raw_name.decode("latin-1").upper().replace("-", "_")
+        value = raw_value.decode("latin-1")
+        if name == "CONTENT_LENGTH":
+            continue
+        key = name if name == "CONTENT_TYPE" else f"HTTP_{name}"
+        if key in environ:
+            value = f"{environ[key]}{'; ' if key == 'HTTP_COOKIE' else ','}{value}"
+        environ[key] = value
+    return environ
+
+
+def _response_start(status: int, headers: Iterable[Tuple[str, str]]) -> Dict[str, Any]:
+    return {
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in headers],
+    }
+
+
+def create_app(threads: Optional[int] = None) -> HangmanASGI:
+    """Import the application and wrap it for an ASGI server."""
+
+    return HangmanASGI(threads or int(os.getenv("ASGI_WSGI_THREADS", 32)))
+
+
+app = create_app()
@@ -0,0 +1,72 @@
+"""Compile the word snapshot workers memory-map at startup.
+
+Importing the app compiles ``WORD_SNAPSHOT_PATH`` itself when it is missing or
+older than its sources (``data/curriculum_words.json``,
+``data/learning_content.json``, the built-in categories and the difficulty
+word lengths), and running workers use this script to recompile it when
+those change (``CURRICULUM_RELOAD_INTERVAL``). It compiles straight from
+``services.word_sources`` without importing the app, so it starts none of the
+app's stores or background threads. Run it as a deploy/build step so no
+worker pays for the parse:
+
+    # from the hangman directory
+    python -m scripts.build_word_snapshot
+
+Optional flags::
+
+    python -m scripts.build_word_snapshot --force   # rebuild even if current
+
+Exits with status 2 when the sources cannot be parsed, 1 on other errors.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compile the memory-mapped word snapshot")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if the snapshot is current")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    started = time.perf_counter()
+    # Imported after load_dotenv so CURRICULUM_PATH from .env applies
+    from services.word_sources import BASE_DIR, CURRICULUM_PATH, LEARNING_CONTENT_PATH, build_snapshot
+    from services.word_store import open_snapshot
+
+    snapshot_path = os.getenv("WORD_SNAPSHOT_PATH", str(BASE_DIR / "instance" / "word_snapshot.bin"))
+    if not snapshot_path:
+        print("WORD_SNAPSHOT_PATH is empty; snapshots are disabled", file=sys.stderr)
+        return 1
+    try:
+        build_snapshot(snapshot_path, CURRICULUM_PATH, LEARNING_CONTENT_PATH, force=args.force)
+    except ValueError as exc:
+        print(f"Invalid word sources: {exc}", file=sys.stderr)
+        return 2
+    except OSError as exc:
+        print(f"Failed to compile word snapshot: {exc}", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - started
+
+    categories = open_snapshot(snapshot_path, None)
+    words = sum(len(category) for category in categories.values())
+    size = os.path.getsize(snapshot_path)
+    print(
+        f"{snapshot_path}: {size / 1024 / 1024:.1f} MiB, "
+        f"{len(categories)} categories, {words} words ({elapsed:.2f}s)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
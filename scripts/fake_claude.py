@@ -0,0 +1,235 @@
+"""Local stand-in for the Claude Messages API, for benchmarks and load tests.
+
+Answers ``POST /v1/messages`` with canned replies shaped like the ones the app
+asks for (hints, DEFINITION/FUN_FACT text, batched learning JSON, custom topic
+word lists), including ``stream: true`` server-sent events. Latency and error
+rates are configurable, and ``GET /stats`` reports how many calls it served.
+
+Usage::
+
+    # from the hangman directory
+    python -m scripts.fake_claude --port 8765 --latency-ms 400 --error-rate 0.02
+
+    # then point the app (or ClaudeClient(base_url=...)) at it
+    CLAUDE_API_KEY=fake CLAUDE_BASE_URL=http://127.0.0.1:8765 python app.py
+
+``scripts.load_test`` starts one in-process automatically.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import string
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class FakeClaudeState:
+    """Configuration and call counters shared by all handler threads."""
+
+    def __init__(
+        self,
+        *,
+        latency_ms: float = 300,
+        jitter_ms: float = 100,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        token_delay_ms: float = 15,
+    ) -> None:
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.token_delay_ms = token_delay_ms
+        self._lock = threading.Lock()
+        self.counts: Dict[str, int] = {}
+
+    def count(self, key: str) -> None:
+        with self._lock:
+            self.counts[key] = self.counts.get(key, 0) + 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.counts)
+
+    def delay(self) -> None:
+        jitter = random.uniform(-self.jitter_ms, self.jitter_ms)
+        time.sleep(max(0.0, self.latency_ms + jitter) / 1000)
+
+
+def _fake_word(min_len: int, max_len: int) -> str:
+    return "".join(random.choices(string.ascii_uppercase, k=random.randint(min_len, max_len)))
+
+
+def reply_for(prompt: str) -> Tuple[str, str]:
+    """Return ``(kind, text)`` imitating Claude's answer to one of the app's prompts."""
+
+    if "JSON array" in prompt:
+        words = re.findall(r'^\d+\. "([^"]+)"', prompt, re.M)
+        items = [
+            {"word": word, "definition": f"A made-up definition of {word}.", "fun_fact": f"{word} is benchmark data."}
+            for word in words
+        ]
+        return "learning_batch", json.dumps(items)
+    if "DEFINITION:" in prompt:
+        return "learning", "DEFINITION: A made-up definition for load testing.\n\nFUN_FACT: This fact came from a fake server."
+    if '"words"' in prompt:
+        match = re.search(r"between (\d+) and (\d+) characters", prompt)
+        min_len, max_len = (int(match.group(1)), int(match.group(2))) if match else (5, 10)
+        words = [{"word": _fake_word(min_len, max_len), "hint": "A benchmark word"} for _ in range(5)]
+        return "custom_words", json.dumps({"words": words})
+    return "hint", "It is a made-up hint that helps you guess this word."
+
+
+class FakeClaudeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "FakeClaudeServer"
+
+    def log_message(self, format: str, *args: Any) -> None:  # keep benchmark output readable
+        pass
+
+    def _send_json(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        if self.path == "/stats":
+            self._send_json(200, self.server.state.stats())
+        else:
+            self._send_json(404, {"error": {"message": "not found"}})
+
+    def do_POST(self) -> None:
+        state = self.server.state
+        payload = json.loads(self.rfile.read(int(self.headers.get("content-length", 0))) or b"{}")
+        if self.path != "/v1/messages":
+            self._send_json(404, {"error": {"type": "not_found_error", "message": "not found"}})
+            return
+
+        state.count("requests")
+        state.delay()
+        roll = random.random()
+        if roll < state.rate_limit_rate:
+            state.count("rate_limited")
+            self._send_json(
+                429, {"type": "error", "error": {"type": "rate_limit_error", "message": "Rate limited"}},
+                {"retry-after": "1"},
+            )
+            return
+        if roll < state.rate_limit_rate + state.error_rate:
+            state.count("errors")
+            self._send_json(529, {"type": "error", "error": {"type": "overloaded_error", "message": "Overloaded"}})
+            return
+
+        prompt = "".join(
+            message["content"] for message in payload.get("messages", []) if isinstance(message.get("content"), str)
+        )
+        kind, text = reply_for(prompt)
+        state.count(kind)
+        usage = {"input_tokens": len(prompt) // 4, "output_tokens": max(1, len(text) // 4)}
+
+        if payload.get("stream"):
+            state.count("streams")
+            self._stream(text, usage)
+            return
+        self._send_json(200, {
+            "id": "msg_fake",
+            "type": "message",
+            "role": "assistant",
+            "model": payload.get("model", "fake"),
+            "content": [{"type": "text", "text": text}],
+            "stop_reason": "end_turn",
+            "usage": usage,
+        })
+
+    def _stream(self, text: str, usage: Dict[str, int]) -> None:
+        self.send_response(200)
+        self.send_header("content-type", "text/event-stream")
+        self.send_header("connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        def send(event: str, data: Dict[str, Any]) -> None:
+            self.wfile.write(f"event: {event}\ndata: {json.dumps(data)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+
+        send("message_start", {"type": "message_start", "message": {"usage": {"input_tokens": usage["input_tokens"]}}})
+        send("content_block_start", {"type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}})
+        chunks: List[str] = re.findall(r"\S+\s*", text) or [text]
+        for chunk in chunks:
+            time.sleep(self.server.state.token_delay_ms / 1000)
+            send("content_block_delta", {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": chunk}})
+        send("content_block_stop", {"type": "content_block_stop", "index": 0})
+        send("message_delta", {"type": "message_delta", "delta": {"stop_reason": "end_turn"}, "usage": {"output_tokens": usage["output_tokens"]}})
+        send("message_stop", {"type": "message_stop"})
+
+
+class FakeClaudeServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], state: FakeClaudeState) -> None:
+        super().__init__(address, FakeClaudeHandler)
+        self.state = state
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def start_fake_claude(host: str = "127.0.0.1", port: int = 0, **options: Any) -> FakeClaudeServer:
+    """Start a server on a background thread (``port=0`` picks a free port)."""
+
+    server = FakeClaudeServer((host, port), FakeClaudeState(**options))
+    threading.Thread(target=server.serve_forever, name="fake-claude", daemon=True).start()
+    return server
+
+
+def add_fake_claude_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--latency-ms", type=float, default=300, help="Mean upstream latency (default: %(default)s)")
+    parser.add_argument("--jitter-ms", type=float, default=100, help="Uniform latency jitter (default: %(default)s)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of 529 overloaded replies")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Share of 429 replies with retry-after")
+    parser.add_argument("--token-delay-ms", type=float, default=15, help="Delay between streamed chunks")
+
+
+def fake_claude_options(args: argparse.Namespace) -> Dict[str, float]:
+    return {
+        "latency_ms": args.latency_ms,
+        "jitter_ms": args.jitter_ms,
+        "error_rate": args.error_rate,
+        "rate_limit_rate": args.rate_limit_rate,
+        "token_delay_ms": args.token_delay_ms,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run a fake Claude Messages API for benchmarks")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_fake_claude_args(parser)
+    args = parser.parse_args()
+
+    server = FakeClaudeServer((args.host, args.port), FakeClaudeState(**fake_claude_options(args)))
+    print(f"Fake Claude listening on {server.url} (stats at {server.url}/stats)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,292 @@
+"""Load driver: simulated players against the app, with a fake Claude upstream.
+
+Runs many concurrent players through complete random, daily and custom-topic
+games (start, guesses, AI hints, status checks) and reports per-endpoint
+latency percentiles plus how many upstream Claude calls the run caused.
+
+By default the app is served in-process on a free port with fresh SQLite files
+and pointed at an in-process ``scripts.fake_claude`` server, so the numbers
+only reflect this code:
+
+    # from the hangman directory
+    python -m scripts.load_test --players 50 --games 4
+
+Point it at a running deployment instead (upstream counts then come from
+``/metrics`` if the app exposes it):
+
+    python -m scripts.load_test --target http://127.0.0.1:5050 --players 20
+
+Use ``--max-p95-ms`` / ``--max-upstream-per-game`` / ``--max-error-rate`` to
+turn the run into a pass/fail check; the exit status is 2 when one is exceeded.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import math
+import os
+import random
+import re
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+
+from scripts.fake_claude import add_fake_claude_args, fake_claude_options, start_fake_claude
+
+LETTER_ORDER = "EATOINSRHLDCUMPFGYBWKVXZJQ"
+CUSTOM_TOPICS = ["Space Exploration", "Ocean Life", "Ancient Egypt", "Volcanoes", "Rainforest Animals"]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load-test the hangman app with simulated players")
+    parser.add_argument("--target", help="Base URL of a running app (default: serve it in-process)")
+    parser.add_argument("--players", type=int, default=20, help="Concurrent simulated players")
+    parser.add_argument("--games", type=int, default=3, help="Games per player")
+    parser.add_argument(
+        "--mix",
+        default="random=6,daily=3,custom=1",
+        help="Relative weights of game modes (default: %(default)s)",
+    )
+    parser.add_argument("--hint-rate", type=float, default=0.3, help="Chance per guess of asking for an AI hint")
+    parser.add_argument("--stream-rate", type=float, default=0.0, help="Share of AI hints requested via SSE")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--max-p95-ms", type=float, default=None, help="Fail if any endpoint's p95 exceeds this")
+    parser.add_argument("--max-upstream-per-game", type=float, default=None, help="Fail above this many Claude calls per game")
+    parser.add_argument("--max-error-rate", type=float, default=None, help="Fail above this share of 5xx responses")
+    add_fake_claude_args(parser)
+    return parser.parse_args()
+
+
+# ----------------------------------------------------------------------
+# Measurements
+# ----------------------------------------------------------------------
+class Recorder:
+    """Thread-safe latency samples and status counts per endpoint."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.samples: Dict[str, List[float]] = {}
+        self.server_errors: Dict[str, int] = {}
+        self.games = 0
+
+    def record(self, endpoint: str, seconds: float, status: int) -> None:
+        with self._lock:
+            self.samples.setdefault(endpoint, []).append(seconds)
+            if status >= 500:
+                self.server_errors[endpoint] = self.server_errors.get(endpoint, 0) + 1
+
+    def game_finished(self) -> None:
+        with self._lock:
+            self.games += 1
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile: the smallest value with ``pct`` percent of samples at or below it."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+# ----------------------------------------------------------------------
+# Simulated player
+# ----------------------------------------------------------------------
+class Player:
+    _categories: Optional[List[str]] = None  # shared by all players
+
+    def __init__(self, base_url: str, recorder: Recorder, args: argparse.Namespace, rng: random.Random) -> None:
+        self.base_url = base_url
+        self.recorder = recorder
+        self.args = args
+        self.rng = rng
+        self.http = requests.Session()
+
+    def call(self, method: str, endpoint: str, **kwargs: Any) -> Tuple[int, Any]:
+        started = time.perf_counter()
+        response = self.http.request(method, self.base_url + endpoint, timeout=120, **kwargs)
+        # Read the whole body so streamed responses are timed to their last byte
+        body = response.content
+        self.recorder.record(endpoint.split("?")[0], time.perf_counter() - started, response.status_code)
+        if response.headers.get("content-type", "").startswith("application/json"):
+            return response.status_code, response.json()
+        return response.status_code, body
+
+    def ask_hint(self) -> None:
+        if self.rng.random() < self.args.stream_rate:
+            self.call("POST", "/api/ai-hint/stream")
+        else:
+            self.call("POST", "/api/ai-hint")
+
+    def play(self, mode: str) -> None:
+        categories = self.categories()
+        if mode == "daily":
+            category = self.rng.choice(categories)
+            status, state = self.call("POST", "/api/daily/start", json={"category": category})
+            guess_endpoint, extra = "/api/daily/guess", {"category": category}
+        elif mode == "custom":
+            topic = self.rng.choice(CUSTOM_TOPICS)
+            status, state = self.call("POST", "/api/start", json={"category": "Custom", "custom_topic": topic})
+            guess_endpoint, extra = "/api/guess", {}
+        else:
+            category = self.rng.choice(categories)
+            difficulty = self.rng.choice(["easy", "medium", "hard"])
+            status, state = self.call("POST", "/api/start", json={"category": category, "difficulty": difficulty})
+            guess_endpoint, extra = "/api/guess", {}
+        if status != 200 or not isinstance(state, dict):
+            return
+
+        for letter in LETTER_ORDER:
+            if state.get("game_over"):
+                break
+            if letter in state.get("guesses", []):
+                continue
+            if self.rng.random() < self.args.hint_rate:
+                self.ask_hint()
+            if state.get("learning_pending") and self.rng.random() < 0.2:
+                self.call("GET", "/api/learning")
+            status, result = self.call("POST", guess_endpoint, json={"letter": letter, **extra})
+            if status != 200 or not isinstance(result, dict):
+                break
+            state = result
+
+        self.call("GET", "/api/daily/status" if mode == "daily" else "/api/status", params=extra or None)
+        self.recorder.game_finished()
+
+    def categories(self) -> List[str]:
+        if Player._categories is None:
+            _status, names = self.call("GET", "/api/categories")
+            Player._categories = list(names) if isinstance(names, list) and names else ["Technology"]
+        return Player._categories
+
+
+def parse_mix(spec: str) -> List[Tuple[str, float]]:
+    mix = []
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip() not in ("random", "daily", "custom"):
+            raise SystemExit(f"Unknown game mode in --mix: {name}")
+        mix.append((name.strip(), float(weight or 1)))
+    return mix
+
+
+def run_player(base_url: str, recorder: Recorder, args: argparse.Namespace, seed: int) -> None:
+    rng = random.Random(seed)
+    player = Player(base_url, recorder, args, rng)
+    modes, weights = zip(*parse_mix(args.mix))
+    for _ in range(args.games):
+        try:
+            player.play(rng.choices(modes, weights)[0])
+        except requests.RequestException as exc:
+            print(f"  player error: {exc}", file=sys.stderr)
+
+
+# ----------------------------------------------------------------------
+# Upstream accounting
+# ----------------------------------------------------------------------
+def upstream_calls(fake_url: Optional[str], target: str) -> Optional[int]:
+    """Claude calls so far: from the fake server if we own one, else the app's /metrics."""
+
+    try:
+        if fake_url:
+            return requests.get(f"{fake_url}/stats", timeout=5).json().get("requests", 0)
+        text = requests.get(f"{target}/metrics", timeout=5).text
+    except (requests.RequestException, ValueError):
+        return None
+    counts = re.findall(r"^claude_requests_total\{[^}]*\} ([0-9.e+]+)$", text, re.M)
+    return int(sum(float(count) for count in counts)) if counts else None
+
+
+def serve_app_in_process(args: argparse.Namespace) -> Tuple[str, str]:
+    """Start the fake Claude server and the app on free ports; return their URLs."""
+
+    fake = start_fake_claude(**fake_claude_options(args))
+    workdir = tempfile.mkdtemp(prefix="hangman-load-")
+    os.environ.update({
+        "CLAUDE_API_KEY": os.environ.get("CLAUDE_API_KEY") or "fake-key",
+        "CLAUDE_BASE_URL": fake.url,
+        "SESSION_DB_PATH": os.path.join(workdir, "sessions.sqlite3"),
+        "LEARNING_CACHE_PATH": os.path.join(workdir, "learning_cache.sqlite3"),
+        "DAILY_DB_PATH": os.path.join(workdir, "daily.sqlite3"),
+        "TOPIC_BANK_PATH": os.path.join(workdir, "topic_banks.sqlite3"),
+        "WORD_SNAPSHOT_PATH": os.path.join(workdir, "word_snapshot.bin"),
+        # The curriculum does not change during a run; no watcher thread
+        "CURRICULUM_RELOAD_INTERVAL": "0",
+    })
+
+    from werkzeug.serving import make_server
+
+    import app
+
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)  # no per-request access log
+
+    server = make_server("127.0.0.1", 0, app.app, threaded=True)
+    threading.Thread(target=server.serve_forever, name="app-server", daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}", fake.url
+
+
+def main() -> int:
+    args = parse_args()
+    seed = args.seed if args.seed is not None else random.randrange(1 << 30)
+
+    if args.target:
+        base_url, fake_url = args.target.rstrip("/"), None
+    else:
+        base_url, fake_url = serve_app_in_process(args)
+
+    recorder = Recorder()
+    upstream_before = upstream_calls(fake_url, base_url)
+    print(f"Running {args.players} players x {args.games} games against {base_url} (seed {seed})")
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, args.players)) as pool:
+        players = [pool.submit(run_player, base_url, recorder, args, seed + index) for index in range(args.players)]
+        for player in players:
+            player.result()  # a bug in the driver should fail the run, not vanish
+    elapsed = time.perf_counter() - started
+    upstream_after = upstream_calls(fake_url, base_url)
+
+    total_requests = sum(len(samples) for samples in recorder.samples.values())
+    total_errors = sum(recorder.server_errors.values())
+    print(f"\n{recorder.games} games, {total_requests} requests in {elapsed:.1f}s "
+          f"({total_requests / max(elapsed, 1e-9):.1f} req/s)\n")
+    print(f"{'endpoint':<24}{'count':>8}{'5xx':>6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    worst_p95 = 0.0
+    for endpoint, samples in sorted(recorder.samples.items()):
+        p50, p95, p99 = (percentile(samples, pct) * 1000 for pct in (50, 95, 99))
+        worst_p95 = max(worst_p95, p95)
+        print(f"{endpoint:<24}{len(samples):>8}{recorder.server_errors.get(endpoint, 0):>6}"
+              f"{p50:>10.1f}{p95:>10.1f}{p99:>10.1f}{max(samples) * 1000:>10.1f}")
+
+    upstream = None
+    if upstream_before is not None and upstream_after is not None:
+        upstream = upstream_after - upstream_before
+        print(f"\nUpstream Claude calls: {upstream} ({upstream / max(recorder.games, 1):.2f} per game)")
+        if fake_url:
+            stats = requests.get(f"{fake_url}/stats", timeout=5).json()
+            print("  by kind: " + ", ".join(f"{kind}={count}" for kind, count in sorted(stats.items())))
+    else:
+        print("\nUpstream Claude calls: unknown (no fake server and no /metrics)")
+
+    failures = []
+    if args.max_p95_ms is not None and worst_p95 > args.max_p95_ms:
+        failures.append(f"p95 {worst_p95:.1f}ms > {args.max_p95_ms}ms")
+    if args.max_upstream_per_game is not None and upstream is not None:
+        per_game = upstream / max(recorder.games, 1)
+        if per_game > args.max_upstream_per_game:
+            failures.append(f"{per_game:.2f} upstream calls per game > {args.max_upstream_per_game}")
+    if args.max_error_rate is not None and total_requests:
+        if total_errors / total_requests > args.max_error_rate:
+            failures.append(f"5xx rate {total_errors / total_requests:.3f} > {args.max_error_rate}")
+
+    for failure in failures:
+        print(f"❌ {failure}", file=sys.stderr)
+    return 2 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,108 @@
+"""Measure how much resident memory the loaded word data costs one worker.
+
+Writes a synthetic curriculum of ``--words`` words (with hints, definitions,
+fun facts and category metadata, like ``data/curriculum_words.json``), then
+imports the app in fresh subprocesses with and without it and reports the RSS
+difference - the memory every worker pays for CATEGORIES and its indexes:
+
+    # from the hangman directory
+    python -m scripts.measure_word_memory --words 100000 --categories 200
+
+Linux only (reads ``/proc/self/status``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import string
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict
+
+# Runs in the child: import the app, drop garbage, print resident memory in kB.
+PROBE = """
+import gc, re
+import app
+gc.collect()
+status = open("/proc/self/status").read()
+print(re.search(r"VmRSS:\\s+(\\d+)", status).group(1), sum(len(w) for w in app.CATEGORIES.values()))
+"""
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure per-worker RSS of the loaded word data")
+    parser.add_argument("--words", type=int, default=100_000)
+    parser.add_argument("--categories", type=int, default=200)
+    parser.add_argument("--runs", type=int, default=3, help="Take the median of this many imports")
+    parser.add_argument("--seed", type=int, default=7)
+    return parser.parse_args()
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join("".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))) for _ in range(words)).capitalize() + "."
+
+
+def synthetic_curriculum(words: int, categories: int, seed: int) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    per_category = max(1, words // max(1, categories))
+    payload: Dict[str, Any] = {"categories": []}
+    for number in range(categories):
+        payload["categories"].append({
+            "name": f"Synthetic {number:04d}",
+            "subject": rng.choice(["Science", "History", "Geography", "Language Arts", "Mathematics"]),
+            "grade_band": rng.choice(["K-2", "3-5", "6-8"]),
+            "standard": f"STD.{number % 40}.{number % 7}",
+            "description": _sentence(rng, 8),
+            "words": [
+                {
+                    "word": "".join(rng.choices(string.ascii_uppercase, k=rng.randint(3, 14))),
+                    "hint": _sentence(rng, 6),
+                    "definition": _sentence(rng, 12),
+                    "fun_fact": _sentence(rng, 14),
+                }
+                for _ in range(per_category)
+            ],
+        })
+    return payload
+
+
+def measure(curriculum: Path, runs: int) -> tuple:
+    env = dict(os.environ, CURRICULUM_PATH=str(curriculum), SESSION_BACKEND="memory")
+    with tempfile.TemporaryDirectory(prefix="hangman-mem-") as workdir:
+        env["LEARNING_CACHE_PATH"] = os.path.join(workdir, "learning.sqlite3")
+        env["DAILY_DB_PATH"] = os.path.join(workdir, "daily.sqlite3")
+        # The first import compiles the snapshot, the median one maps it
+        env["WORD_SNAPSHOT_PATH"] = os.path.join(workdir, "word_snapshot.bin")
+        samples = []
+        for _ in range(runs):
+            output = subprocess.run(
+                [sys.executable, "-c", PROBE], env=env, capture_output=True, text=True, check=True
+            ).stdout.split()
+            samples.append((int(output[-2]), int(output[-1])))
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def main() -> int:
+    args = parse_args()
+    with tempfile.TemporaryDirectory(prefix="hangman-words-") as tmp:
+        path = Path(tmp) / "curriculum_words.json"
+        path.write_text(json.dumps(synthetic_curriculum(args.words, args.categories, args.seed)), encoding="utf-8")
+
+        base_kb, base_words = measure(Path(tmp) / "missing.json", args.runs)
+        loaded_kb, loaded_words = measure(path, args.runs)
+
+    extra = loaded_kb - base_kb
+    print(f"app without curriculum: {base_kb / 1024:8.1f} MiB RSS ({base_words} words)")
+    print(f"app with curriculum:    {loaded_kb / 1024:8.1f} MiB RSS ({loaded_words} words)")
+    print(f"word data:              {extra / 1024:8.1f} MiB ({extra * 1024 / max(1, loaded_words - base_words):.0f} bytes/word)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
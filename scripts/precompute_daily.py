@@ -0,0 +1,65 @@
+"""Precompute daily challenges ahead of the day rollover.
+
+Works out the daily word for every category and generates its learning info,
+storing both in the day-keyed table read by ``/api/daily/*``. Run it from cron
+shortly before midnight (or set ``DAILY_PRECOMPUTE=1`` to let the app schedule
+it in-process).
+
+Usage::
+
+    # from the hangman directory; defaults to tomorrow
+    python -m scripts.precompute_daily
+
+Optional flags::
+
+    python -m scripts.precompute_daily --date 2026-01-05 --force
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from datetime import date, timedelta
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+import app
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Precompute daily challenges for a date")
+    parser.add_argument(
+        "--date",
+        default=(date.today() + timedelta(days=1)).isoformat(),
+        help="ISO date to precompute (default: tomorrow)",
+    )
+    parser.add_argument("--force", action="store_true", help="Recompute days that are already stored")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    try:
+        date.fromisoformat(args.date)
+    except ValueError:
+        print(f"❌ Invalid date: {args.date}", file=sys.stderr)
+        return 1
+
+    written = app.precompute_daily(args.date, force=args.force)
+    missing = [
+        category
+        for category in app.CATEGORIES
+        if not (app.DAILY_STORE.get(args.date, category) or {}).get("learning")
+    ]
+
+    print(f"✅ Stored {written} daily challenges for {args.date}")
+    if missing:
+        print(f"⚠️  Learning info still missing for: {', '.join(missing)}", file=sys.stderr)
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
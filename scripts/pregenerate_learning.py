@@ -0,0 +1,218 @@
+"""Pre-generate definitions and fun facts for every playable word.
+
+Walks every category in ``app.CATEGORIES`` (the built-in ``BASE_CATEGORIES``
+plus anything in ``data/curriculum_words.json``), asks Claude for the missing
+``definition``/``fun_fact`` fields and writes them to a curriculum-style JSON
+file that ``load_curriculum_categories()`` merges back in at startup. With the
+file in place, ``request_learning_info()`` never has to call Claude for a known
+word.
+
+Usage::
+
+    # from the hangman directory
+    python -m scripts.pregenerate_learning
+
+Optional flags::
+
+    python -m scripts.pregenerate_learning --concurrency 8 --retries 5
+    python -m scripts.pregenerate_learning --category Animals --force
+    python -m scripts.pregenerate_learning --batch-size 1   # one request per word
+
+Words are requested ``--batch-size`` at a time in a single Claude call; words
+a batch reply leaves out are requested individually. ``--retries`` sets the
+Claude client's attempts per request (its backoff honours ``retry-after``).
+
+Progress is appended to a checkpoint file after every word, so an interrupted
+run picks up where it left off when started again.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Only the word tables and the Claude client are needed; keep the server's
+# stores and background jobs out of this process.
+os.environ["SESSION_BACKEND"] = "memory"
+os.environ["DAILY_PRECOMPUTE"] = "0"
+for _store in ("LEARNING_CACHE_PATH", "DAILY_DB_PATH", "TOPIC_BANK_PATH"):
+    os.environ[_store] = ":memory:"
+
+import app
+
+WordKey = Tuple[str, str]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Pre-generate learning content for all categories")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=app.LEARNING_CONTENT_PATH,
+        help="Curriculum-style JSON file to write (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        default=None,
+        help="Progress file used to resume interrupted runs (default: <output>.checkpoint.jsonl)",
+    )
+    parser.add_argument("--concurrency", type=int, default=4, help="Parallel Claude requests")
+    parser.add_argument("--retries", type=int, default=3, help="Claude client attempts per request")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=app.LEARNING_BATCH_SIZE,
+        help="Words per Claude request (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--category",
+        action="append",
+        dest="categories",
+        help="Only process this category (repeatable)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate words that already have a definition and fun fact",
+    )
+    return parser.parse_args()
+
+
+def load_checkpoint(path: Path) -> Dict[WordKey, Dict[str, str]]:
+    done: Dict[WordKey, Dict[str, str]] = {}
+    if not path.exists():
+        return done
+    for line in path.read_text(encoding="utf-8").splitlines():
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            # A partially written last line from a killed run; just redo that word.
+            continue
+        done[(record["category"], record["word"])] = {
+            "definition": record["definition"],
+            "fun_fact": record["fun_fact"],
+        }
+    return done
+
+
+def collect_pending(args: argparse.Namespace, done: Dict[WordKey, Dict[str, str]]) -> List[WordKey]:
+    pending: List[WordKey] = []
+    for category, words in app.CATEGORIES.items():
+        if args.categories and category not in args.categories:
+            continue
+        for entry in words:
+            key = (category, entry["word"])
+            if key in done:
+                continue
+            if not args.force and entry.get("definition") and entry.get("fun_fact"):
+                continue
+            pending.append(key)
+    return pending
+
+
+def generate_batch(batch: List[WordKey]) -> Dict[WordKey, Dict[str, str]]:
+    """Generate a batch in one request; words it misses fall back to single-word requests."""
+
+    if len(batch) == 1:
+        category, word = batch[0]
+        return {batch[0]: app._request_learning_info_from_ai(word, category)}
+
+    contents = app._request_learning_batch_from_ai([(word, category) for category, word in batch])
+    results: Dict[WordKey, Dict[str, str]] = {}
+    for (category, word), content in zip(batch, contents):
+        if content is None:
+            try:
+                content = app._request_learning_info_from_ai(word, category)
+            except Exception as exc:
+                print(f"❌ {category}/{word}: {exc}", file=sys.stderr)
+                continue
+        results[(category, word)] = content
+    return results
+
+
+def write_output(path: Path, done: Dict[WordKey, Dict[str, str]]) -> int:
+    by_category: Dict[str, List[Dict[str, str]]] = {}
+    for category, words in app.CATEGORIES.items():
+        for entry in words:
+            key = (category, entry["word"])
+            fields = done.get(key)
+            if fields is None and entry.get("definition") and entry.get("fun_fact"):
+                fields = {"definition": entry["definition"], "fun_fact": entry["fun_fact"]}
+            if fields:
+                by_category.setdefault(category, []).append({"word": entry["word"], **fields})
+
+    payload = {
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "prompt_version": app.LEARNING_PROMPT_VERSION,
+        "categories": [{"name": name, "words": words} for name, words in by_category.items()],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    tmp_path.replace(path)
+    return sum(len(words) for words in by_category.values())
+
+
+def main() -> int:
+    args = parse_args()
+    # The shared client is built on first use; retries happen there, not here
+    os.environ["CLAUDE_MAX_ATTEMPTS"] = str(max(1, args.retries))
+    checkpoint_path = args.checkpoint or args.output.with_suffix(".checkpoint.jsonl")
+
+    done = load_checkpoint(checkpoint_path)
+    pending = collect_pending(args, done)
+    print(f"{len(pending)} words to generate ({len(done)} already checkpointed)")
+
+    failures: List[WordKey] = []
+    checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with checkpoint_path.open("a", encoding="utf-8") as checkpoint, ThreadPoolExecutor(
+        max_workers=max(1, args.concurrency)
+    ) as pool:
+        batch_size = max(1, args.batch_size)
+        futures = {}
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
+            futures[pool.submit(generate_batch, batch)] = batch
+        for future in as_completed(futures):
+            batch = futures[future]
+            try:
+                results = future.result()
+            except Exception as exc:
+                print(f"❌ batch of {len(batch)} ({batch[0][0]}/{batch[0][1]}, ...): {exc}", file=sys.stderr)
+                results = {}
+
+            for category, word in batch:
+                content = results.get((category, word))
+                if content is None:
+                    failures.append((category, word))
+                    continue
+                done[(category, word)] = content
+                checkpoint.write(json.dumps({"category": category, "word": word, **content}) + "\n")
+                print(f"✅ {category}/{word}")
+            checkpoint.flush()
+
+    written = write_output(args.output, done)
+    print(f"Wrote {written} entries to {args.output}")
+
+    if failures:
+        print(f"{len(failures)} words failed; re-run to retry them.", file=sys.stderr)
+        return 2
+
+    checkpoint_path.unlink(missing_ok=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,163 @@
+"""Production launcher: gunicorn with preloaded, copy-on-write shared word data.
+
+The app is imported once in the gunicorn master, which builds CATEGORIES and
+the word indexes with the garbage collector off, freezes them out of its
+reach, and then forks the workers (which turn it back on). The word data pages stay shared between workers instead of
+being copied into each one, and throughput scales with the worker count rather
+than being capped by one interpreter:
+
+    # from the hangman directory
+    python -m scripts.serve --workers 4 --threads 8 --bind 0.0.0.0:5050
+
+Every setting can also come from the environment (``WEB_CONCURRENCY``,
+``WEB_THREADS``, ``BIND``, ``WEB_TIMEOUT``, ``WEB_GRACEFUL_TIMEOUT``).
+
+Graceful reloads use the usual gunicorn signals on the master process (see
+``--pid``):
+
+- ``kill -HUP <pid>`` starts fresh workers and lets the old ones finish their
+  in-flight requests. The preloaded code and word data are kept.
+- To deploy new code, send ``kill -USR2 <pid>`` to start a new master and its
+  workers next to the old ones, then ``kill -TERM <old pid>`` once it is up.
+
+Workers share state only through SQLite (sessions, learning cache, daily
+challenges, topic banks), so ``SESSION_BACKEND=memory`` is rejected when there is more than
+one worker. Metrics are shared through files in ``METRICS_DIR`` (a fresh
+temporary directory unless set): each worker writes its samples there every
+``METRICS_SHARE_INTERVAL`` seconds, and ``/metrics`` on any worker returns
+the totals for all of them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import multiprocessing
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict
+
+try:
+    from gunicorn.app.base import BaseApplication
+except ImportError:  # pragma: no cover - gunicorn is POSIX-only
+    BaseApplication = None
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Serve the hangman app with gunicorn")
+    parser.add_argument("--bind", default=os.getenv("BIND", f"0.0.0.0:{os.getenv('PORT', 5050)}"))
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count())),
+        help="Worker processes (default: WEB_CONCURRENCY or the CPU count)",
+    )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=int(os.getenv("WEB_THREADS", 8)),
+        help="Threads per worker; SSE streams and long polls each hold one (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=int,
+        default=int(os.getenv("WEB_TIMEOUT", 60)),
+        help="Seconds before a silent worker is restarted (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--graceful-timeout",
+        type=int,
+        default=int(os.getenv("WEB_GRACEFUL_TIMEOUT", 30)),
+        help="Seconds workers get to finish requests on reload/shutdown (default: %(default)s)",
+    )
+    parser.add_argument("--max-requests", type=int, default=0, help="Recycle a worker after this many requests (0 = never)")
+    parser.add_argument("--pid", default=None, help="Write the master's pid to this file")
+    parser.add_argument("--access-log", action="store_true", help="Log every request to stdout")
+    return parser.parse_args()
+
+
+def _prepare_metrics_dir() -> None:
+    """Give the workers an empty directory to share metrics through."""
+
+    directory = os.getenv("METRICS_DIR")
+    if not directory:
+        os.environ["METRICS_DIR"] = tempfile.mkdtemp(prefix="hangman-metrics-")
+        return
+    Path(directory).mkdir(parents=True, exist_ok=True)
+    # Samples from a previous run would otherwise be added to this one's
+    for path in Path(directory).glob("*.json"):
+        path.unlink()
+
+
+def _post_fork(server: Any, worker: Any) -> None:
+    import app
+
+    gc.enable()
+    app.init_worker()
+
+
+if BaseApplication is not None:
+
+    class HangmanApplication(BaseApplication):
+        """gunicorn application that preloads ``wsgi.app`` in the master."""
+
+        def __init__(self, options: Dict[str, Any]) -> None:
+            self.options = options
+            super().__init__()
+
+        def load_config(self) -> None:
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+
+        def load(self) -> Any:
+            from wsgi import create_app
+
+            import app
+
+            application = create_app()
+            app.prepare_for_fork()
+            # Move everything built so far into the permanent generation, so
+            # collections in the workers never write to (and un-share) those pages.
+            # One explicit collection first, so import-time garbage isn't frozen too.
+            gc.collect()
+            gc.freeze()
+            return application
+
+
+def main() -> int:
+    args = parse_args()
+    if BaseApplication is None:
+        print("scripts.serve needs gunicorn (pip install gunicorn); use `python app.py` for development", file=sys.stderr)
+        return 1
+    if args.workers > 1 and os.getenv("SESSION_BACKEND", "sqlite") == "memory":
+        print("SESSION_BACKEND=memory is process-local; use sqlite with more than one worker", file=sys.stderr)
+        return 1
+
+    # Tells app.py not to start background threads in the master.
+    os.environ["PREFORK_SERVER"] = "1"
+    # No collections in the master: they would only touch (and un-share) the
+    # pages the workers inherit. Workers re-enable gc in post_fork.
+    gc.disable()
+    _prepare_metrics_dir()
+    options = {
+        "bind": args.bind,
+        "workers": max(1, args.workers),
+        "threads": max(1, args.threads),
+        "worker_class": "gthread",
+        "timeout": args.timeout,
+        "graceful_timeout": args.graceful_timeout,
+        "max_requests": args.max_requests,
+        "max_requests_jitter": args.max_requests // 10,
+        "preload_app": True,
+        "post_fork": _post_fork,
+        "pidfile": args.pid,
+        "accesslog": "-" if args.access_log else None,
+    }
+    HangmanApplication(options).run()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
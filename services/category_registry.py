@@ -0,0 +1,90 @@
+"""Bounded registry for categories created at runtime (AI custom topics).
+
+Curriculum categories are loaded once at startup; categories generated for a
+player's custom topic appear while the app is running. The registry gives
+those the same structures curriculum categories get - per-difficulty word
+bands and an O(1) word lookup - while capping memory with LRU eviction:
+
+    from services.category_registry import CategoryRegistry
+
+    registry = CategoryRegistry(band_builder=_difficulty_bands, max_categories=200)
+    registry.register("AI: 80s Movies", words, {"subject": "Custom AI Topic"})
+    category = registry.get("AI: 80s Movies")   # None once evicted
+    category.bands["easy"]
+    category.by_word["GHOSTBUSTERS"]
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+WordEntry = Dict[str, Any]
+
+
+class RuntimeCategory:
+    """Immutable snapshot of one runtime category and its indexes."""
+
+    __slots__ = ("name", "words", "bands", "by_word", "metadata", "version")
+
+    def __init__(
+        self,
+        name: str,
+        words: Tuple[WordEntry, ...],
+        bands: Dict[str, Tuple[WordEntry, ...]],
+        metadata: Dict[str, Any],
+        version: int = 0,
+    ) -> None:
+        self.name = name
+        self.version = version
+        self.words = words
+        self.bands = bands
+        self.by_word = {}
+        for entry in words:
+            self.by_word.setdefault(entry["word"], entry)
+        self.metadata = metadata
+
+
+class CategoryRegistry:
+    """Thread-safe LRU of ``RuntimeCategory`` objects keyed by category name."""
+
+    def __init__(
+        self,
+        *,
+        band_builder: Callable[[Iterable[WordEntry]], Dict[str, Tuple[WordEntry, ...]]],
+        max_categories: int = 200,
+    ) -> None:
+        self._band_builder = band_builder
+        self.max_categories = max_categories
+        self._categories: "OrderedDict[str, RuntimeCategory]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def register(
+        self,
+        name: str,
+        words: Iterable[WordEntry],
+        metadata: Optional[Dict[str, Any]] = None,
+        version: int = 0,
+    ) -> RuntimeCategory:
+        """Add or replace a category; indexes are built outside the lock.
+
+        ``version`` identifies the source data (e.g. a topic bank's version) so
+        callers can tell when a registered snapshot is out of date.
+        """
+
+        words = tuple(words)
+        category = RuntimeCategory(name, words, self._band_builder(words), dict(metadata or {}), version)
+        with self._lock:
+            self._categories[name] = category
+            self._categories.move_to_end(name)
+            while len(self._categories) > self.max_categories:
+                self._categories.popitem(last=False)
+        return category
+
+    def get(self, name: str) -> Optional[RuntimeCategory]:
+        with self._lock:
+            category = self._categories.get(name)
+            if category is not None:
+                self._categories.move_to_end(name)
+            return category
@@ -15,22 +15,178 @@ script in the repo. Example usage:
 The class pulls the API key from the ``CLAUDE_API_KEY`` environment variable by
 default, but you can also pass a key explicitly when instantiating it. The
 module does not depend on Flask and can be reused across projects.
+
+Long-running processes should share one client (and therefore one pool of
+keep-alive connections) instead of building a new one per call:
+
+    from services.claude_client import get_shared_client
+
+    text = get_shared_client().generate_text(prompt="...")
+    print(get_shared_client().pool_stats())
+
+Every call goes through a retry loop (jittered backoff that honours
+``retry-after`` on 429/5xx), a circuit breaker that fails fast with
+``ClaudeUnavailableError`` while the API is unhealthy, and an optional token
+bucket rate limiter. ``deadline=`` caps the total time a single call may take:
+
+    text = get_shared_client().generate_text(prompt="...", deadline=8)
+
+``ClaudeClient.stream_text`` takes the same arguments and yields the reply as
+it is generated, for callers that want to show the first words early:
+
+    for delta in get_shared_client().stream_text(prompt="..."):
+        print(delta, end="", flush=True)
+
+``AsyncClaudeClient`` offers the same calls as coroutines on ``httpx`` (an
+optional dependency), so an event loop can keep hundreds of calls in flight
+over a bounded connection pool without a thread per call:
+
+    from services.claude_client import get_shared_async_client
+
+    text = await get_shared_async_client().generate_text(prompt="...", deadline=8)
 """
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import json
 import os
-from typing import Any, Dict, Iterable, List, Optional
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple, TypeVar
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:  # Only needed for AsyncClaudeClient
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+from services.metrics import REGISTRY
+from services.resilience import CircuitBreaker, RetryPolicy, TokenBucket, parse_retry_after
+
+T = TypeVar("T")
+
+CLAUDE_REQUESTS = REGISTRY.counter(
+    "claude_requests_total", "Claude API requests by outcome (ok, http_error, api_error, network_error, cancelled)", ("outcome",)
+)
+CLAUDE_LATENCY = REGISTRY.histogram(
+    "claude_request_duration_seconds", "Claude API request latency (whole reply)", ("stream",)
+)
+CLAUDE_FIRST_TOKEN = REGISTRY.histogram(
+    "claude_first_token_seconds", "Time until the first streamed text delta arrives"
+)
+CLAUDE_TOKENS = REGISTRY.counter("claude_tokens_total", "Tokens reported by the Claude API", ("kind",))
+CLAUDE_RETRIES = REGISTRY.counter("claude_retries_total", "Claude API attempts that were retried")
+CLAUDE_REJECTED = REGISTRY.counter(
+    "claude_rejected_total", "Claude calls refused without a request (circuit_open, rate_limited, deadline)", ("reason",)
+)
+
+# 408/429 and server-side failures are worth another attempt; other 4xx are not.
+RETRYABLE_STATUSES = frozenset({408, 429, 500, 502, 503, 504, 529})
+
+
+def _observe_claude_call(started: float, outcome: str, usage: Optional[Dict[str, Any]], stream: bool = False) -> None:
+    CLAUDE_LATENCY.observe(time.perf_counter() - started, stream="true" if stream else "false")
+    CLAUDE_REQUESTS.inc(outcome=outcome)
+    for kind in ("input_tokens", "output_tokens"):
+        count = (usage or {}).get(kind)
+        if isinstance(count, int) and count:
+            CLAUDE_TOKENS.inc(count, kind=kind.replace("_tokens", ""))
 
 
 class ClaudeClientError(RuntimeError):
     """Raised when the Claude API returns an error payload."""
 
+    retryable = False
+    retry_after: Optional[float] = None
 
-class ClaudeClient:
-    """Lightweight helper for calling Anthropic's Claude Messages API."""
+
+class ClaudeHTTPError(ClaudeClientError):
+    """Non-2xx response; 429 and 5xx are retryable."""
+
+    def __init__(self, message: str, status_code: int, retry_after: Optional[float] = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+        self.retryable = status_code in RETRYABLE_STATUSES
+
+
+class ClaudeConnectionError(ClaudeClientError):
+    """The request never got a response (connection error or timeout)."""
+
+    retryable = True
+
+
+class ClaudeUnavailableError(ClaudeClientError):
+    """Raised without calling the API: circuit open, rate limit backlog or deadline spent."""
+
+
+class SingleFlight:
+    """Collapse concurrent calls with the same key into one execution.
+
+    The first caller for a key runs ``fn``; everyone who arrives while it is
+    still running blocks and receives the same result (or exception). A
+    follower waits at most ``timeout`` seconds, then gets
+    ``concurrent.futures.TimeoutError`` while the leader carries on.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, "Future[Any]"] = {}
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T], timeout: Optional[float] = None) -> T:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            return future.result(timeout=timeout)
+
+        try:
+            result = fn()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+
+class AsyncSingleFlight:
+    """``SingleFlight`` for coroutines running on one event loop."""
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, "asyncio.Task[Any]"] = {}
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[T]], timeout: Optional[float] = None) -> T:
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._calls[key] = task
+            task.add_done_callback(lambda _task: self._calls.pop(key, None))
+        else:
+            self.coalesced += 1
+        # Shielded, so a waiter that gives up or is cancelled leaves the shared request running
+        return await asyncio.wait_for(asyncio.shield(task), timeout)
+
+
+class _ClaudeClientBase:
+    """Configuration, payloads and the retry/breaker/rate-limit gate shared by both clients."""
 
     DEFAULT_BASE_URL = "https://api.anthropic.com"
     DEFAULT_MODEL = "claude-3-haiku-20240307"
@@ -38,12 +194,14 @@ class ClaudeClient:
 
     def __init__(
         self,
-        api_key: Optional[str] = None,
+        api_key: Optional[str],
         *,
-        model: str = DEFAULT_MODEL,
-        base_url: str = DEFAULT_BASE_URL,
-        request_timeout: int = 30,
-        session: Optional[requests.Session] = None,
+        model: str,
+        base_url: str,
+        request_timeout: float,
+        retry: Optional[RetryPolicy],
+        breaker: Optional[CircuitBreaker],
+        rate_limiter: Optional[TokenBucket],
     ) -> None:
         self.api_key = api_key or os.getenv("CLAUDE_API_KEY")
         if not self.api_key:
@@ -54,15 +212,188 @@ class ClaudeClient:
         self.model = model
         self.base_url = base_url.rstrip("/")
         self.request_timeout = request_timeout
-        self._session = session or requests.Session()
-        self._session.headers.update(
-            {
-                "x-api-key": self.api_key,
-                "anthropic-version": self.API_VERSION,
-                "content-type": "application/json",
-            }
+        self.retry = retry or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+        self.rate_limiter = rate_limiter
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _default_headers(self) -> Dict[str, str]:
+        return {
+            "x-api-key": self.api_key,
+            "anthropic-version": self.API_VERSION,
+            "content-type": "application/json",
+            "connection": "keep-alive",
+        }
+
+    def _build_payload(
+        self,
+        *,
+        messages: List[Dict[str, Any]],
+        system: Optional[str],
+        max_tokens: int,
+        temperature: float,
+        metadata: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "messages": messages,
+            "temperature": temperature,
+        }
+        if system:
+            payload["system"] = system
+        if metadata:
+            payload["metadata"] = metadata
+        return payload
+
+    def _admit(self, deadline_at: Optional[float]) -> Tuple[float, float]:
+        """Gate one attempt; return ``(seconds to wait first, attempt timeout)``.
+
+        Raises ``ClaudeUnavailableError`` when the deadline is spent, the rate
+        limiter backlog exceeds it, or the circuit is open.
+        """
+
+        remaining = None if deadline_at is None else deadline_at - time.monotonic()
+        if remaining is not None and remaining <= 0:
+            CLAUDE_REJECTED.inc(reason="deadline")
+            raise ClaudeUnavailableError("Claude call deadline exceeded")
+
+        wait = 0.0
+        if self.rate_limiter is not None:
+            reserved = self.rate_limiter.reserve(max_wait=remaining)
+            if reserved is None:
+                CLAUDE_REJECTED.inc(reason="rate_limited")
+                raise ClaudeUnavailableError("Claude rate limit backlog exceeds the call deadline")
+            wait = reserved
+
+        if not self.breaker.allow():
+            CLAUDE_REJECTED.inc(reason="circuit_open")
+            raise ClaudeUnavailableError("Claude API temporarily unavailable (circuit open)")
+
+        timeout = self.request_timeout if remaining is None else min(self.request_timeout, remaining - wait)
+        return wait, max(0.1, timeout)
+
+    def _backoff(self, exc: ClaudeClientError, attempt: int, deadline_at: Optional[float]) -> float:
+        """Record failed attempt ``attempt``; return the delay before retrying or re-raise ``exc``."""
+
+        if exc.retryable:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()  # the API answered; the request was just bad
+        if not exc.retryable or attempt + 1 >= self.retry.max_attempts:
+            raise exc
+        delay = self.retry.delay(attempt, exc.retry_after)
+        # Retrying sooner than retry-after would only be refused again
+        limit = self.retry.max_retry_after if deadline_at is None else deadline_at - time.monotonic()
+        if delay >= limit:
+            raise exc
+        CLAUDE_RETRIES.inc()
+        return delay
+
+    def _http_error(self, status_code: int, reason: str, body: Any, headers: Any) -> ClaudeHTTPError:
+        return ClaudeHTTPError(
+            f"HTTP {status_code}: {self._error_message(body, reason)}",
+            status_code,
+            parse_retry_after(headers.get("retry-after")),
         )
 
+    @staticmethod
+    def _reply_json(started: float, parse: Callable[[], Any]) -> Dict[str, Any]:
+        """Decode a 2xx reply body and record the call; anything but a JSON object is an error."""
+
+        try:
+            data = parse()
+        except ValueError:
+            data = None
+        if not isinstance(data, dict):
+            # A proxy's HTML error page, a truncated body: not something to retry or parse
+            _observe_claude_call(started, "api_error", None)
+            raise ClaudeClientError("Invalid JSON from Claude")
+        _observe_claude_call(started, "api_error" if "error" in data else "ok", data.get("usage"))
+        return data
+
+    @staticmethod
+    def _flight_key(payload: Dict[str, Any]) -> str:
+        # model, system, prompt and sampling params all live in the payload
+        return json.dumps(payload, sort_keys=True, separators=(",", ":"))
+
+    @staticmethod
+    def _error_message(response_json: Any, fallback: str) -> str:
+        try:
+            return response_json.get("error", {}).get("message", fallback)
+        except AttributeError:
+            return fallback
+
+    @staticmethod
+    def _check_error_payload(data: Dict[str, Any]) -> Dict[str, Any]:
+        if "error" in data:
+            raise ClaudeClientError(data["error"].get("message", "Claude API error"))
+        return data
+
+    @staticmethod
+    def _stream_text_delta(event: Dict[str, Any]) -> Optional[str]:
+        """Return the text carried by one streaming event, raising on ``error`` events."""
+
+        if event.get("type") == "error":
+            raise ClaudeClientError(event.get("error", {}).get("message", "Claude API stream error"))
+        if event.get("type") == "content_block_delta":
+            delta = event.get("delta", {})
+            if delta.get("type") == "text_delta":
+                return delta.get("text") or None
+        return None
+
+    @staticmethod
+    def _join_response_text(data: Dict[str, Any]) -> str:
+        parts: List[str] = []
+        for block in data.get("content", []):
+            if block.get("type") == "text" and block.get("text"):
+                parts.append(block["text"])
+        return "".join(parts).strip()
+
+
+
+class ClaudeClient(_ClaudeClientBase):
+    """Lightweight helper for calling Anthropic's Claude Messages API."""
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        *,
+        model: str = _ClaudeClientBase.DEFAULT_MODEL,
+        base_url: str = _ClaudeClientBase.DEFAULT_BASE_URL,
+        request_timeout: int = 30,
+        session: Optional[requests.Session] = None,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        coalesce: bool = False,
+        retry: Optional[RetryPolicy] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+    ) -> None:
+        super().__init__(
+            api_key,
+            model=model,
+            base_url=base_url,
+            request_timeout=request_timeout,
+            retry=retry,
+            breaker=breaker,
+            rate_limiter=rate_limiter,
+        )
+        # With coalesce=True identical concurrent generate_text calls share one request.
+        self._single_flight = SingleFlight() if coalesce else None
+        if session is None:
+            session = requests.Session()
+            # One host, so a single pool; pool_maxsize caps concurrent keep-alive
+            # connections and pool_block makes callers wait for a free one
+            # instead of opening throwaway extra connections.
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, pool_block=pool_block)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self._session = session
+        self._session.headers.update(self._default_headers())
+
     # ------------------------------------------------------------------
     # Public helpers
     # ------------------------------------------------------------------
@@ -74,8 +405,49 @@ class ClaudeClient:
         max_tokens: int = 400,
         temperature: float = 0.5,
         metadata: Optional[Dict[str, Any]] = None,
+        deadline: Optional[float] = None,
     ) -> str:
-        """Return the combined text output from Claude for a single prompt."""
+        """Return the combined text output from Claude for a single prompt.
+
+        ``deadline`` bounds the whole call, retries and rate-limit waits included.
+        """
+
+        payload = self._build_payload(
+            messages=[{"role": "user", "content": prompt}],
+            system=system,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            metadata=metadata,
+        )
+        if self._single_flight is None:
+            return self._join_response_text(self._post_json("/v1/messages", payload, deadline))
+        try:
+            # The leader's deadline may be longer than ours; don't wait past our own
+            return self._single_flight.do(
+                self._flight_key(payload),
+                lambda: self._join_response_text(self._post_json("/v1/messages", payload, deadline)),
+                timeout=deadline,
+            )
+        except FutureTimeoutError:
+            CLAUDE_REJECTED.inc(reason="deadline")
+            raise ClaudeUnavailableError("Claude call deadline exceeded") from None
+
+    def stream_text(
+        self,
+        *,
+        prompt: str,
+        system: Optional[str] = None,
+        max_tokens: int = 400,
+        temperature: float = 0.5,
+        metadata: Optional[Dict[str, Any]] = None,
+        deadline: Optional[float] = None,
+    ) -> Iterator[str]:
+        """Yield text deltas as Claude produces them (Messages API with ``stream``).
+
+        Joining the deltas gives the same text ``generate_text`` would return,
+        minus the final ``strip()``. Streams are never coalesced, and only the
+        connection attempt is retried (``deadline`` bounds that part).
+        """
 
         payload = self._build_payload(
             messages=[{"role": "user", "content": prompt}],
@@ -84,8 +456,13 @@ class ClaudeClient:
             temperature=temperature,
             metadata=metadata,
         )
-        data = self._post_json("/v1/messages", payload)
-        return self._join_response_text(data)
+        payload["stream"] = True
+        for event in self._post_stream("/v1/messages", payload, deadline):
+            if event.get("type") == "message_stop":
+                return
+            text = self._stream_text_delta(event)
+            if text:
+                yield text
 
     def chat(
         self,
@@ -95,6 +472,7 @@ class ClaudeClient:
         max_tokens: int = 600,
         temperature: float = 0.3,
         metadata: Optional[Dict[str, Any]] = None,
+        deadline: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Send an arbitrary list of message dicts and return the raw response."""
 
@@ -105,7 +483,7 @@ class ClaudeClient:
             temperature=temperature,
             metadata=metadata,
         )
-        return self._post_json("/v1/messages", payload)
+        return self._post_json("/v1/messages", payload, deadline)
 
     def generate_structured_json(
         self,
@@ -116,6 +494,7 @@ class ClaudeClient:
         max_tokens: int = 800,
         temperature: float = 0,
         metadata: Optional[Dict[str, Any]] = None,
+        deadline: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Ask Claude for JSON that matches ``response_schema``."""
 
@@ -128,10 +507,39 @@ class ClaudeClient:
         )
         payload["response_format"] = {"type": "json_schema", "json_schema": response_schema}
 
-        data = self._post_json("/v1/messages", payload)
+        data = self._post_json("/v1/messages", payload, deadline)
         text = self._join_response_text(data)
         return json_loads_safely(text)
 
+    # ------------------------------------------------------------------
+    # Connection pool metrics
+    # ------------------------------------------------------------------
+    def pool_stats(self) -> Dict[str, int]:
+        """Return request/connection counters for the underlying HTTP pools.
+
+        ``new_connections`` counts TCP+TLS handshakes; ``reused_connections`` is
+        the number of requests that were served over an already-open connection.
+        """
+
+        requests_sent = 0
+        new_connections = 0
+        for adapter in set(self._session.adapters.values()):
+            poolmanager = getattr(adapter, "poolmanager", None)
+            if poolmanager is None:
+                continue
+            for key in list(poolmanager.pools.keys()):
+                pool = poolmanager.pools.get(key)
+                if pool is None:
+                    continue
+                requests_sent += pool.num_requests
+                new_connections += pool.num_connections
+        return {
+            "requests": requests_sent,
+            "new_connections": new_connections,
+            "reused_connections": max(0, requests_sent - new_connections),
+            "coalesced_requests": self._single_flight.coalesced if self._single_flight else 0,
+        }
+
     # ------------------------------------------------------------------
     # Resource management
     # ------------------------------------------------------------------
@@ -147,51 +555,391 @@ class ClaudeClient:
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
-    def _build_payload(
+    def _with_retries(self, attempt: Callable[[float], T], deadline: Optional[float]) -> T:
+        """Run ``attempt(timeout)`` under the rate limiter, circuit breaker and retry policy."""
+
+        deadline_at = None if deadline is None else time.monotonic() + deadline
+        number = 0
+        while True:
+            wait, timeout = self._admit(deadline_at)
+            if wait:
+                time.sleep(wait)
+            try:
+                result = attempt(timeout)
+            except ClaudeClientError as exc:
+                time.sleep(self._backoff(exc, number, deadline_at))
+                number += 1
+                continue
+            except Exception:
+                self.breaker.record_failure()
+                raise
+            self.breaker.record_success()
+            return result
+
+    def _send(self, url: str, payload: Dict[str, Any], timeout: float, stream: bool = False) -> requests.Response:
+        started = time.perf_counter()
+        try:
+            response = self._session.post(url, json=payload, timeout=timeout, stream=stream)
+        except requests.exceptions.RequestException as exc:
+            _observe_claude_call(started, "network_error", None, stream=stream)
+            raise ClaudeConnectionError(f"Request to Claude failed: {exc}") from exc
+        if not response.ok:
+            _observe_claude_call(started, "http_error", None, stream=stream)
+            try:
+                body = response.json()
+            except ValueError:
+                body = None
+            response.close()
+            raise self._http_error(response.status_code, response.reason or "", body, response.headers)
+        return response
+
+    def _post_json(self, path: str, payload: Dict[str, Any], deadline: Optional[float] = None) -> Dict[str, Any]:
+        url = f"{self.base_url}{path}"
+
+        def attempt(timeout: float) -> Dict[str, Any]:
+            started = time.perf_counter()
+            return self._reply_json(started, self._send(url, payload, timeout).json)
+
+        return self._check_error_payload(self._with_retries(attempt, deadline))
+
+    def _post_stream(
+        self, path: str, payload: Dict[str, Any], deadline: Optional[float] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """POST ``payload`` and yield the decoded ``data:`` payloads of the SSE reply."""
+
+        url = f"{self.base_url}{path}"
+        started = time.perf_counter()
+        # Only opening the stream is retried; once deltas flow a failure ends the stream.
+        response = self._with_retries(lambda timeout: self._send(url, payload, timeout, stream=True), deadline)
+        outcome = "network_error"
+        usage: Dict[str, Any] = {}
+        first_token = True
+        try:
+            with response:
+                for line in self._iter_stream_lines(response):
+                    # Event names are repeated in each payload's "type", so only data lines matter.
+                    if not line or not line.startswith("data:"):
+                        continue
+                    try:
+                        event = json.loads(line[len("data:"):].strip())
+                    except ValueError:
+                        continue
+
+                    kind = event.get("type")
+                    if kind == "error":
+                        outcome = "api_error"
+                    elif kind in ("message_start", "message_delta"):
+                        usage.update((event.get("message") or event).get("usage") or {})
+                    elif kind == "content_block_delta" and first_token:
+                        first_token = False
+                        CLAUDE_FIRST_TOKEN.observe(time.perf_counter() - started)
+                    elif kind == "message_stop":
+                        outcome = "ok"
+                    yield event
+                if outcome == "network_error":
+                    outcome = "ok"  # stream ended cleanly without message_stop
+        except GeneratorExit:
+            if outcome == "network_error":
+                outcome = "cancelled"  # the consumer stopped reading
+            raise
+        finally:
+            _observe_claude_call(started, outcome, usage, stream=True)
+
+    @staticmethod
+    def _iter_stream_lines(response: requests.Response) -> Iterator[str]:
+        try:
+            yield from response.iter_lines(decode_unicode=True)
+        except requests.exceptions.RequestException as exc:
+            raise ClaudeConnectionError(f"Claude stream interrupted: {exc}") from exc
+
+
+class AsyncClaudeClient(_ClaudeClientBase):
+    """asyncio flavour of ``ClaudeClient`` built on ``httpx.AsyncClient``.
+
+    Each in-flight request costs a coroutine rather than a thread, and
+    ``max_connections`` bounds how many sockets are open to the API at once;
+    further requests queue for a free one. Must be used from a single event loop.
+    """
+
+    def __init__(
         self,
+        api_key: Optional[str] = None,
         *,
-        messages: List[Dict[str, Any]],
-        system: Optional[str],
-        max_tokens: int,
-        temperature: float,
-        metadata: Optional[Dict[str, Any]],
+        model: str = _ClaudeClientBase.DEFAULT_MODEL,
+        base_url: str = _ClaudeClientBase.DEFAULT_BASE_URL,
+        request_timeout: float = 30,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        coalesce: bool = False,
+        retry: Optional[RetryPolicy] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+    ) -> None:
+        if httpx is None:
+            raise RuntimeError("AsyncClaudeClient requires httpx (pip install httpx)")
+        super().__init__(
+            api_key,
+            model=model,
+            base_url=base_url,
+            request_timeout=request_timeout,
+            retry=retry,
+            breaker=breaker,
+            rate_limiter=rate_limiter,
+        )
+        self._single_flight = AsyncSingleFlight() if coalesce else None
+        self._client = httpx.AsyncClient(
+            headers=self._default_headers(),
+            timeout=request_timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+        )
+
+    # ------------------------------------------------------------------
+    # Public helpers
+    # ------------------------------------------------------------------
+    async def generate_text(
+        self,
+        *,
+        prompt: str,
+        system: Optional[str] = None,
+        max_tokens: int = 400,
+        temperature: float = 0.5,
+        metadata: Optional[Dict[str, Any]] = None,
+        deadline: Optional[float] = None,
+    ) -> str:
+        """Return the combined text output from Claude for a single prompt.
+
+        ``deadline`` bounds the whole call, retries and rate-limit waits included.
+        """
+
+        payload = self._build_payload(
+            messages=[{"role": "user", "content": prompt}],
+            system=system,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            metadata=metadata,
+        )
+        if self._single_flight is None:
+            return self._join_response_text(await self._post_json("/v1/messages", payload, deadline))
+
+        async def request() -> str:
+            return self._join_response_text(await self._post_json("/v1/messages", payload, deadline))
+
+        try:
+            return await self._single_flight.do(self._flight_key(payload), request, timeout=deadline)
+        except asyncio.TimeoutError:
+            CLAUDE_REJECTED.inc(reason="deadline")
+            raise ClaudeUnavailableError("Claude call deadline exceeded") from None
+
+    async def chat(
+        self,
+        messages: Iterable[Dict[str, Any]],
+        *,
+        system: Optional[str] = None,
+        max_tokens: int = 600,
+        temperature: float = 0.3,
+        metadata: Optional[Dict[str, Any]] = None,
+        deadline: Optional[float] = None,
     ) -> Dict[str, Any]:
-        payload: Dict[str, Any] = {
-            "model": self.model,
-            "max_tokens": max_tokens,
-            "messages": messages,
-            "temperature": temperature,
-        }
-        if system:
-            payload["system"] = system
-        if metadata:
-            payload["metadata"] = metadata
-        return payload
+        """Send an arbitrary list of message dicts and return the raw response."""
+
+        payload = self._build_payload(
+            messages=list(messages),
+            system=system,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            metadata=metadata,
+        )
+        return await self._post_json("/v1/messages", payload, deadline)
 
-    def _post_json(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    async def generate_structured_json(
+        self,
+        *,
+        prompt: str,
+        response_schema: Dict[str, Any],
+        system: Optional[str] = None,
+        max_tokens: int = 800,
+        temperature: float = 0,
+        metadata: Optional[Dict[str, Any]] = None,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Ask Claude for JSON that matches ``response_schema``."""
+
+        payload = self._build_payload(
+            messages=[{"role": "user", "content": prompt}],
+            system=system,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            metadata=metadata,
+        )
+        payload["response_format"] = {"type": "json_schema", "json_schema": response_schema}
+
+        data = await self._post_json("/v1/messages", payload, deadline)
+        text = self._join_response_text(data)
+        return json_loads_safely(text)
+
+    # ------------------------------------------------------------------
+    # Resource management
+    # ------------------------------------------------------------------
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncClaudeClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    async def _post_json(self, path: str, payload: Dict[str, Any], deadline: Optional[float] = None) -> Dict[str, Any]:
         url = f"{self.base_url}{path}"
-        response = self._session.post(url, json=payload, timeout=self.request_timeout)
+        deadline_at = None if deadline is None else time.monotonic() + deadline
+        number = 0
+        while True:
+            wait, timeout = self._admit(deadline_at)
+            if wait:
+                await asyncio.sleep(wait)
+            try:
+                data = await self._post_json_once(url, payload, timeout)
+            except ClaudeClientError as exc:
+                await asyncio.sleep(self._backoff(exc, number, deadline_at))
+                number += 1
+                continue
+            except Exception:
+                self.breaker.record_failure()
+                raise
+            self.breaker.record_success()
+            return self._check_error_payload(data)
+
+    async def _post_json_once(self, url: str, payload: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        started = time.perf_counter()
         try:
-            response.raise_for_status()
-        except requests.exceptions.HTTPError as e:
+            response = await self._client.post(url, json=payload, timeout=timeout)
+        except httpx.HTTPError as exc:
+            _observe_claude_call(started, "network_error", None)
+            raise ClaudeConnectionError(f"Request to Claude failed: {exc}") from exc
+        if response.is_error:
+            _observe_claude_call(started, "http_error", None)
             try:
-                error_data = response.json()
-                error_msg = error_data.get("error", {}).get("message", str(e))
-            except:
-                error_msg = str(e)
-            raise ClaudeClientError(f"HTTP {response.status_code}: {error_msg}") from e
-        data = response.json()
-        if "error" in data:
-            raise ClaudeClientError(data["error"].get("message", "Claude API error"))
-        return data
+                body = response.json()
+            except ValueError:
+                body = None
+            raise self._http_error(response.status_code, response.reason_phrase, body, response.headers)
+        return self._reply_json(started, response.json)
 
-    @staticmethod
-    def _join_response_text(data: Dict[str, Any]) -> str:
-        parts: List[str] = []
-        for block in data.get("content", []):
-            if block.get("type") == "text" and block.get("text"):
-                parts.append(block["text"])
-        return "".join(parts).strip()
+
+_shared_client: Optional[ClaudeClient] = None
+_shared_async_client: Optional[Tuple[asyncio.AbstractEventLoop, AsyncClaudeClient]] = None
+_shared_client_lock = threading.Lock()
+
+
+def get_shared_client() -> ClaudeClient:
+    """Return the process-wide client, creating it on first use.
+
+    The shared client coalesces identical in-flight prompts. Pool settings come from ``CLAUDE_POOL_MAXSIZE`` (default 20) and
+    ``CLAUDE_POOL_BLOCK`` (default on). Retries, the circuit breaker and the
+    optional rate limit are read from ``CLAUDE_MAX_ATTEMPTS`` (3),
+    ``CLAUDE_BREAKER_THRESHOLD`` (5 failures), ``CLAUDE_BREAKER_RESET`` (30s),
+    ``CLAUDE_RATE_LIMIT`` (requests/s, 0 = off) and ``CLAUDE_RATE_BURST``.
+    Raises ``ValueError`` like ``ClaudeClient()`` when no API key is configured.
+    """
+
+    global _shared_client
+    if _shared_client is not None:
+        return _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            rate = float(os.getenv("CLAUDE_RATE_LIMIT", 0))
+            _shared_client = ClaudeClient(
+                base_url=os.getenv("CLAUDE_BASE_URL", ClaudeClient.DEFAULT_BASE_URL),
+                pool_maxsize=int(os.getenv("CLAUDE_POOL_MAXSIZE", 20)),
+                pool_block=os.getenv("CLAUDE_POOL_BLOCK", "1").lower() not in ("0", "false", "no"),
+                coalesce=True,
+                retry=RetryPolicy(max_attempts=int(os.getenv("CLAUDE_MAX_ATTEMPTS", 3))),
+                breaker=CircuitBreaker(
+                    failure_threshold=int(os.getenv("CLAUDE_BREAKER_THRESHOLD", 5)),
+                    reset_timeout=float(os.getenv("CLAUDE_BREAKER_RESET", 30)),
+                ),
+                rate_limiter=TokenBucket(rate, float(os.getenv("CLAUDE_RATE_BURST", 0)) or None) if rate > 0 else None,
+            )
+        return _shared_client
+
+
+def close_shared_client() -> None:
+    """Close the process-wide client (it is recreated on next use)."""
+
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is not None:
+            _shared_client.close()
+            _shared_client = None
+
+
+def get_shared_async_client() -> AsyncClaudeClient:
+    """Return the shared ``AsyncClaudeClient`` of the running event loop.
+
+    Call it from a coroutine; the client is created on first use and belongs
+    to that loop. It shares the retry policy, circuit breaker and rate limiter
+    of ``get_shared_client()``, so both clients back off from the same outage.
+    ``CLAUDE_ASYNC_MAX_CONNECTIONS`` (default 100) caps its open sockets.
+    """
+
+    global _shared_async_client
+    loop = asyncio.get_running_loop()
+    with _shared_client_lock:
+        if _shared_async_client is not None and _shared_async_client[0] is loop:
+            return _shared_async_client[1]
+    sync_client = get_shared_client()
+    with _shared_client_lock:
+        if _shared_async_client is None or _shared_async_client[0] is not loop:
+            client = AsyncClaudeClient(
+                sync_client.api_key,
+                model=sync_client.model,
+                base_url=sync_client.base_url,
+                max_connections=int(os.getenv("CLAUDE_ASYNC_MAX_CONNECTIONS", 100)),
+                coalesce=True,
+                retry=sync_client.retry,
+                breaker=sync_client.breaker,
+                rate_limiter=sync_client.rate_limiter,
+            )
+            _shared_async_client = (loop, client)
+        return _shared_async_client[1]
+
+
+async def close_shared_async_client() -> None:
+    """Close the running loop's shared async client (it is recreated on next use)."""
+
+    global _shared_async_client
+    with _shared_client_lock:
+        shared, _shared_async_client = _shared_async_client, None
+    if shared is not None and shared[0] is asyncio.get_running_loop():
+        await shared[1].aclose()
+
+
+def _pool_samples() -> Dict[Tuple[str, ...], float]:
+    client = _shared_client
+    stats = client.pool_stats() if client is not None else {}
+    return {
+        ("new",): stats.get("new_connections", 0),
+        ("reused",): stats.get("reused_connections", 0),
+        ("coalesced",): stats.get("coalesced_requests", 0),
+    }
+
+
+# pool_stats() of the shared client: TCP/TLS handshakes vs. requests on a kept-alive
+# connection, and identical prompts that shared another caller's request
+REGISTRY.callback(
+    "claude_pool_requests_total",
+    "Claude calls by connection use (new, reused, coalesced)",
+    _pool_samples,
+    labelnames=("connection",),
+)
+
+atexit.register(close_shared_client)
 
 
 def json_loads_safely(payload: str) -> Dict[str, Any]:
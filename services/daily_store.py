@@ -0,0 +1,103 @@
+"""Day-keyed store of precomputed daily challenges.
+
+The daily word for a category is a pure function of the date, so it (and its
+learning info) can be worked out before anyone asks for it. A scheduled job
+writes tomorrow's entries into this table shortly before midnight and the
+daily endpoints simply read them back:
+
+    from services.daily_store import DailyStore
+
+    store = DailyStore("instance/daily.sqlite3")
+    store.put("2026-01-05", "Animals", {"word": "OTTER", "hint": "...", "learning": {...}})
+    store.get("2026-01-05", "Animals")
+
+Parsed records are kept in memory and reused while the row's ``created_at``
+is unchanged, so a record rewritten by another worker process (a pinned
+word, learning info filled in later) is picked up on the next ``get``.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+
+class DailyStore:
+    """SQLite table of ``(day, category) -> daily challenge record``."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._memory: Dict[tuple, Tuple[float, Dict[str, Any]]] = {}
+
+        self._conn = self._connect()
+
+    def get(self, day: str, category: str) -> Optional[Dict[str, Any]]:
+        key = (day, category)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT created_at FROM daily_challenges WHERE day = ? AND category = ?", key
+            ).fetchone()
+            if row is None:
+                self._memory.pop(key, None)
+                return None
+            cached = self._memory.get(key)
+            if cached is not None and cached[0] == row[0]:
+                return cached[1]
+            row = self._conn.execute(
+                "SELECT created_at, payload FROM daily_challenges WHERE day = ? AND category = ?", key
+            ).fetchone()
+            if row is None:
+                self._memory.pop(key, None)
+                return None
+            record = json.loads(row[1])
+            self._memory[key] = (row[0], record)
+            return record
+
+    def put(self, day: str, category: str, record: Dict[str, Any]) -> None:
+        created_at = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO daily_challenges (day, category, payload, created_at)"
+                " VALUES (?, ?, ?, ?)",
+                (day, category, json.dumps(record), created_at),
+            )
+            self._memory[(day, category)] = (created_at, record)
+
+    def prune(self, before_day: str) -> None:
+        """Drop every record for days earlier than ``before_day`` (ISO dates sort lexically)."""
+
+        with self._lock:
+            self._conn.execute("DELETE FROM daily_challenges WHERE day < ?", (before_day,))
+            self._memory = {key: value for key, value in self._memory.items() if key[0] >= before_day}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def reopen(self) -> None:
+        """Replace the connection, e.g. in a worker process after ``fork()``."""
+
+        with self._lock:
+            self._conn = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS daily_challenges (
+                day TEXT NOT NULL,
+                category TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (day, category)
+            )
+            """
+        )
+        return conn
@@ -0,0 +1,107 @@
+"""Versioned change tracking for compact ("delta") game responses.
+
+Guess and status responses normally repeat the whole game: learning info,
+hint, every guess and the masked word, although one letter changed. A game
+instead carries a small JSON-serialisable change log, and a client that opts
+in sends back the ``state`` token it last saw to get only what changed since:
+
+    from services.game_delta import record_change, respond
+
+    changes = record_change(game.get("changes"), "mask", guess=True)
+    respond(full_response, game["game_id"], changes, since="3f9a1c:4")
+    # {"mode": "random", "masked_word": "_ A _", "guesses_added": ["A"], "state": "3f9a1c:5", "delta": True}
+
+A change log holds ``version`` (bumped on every change), ``fields`` (tracked
+field -> version it last changed at) and ``guesses`` (the version each guess
+was made at, for the newest guesses). Response keys that no tracked field
+covers - hint, category, difficulty - never change during a game, so they
+are only in full responses.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Sequence
+
+Changes = Dict[str, Any]
+
+# Response key -> tracked field whose changes it follows
+RESPONSE_FIELDS = {
+    "masked_word": "mask",
+    "attempts_left": "attempts",
+    "game_over": "outcome",
+    "win": "outcome",
+    "word": "outcome",
+    "streak_current": "outcome",
+    "streak_best": "outcome",
+    "learning": "learning",
+    "learning_pending": "learning",
+}
+# Sent in every delta so clients can route it
+ALWAYS_SENT = ("mode",)
+
+
+def new_changes() -> Changes:
+    return {"version": 0, "fields": {}, "guesses": []}
+
+
+def record_change(changes: Optional[Changes], *fields: str, guess: bool = False) -> Changes:
+    """Return ``changes`` with a new version at which ``fields`` (and a guess) changed.
+
+    ``changes`` is not modified; None (a game saved before change tracking)
+    starts a fresh log.
+    """
+
+    changes = changes or new_changes()
+    version = changes["version"] + 1
+    return {
+        "version": version,
+        "fields": {**changes["fields"], **{field: version for field in fields}},
+        "guesses": changes["guesses"] + [version] if guess else changes["guesses"],
+    }
+
+
+def state_token(game_id: str, changes: Optional[Changes]) -> str:
+    return f"{game_id}:{(changes or new_changes())['version']}"
+
+
+def _known_version(since: Optional[str], game_id: str, changes: Changes) -> Optional[int]:
+    token_game, _, version = (since or "").rpartition(":")
+    if token_game != game_id or not version.isdigit() or int(version) > changes["version"]:
+        return None
+    return int(version)
+
+
+def _guesses_after(guesses: Sequence[str], versions: List[int], known: int) -> List[str]:
+    # Versions cover the newest guesses; older ones (e.g. auto-guessed spaces) predate tracking
+    tracked = guesses[len(guesses) - len(versions):] if versions else []
+    return [letter for letter, version in zip(tracked, versions) if version > known]
+
+
+def respond(
+    response: Dict[str, Any], game_id: str, changes: Optional[Changes], since: Optional[str]
+) -> Dict[str, Any]:
+    """Trim a full ``response`` to what changed after the ``since`` token.
+
+    Without a usable token (first request, another game, malformed) the full
+    response is returned. Either way it gets the game's current ``state``
+    token and ``delta`` saying which kind it is.
+    """
+
+    changes = changes or new_changes()
+    token = state_token(game_id, changes)
+    known = _known_version(since, game_id, changes)
+    if known is None:
+        return {**response, "state": token, "delta": False}
+
+    delta = {key: response[key] for key in ALWAYS_SENT if key in response}
+    fields = changes["fields"]
+    for key, value in response.items():
+        field = RESPONSE_FIELDS.get(key)
+        if field is not None and fields.get(field, 0) > known:
+            delta[key] = value
+    added = _guesses_after(response.get("guesses", ()), changes["guesses"], known)
+    if added:
+        delta["guesses_added"] = added
+    delta["state"] = token
+    delta["delta"] = True
+    return delta
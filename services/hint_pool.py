@@ -0,0 +1,82 @@
+"""Shared pool of AI hints, reused across players on the same word.
+
+An AI hint only depends on the word, its category and how much of it has been
+revealed, so players on the same (daily) word end up asking Claude for the
+same thing over and over. ``HintPool`` keeps the hints generated so far per
+(word, category, reveal bucket) and serves each player ones they haven't seen:
+
+    from services.hint_pool import HintPool, reveal_bucket
+
+    pool = HintPool()
+    key = (word, category, reveal_bucket(masked_word))
+    hint = pool.pick(key, exclude=player_history)
+    if hint is None:
+        hint = generate_hint(...)
+        pool.add(key, hint)
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+from collections import OrderedDict
+from typing import Iterable, List, Optional, Tuple
+
+PoolKey = Tuple[str, str, int]
+
+
+def reveal_bucket(masked_word: str, buckets: int = 4) -> int:
+    """Bucket the share of revealed letters in a rendered mask (``mask["masked"]``)."""
+
+    symbols = masked_word.split(" ")
+    letters = [c for c in symbols if c == "_" or c.isalpha()]
+    if not letters:
+        return buckets - 1
+    revealed = sum(1 for c in letters if c != "_")
+    return min(revealed * buckets // len(letters), buckets - 1)
+
+
+class HintPool:
+    """Thread-safe, LRU-bounded hint lists keyed by ``(word, category, bucket)``."""
+
+    def __init__(self, *, max_keys: int = 20_000, max_hints_per_key: int = 8) -> None:
+        self.max_keys = max_keys
+        self.max_hints_per_key = max_hints_per_key
+        self._pools: "OrderedDict[PoolKey, List[str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def pick(self, key: PoolKey, exclude: Iterable[str] = ()) -> Optional[str]:
+        """Return a random pooled hint not in ``exclude``, or ``None`` if exhausted."""
+
+        excluded = set(exclude)
+        with self._lock:
+            hints = self._pools.get(key)
+            unseen = [hint for hint in hints or () if hint not in excluded]
+            if not unseen:
+                self.misses += 1
+                return None
+            self._pools.move_to_end(key)
+            self.hits += 1
+            return random.choice(unseen)
+
+    def has_unseen(self, key: PoolKey, exclude: Iterable[str] = ()) -> bool:
+        excluded = set(exclude)
+        with self._lock:
+            return any(hint not in excluded for hint in self._pools.get(key, ()))
+
+    def add(self, key: PoolKey, hint: str) -> None:
+        if not hint:
+            return
+        with self._lock:
+            hints = self._pools.get(key)
+            if hints is None:
+                hints = self._pools[key] = []
+            self._pools.move_to_end(key)
+            # A full pool stops growing; players who exhaust it still get fresh
+            # hints, they just aren't shared.
+            if hint not in hints and len(hints) < self.max_hints_per_key:
+                hints.append(hint)
+            while len(self._pools) > self.max_keys:
+                self._pools.popitem(last=False)
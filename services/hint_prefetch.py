@@ -0,0 +1,140 @@
+"""Speculative background generation of the next AI hint for a game.
+
+Everything an AI hint depends on (word, category, masked progress, previous
+hints) is known as soon as a guess is processed, so the hint can be generated
+before the player asks for it. ``HintPrefetcher`` runs that work on an
+executor, keyed by game id, and hands the result back only if the game is
+still in the state the hint was generated for:
+
+    from services.hint_prefetch import HintPrefetcher
+
+    prefetcher = HintPrefetcher(executor, budget_per_player=20, window=3600)
+    prefetcher.schedule(player_id, game_id, state_key, lambda: generate_hint(...))
+    ...
+    hint = prefetcher.take(game_id, state_key)  # None if stale or never scheduled
+
+Scheduling a new state for a game cancels (or discards) the previous one. The
+budget belongs to the player, not the game: each player may trigger
+``budget_per_player`` prefetches per ``window`` seconds however many games
+they start.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, Future
+from typing import Callable, Hashable, Optional, Tuple
+
+
+class HintPrefetcher:
+    """Per-game slot holding at most one speculative hint, with a per-player budget."""
+
+    def __init__(
+        self,
+        executor: Executor,
+        *,
+        budget_per_player: int = 20,
+        window: float = 3600.0,
+        max_players: int = 10_000,
+        max_games: int = 10_000,
+    ) -> None:
+        self._executor = executor
+        self.budget_per_player = budget_per_player
+        self.window = window
+        self.max_players = max_players
+        self.max_games = max_games
+        self._lock = threading.Lock()
+        self._slots: "OrderedDict[str, Tuple[Hashable, Future[str]]]" = OrderedDict()
+        # player id -> (window start, prefetches spent in that window)
+        self._spent: "OrderedDict[str, Tuple[float, int]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def schedule(self, player_id: str, game_id: str, state_key: Hashable, generate: Callable[[], str]) -> bool:
+        """Start generating a hint for ``state_key``; returns False when skipped."""
+
+        with self._lock:
+            slot = self._slots.get(game_id)
+            if slot is not None:
+                if slot[0] == state_key:
+                    return True
+                # The game moved on; the old hint would describe stale progress.
+                slot[1].cancel()
+                del self._slots[game_id]
+
+            now = time.monotonic()
+            started, spent = self._spent.get(player_id, (now, 0))
+            if now - started >= self.window:
+                started, spent = now, 0
+            if spent >= self.budget_per_player:
+                return False
+            self._spent[player_id] = (started, spent + 1)
+            self._spent.move_to_end(player_id)
+            while len(self._spent) > self.max_players:
+                self._spent.popitem(last=False)
+
+            self._slots[game_id] = (state_key, self._executor.submit(generate))
+            while len(self._slots) > self.max_games:
+                _, (_, abandoned) = self._slots.popitem(last=False)
+                abandoned.cancel()
+            return True
+
+    def take(self, game_id: str, state_key: Hashable, timeout: Optional[float] = None) -> Optional[str]:
+        """Return the prefetched hint if it matches ``state_key``.
+
+        A matching prefetch that is still running is waited on for up to
+        ``timeout`` seconds rather than duplicated. The slot is consumed either way.
+        """
+
+        future = self._claim(game_id, state_key)
+        if future is None:
+            return None
+        try:
+            hint = future.result(timeout=timeout)
+        except Exception:  # cancelled, timed out or failed
+            hint = None
+        return self._tally(hint)
+
+    async def take_async(self, game_id: str, state_key: Hashable, timeout: Optional[float] = None) -> Optional[str]:
+        """``take`` for coroutines: waits on the prefetch without blocking the event loop."""
+
+        future = self._claim(game_id, state_key)
+        if future is None:
+            return None
+        hint = None
+        if not future.cancelled():
+            try:
+                # Shielded: giving up on the wait must not cancel the generation
+                hint = await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), timeout)
+            except Exception:  # timed out or failed
+                hint = None
+        return self._tally(hint)
+
+    def cancel(self, game_id: str) -> None:
+        """Drop any pending prefetch for a finished or abandoned game."""
+
+        with self._lock:
+            slot = self._slots.pop(game_id, None)
+        if slot is not None:
+            slot[1].cancel()
+
+    def _claim(self, game_id: str, state_key: Hashable) -> "Optional[Future[str]]":
+        # Consumes the slot when it matches; a miss is counted here
+        with self._lock:
+            slot = self._slots.get(game_id)
+            if slot is None or slot[0] != state_key:
+                self.misses += 1
+                return None
+            del self._slots[game_id]
+        return slot[1]
+
+    def _tally(self, hint: Optional[str]) -> Optional[str]:
+        with self._lock:
+            if hint:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return hint or None
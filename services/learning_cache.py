@@ -0,0 +1,250 @@
+"""Persistent cache for AI-generated learning content.
+
+Definitions and fun facts only depend on the word, its category and the prompt
+used to produce them, so once Claude has answered for ``PYTHON`` in
+``Technology`` there is no reason to ask again. This module keeps those answers
+in a small SQLite database (so they survive restarts and can be shared between
+worker processes) with an in-process LRU layer in front of it for hot words.
+
+    from services.learning_cache import LearningCache
+
+    cache = LearningCache("instance/learning_cache.sqlite3", ttl_seconds=86400)
+    content = cache.get("PYTHON", "Technology", "v1")
+    if content is None:
+        content = {"definition": "...", "fun_fact": "..."}
+        cache.set("PYTHON", "Technology", "v1", content)
+
+Entries expire after ``ttl_seconds`` and the table is trimmed back to
+``max_entries`` (least recently used first) whenever it grows past the limit.
+Hits served from memory still count as uses for that trimming; their
+``accessed_at`` updates are written in batches rather than one per hit.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+CacheKey = Tuple[str, str, str]
+
+
+class LearningCache:
+    """SQLite-backed TTL/LRU cache for ``{"definition", "fun_fact"}`` payloads."""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        ttl_seconds: float = 30 * 24 * 3600,
+        max_entries: int = 50_000,
+        memory_entries: int = 2_048,
+        touch_batch: int = 256,
+        recount_every: int = 1_000,
+    ) -> None:
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        self.touch_batch = touch_batch
+        self.recount_every = recount_every
+
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[CacheKey, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # accessed_at of memory hits not yet written to the table
+        self._touched: Dict[CacheKey, float] = {}
+        # Row count as of the last COUNT(*) plus this process's inserts since;
+        # other processes sharing the file are caught up every recount_every sets.
+        self._rows = 0
+        self._sets_since_count = 0
+        self.hits = 0
+        self.misses = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = self._connect()
+        self._rows = self._count()
+
+    # ------------------------------------------------------------------
+    # Public helpers
+    # ------------------------------------------------------------------
+    def get(self, word: str, category: str, prompt_version: str) -> Optional[Dict[str, Any]]:
+        """Return the cached payload, or ``None`` when missing or expired."""
+
+        key = (word, category, prompt_version)
+        now = time.time()
+
+        with self._lock:
+            hit = self._memory.get(key)
+            if hit is not None:
+                created_at, payload = hit
+                if now - created_at <= self.ttl_seconds:
+                    self._memory.move_to_end(key)
+                    self._touch(key, now)
+                    self.hits += 1
+                    return dict(payload)
+                del self._memory[key]
+
+            row = self._conn.execute(
+                "SELECT payload, created_at FROM learning_cache"
+                " WHERE word = ? AND category = ? AND prompt_version = ?",
+                key,
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            raw_payload, created_at = row
+            if now - created_at > self.ttl_seconds:
+                self._conn.execute(
+                    "DELETE FROM learning_cache WHERE word = ? AND category = ? AND prompt_version = ?",
+                    key,
+                )
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE learning_cache SET accessed_at = ?"
+                " WHERE word = ? AND category = ? AND prompt_version = ?",
+                (now, *key),
+            )
+            payload = json.loads(raw_payload)
+            self._remember(key, created_at, payload)
+            self.hits += 1
+            return dict(payload)
+
+    def set(self, word: str, category: str, prompt_version: str, payload: Dict[str, Any]) -> None:
+        """Store ``payload`` and evict the least recently used rows if needed."""
+
+        key = (word, category, prompt_version)
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO learning_cache"
+                " (word, category, prompt_version, payload, created_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (*key, json.dumps(payload), now, now),
+            )
+            self._touched.pop(key, None)
+            self._remember(key, now, dict(payload))
+            # Replacing an existing row overcounts; the next recount corrects it.
+            self._rows += 1
+            self._sets_since_count += 1
+            if self._sets_since_count >= self.recount_every:
+                self._expire()
+            if self._rows > self.max_entries:
+                self._evict()
+
+    def flush(self) -> None:
+        """Write pending ``accessed_at`` updates from memory hits to the table."""
+
+        with self._lock:
+            self._flush_touched()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._touched.clear()
+            self._conn.execute("DELETE FROM learning_cache")
+            self._rows = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._count()
+
+    # ------------------------------------------------------------------
+    # Resource management
+    # ------------------------------------------------------------------
+    def close(self) -> None:
+        with self._lock:
+            self._flush_touched()
+            self._conn.close()
+
+    def reopen(self) -> None:
+        """Replace the connection, e.g. in a worker process after ``fork()``."""
+
+        with self._lock:
+            self._conn = self._connect()
+            self._rows = self._count()
+            self._sets_since_count = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS learning_cache (
+                word TEXT NOT NULL,
+                category TEXT NOT NULL,
+                prompt_version TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (word, category, prompt_version)
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS learning_cache_accessed ON learning_cache (accessed_at)"
+        )
+        return conn
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _remember(self, key: CacheKey, created_at: float, payload: Dict[str, Any]) -> None:
+        self._memory[key] = (created_at, payload)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _touch(self, key: CacheKey, now: float) -> None:
+        self._touched[key] = now
+        if len(self._touched) >= self.touch_batch:
+            self._flush_touched()
+
+    def _flush_touched(self) -> None:
+        if not self._touched:
+            return
+        self._conn.executemany(
+            "UPDATE learning_cache SET accessed_at = ?"
+            " WHERE word = ? AND category = ? AND prompt_version = ?",
+            [(accessed_at, *key) for key, accessed_at in self._touched.items()],
+        )
+        self._touched.clear()
+
+    def _count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM learning_cache").fetchone()[0]
+
+    def _expire(self) -> None:
+        """Drop expired rows and refresh the row count (``get`` already skips expired ones)."""
+
+        cutoff = time.time() - self.ttl_seconds
+        self._conn.execute("DELETE FROM learning_cache WHERE created_at < ?", (cutoff,))
+        self._rows = self._count()
+        self._sets_since_count = 0
+
+    def _evict(self) -> None:
+        self._expire()
+        overflow = self._rows - self.max_entries
+        if overflow <= 0:
+            return
+
+        # Memory hits since the last flush decide what is least recently used too
+        self._flush_touched()
+        victims: List[CacheKey] = self._conn.execute(
+            "SELECT word, category, prompt_version FROM learning_cache ORDER BY accessed_at ASC LIMIT ?",
+            (overflow,),
+        ).fetchall()
+        self._conn.executemany(
+            "DELETE FROM learning_cache WHERE word = ? AND category = ? AND prompt_version = ?",
+            victims,
+        )
+        for key in victims:
+            self._memory.pop(tuple(key), None)
+        self._rows -= len(victims)
@@ -0,0 +1,383 @@
+"""Minimal Prometheus-style metrics without extra dependencies.
+
+Counters and histograms live in a ``Registry`` that renders the Prometheus text
+exposition format, so a ``/metrics`` endpoint is one line:
+
+    from services.metrics import REGISTRY
+
+    GUESSES = REGISTRY.counter("guesses_total", "Letters guessed", ("result",))
+    LATENCY = REGISTRY.histogram("guess_duration_seconds", "Time spent handling a guess")
+
+    GUESSES.inc(result="hit")
+    with LATENCY.time():
+        ...
+    text = REGISTRY.render()
+
+Values that are already counted elsewhere (e.g. a cache's ``hits`` attribute)
+can be exported with ``REGISTRY.callback`` instead of being counted twice.
+
+Metrics live in process memory. With several worker processes, each one
+writes its samples to a shared directory every few seconds and any worker
+can serve the sum of all of them:
+
+    REGISTRY.share("/tmp/hangman-metrics", interval=5)   # in every worker
+    text = REGISTRY.render_directory("/tmp/hangman-metrics")
+
+Counters and histograms of workers that have exited keep counting toward the
+totals: the next render folds an exited worker's file into ``exited.json`` and
+deletes it, so the directory holds one file per live worker plus that one.
+Gauges only come from live workers.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+LabelValues = Tuple[str, ...]
+# JSON-serialisable samples of one metric: name, kind, help, labelnames,
+# buckets (histograms) and samples - [labels, value] or [labels, bucket counts, sum, count]
+Family = Dict[str, Any]
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# Counters and histograms of exited workers, summed (see _fold_exited)
+EXITED_FILE = "exited.json"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _family(self, samples: List[List[Any]]) -> Family:
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "help": self.documentation,
+            "labelnames": list(self.labelnames),
+            "samples": samples,
+        }
+
+    def collect(self) -> Family:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing value per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def collect(self) -> Family:
+        with self._lock:
+            return self._family([[list(key), value] for key, value in self._values.items()])
+
+
+class Histogram(_Metric):
+    """Cumulative bucket counts plus sum and count, per label set."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        # label values -> (per-bucket counts, sum, count)
+        self._series: Dict[LabelValues, Tuple[List[int], float, int]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            counts, total, count = self._series.get(key) or ([0] * len(self.buckets), 0.0, 0)
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+                    break
+            self._series[key] = (counts, total + value, count + 1)
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def collect(self) -> Family:
+        with self._lock:
+            family = self._family(
+                [[list(key), list(counts), total, count] for key, (counts, total, count) in self._series.items()]
+            )
+        family["buckets"] = [_format_value(bound) for bound in self.buckets]
+        return family
+
+
+class _Callback(_Metric):
+    """Samples read from ``fn()`` at render time: ``{label values: value}``."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        kind: str,
+        labelnames: Sequence[str],
+        fn: Callable[[], Dict[LabelValues, float]],
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.kind = kind
+        self._fn = fn
+
+    def collect(self) -> Family:
+        return self._family([[list(key), value] for key, value in self._fn().items()])
+
+
+class Registry:
+    """Named collection of metrics; ``counter``/``histogram`` return existing ones by name."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+        # (pid, file name) this process shares its samples under; see write_to
+        self._share_name: Optional[Tuple[int, str]] = None
+
+    def _get_or_add(self, name: str, factory: Callable[[], _Metric]) -> _Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = factory()
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_add(name, lambda: Counter(name, documentation, labelnames))  # type: ignore[return-value]
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Optional[Sequence[float]] = None,
+    ) -> Histogram:
+        return self._get_or_add(  # type: ignore[return-value]
+            name, lambda: Histogram(name, documentation, labelnames, buckets or DEFAULT_BUCKETS)
+        )
+
+    def callback(
+        self,
+        name: str,
+        documentation: str,
+        fn: Callable[[], Dict[LabelValues, float]],
+        *,
+        kind: str = "counter",
+        labelnames: Sequence[str] = (),
+    ) -> None:
+        with self._lock:
+            self._metrics[name] = _Callback(name, documentation, kind, labelnames, fn)
+
+    def collect(self) -> List[Family]:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return [metric.collect() for metric in metrics]
+
+    def render(self) -> str:
+        return render_families(self.collect())
+
+    # ------------------------------------------------------------------
+    # Sharing between worker processes
+    # ------------------------------------------------------------------
+    def write_to(self, directory: Union[str, Path]) -> None:
+        """Write this process's samples to ``<directory>/<pid>-<start>.json`` (atomically).
+
+        The start time in the name keeps a process that reuses an exited
+        worker's pid from overwriting that worker's samples before they are folded.
+        """
+
+        pid = os.getpid()
+        if self._share_name is None or self._share_name[0] != pid:  # first write, or forked since
+            self._share_name = (pid, f"{pid}-{time.time_ns()}.json")
+        path = Path(directory) / self._share_name[1]
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self.collect()))
+        os.replace(tmp_path, path)
+
+    def share(self, directory: Union[str, Path], interval: float = 5.0) -> threading.Thread:
+        """Keep this process's file in ``directory`` current from a daemon thread."""
+
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        self.write_to(directory)
+
+        def loop() -> None:
+            while True:
+                time.sleep(interval)
+                try:
+                    self.write_to(directory)
+                except OSError:
+                    pass  # e.g. the directory was removed on shutdown; try again next time
+
+        thread = threading.Thread(target=loop, name="metrics-share", daemon=True)
+        thread.start()
+        return thread
+
+    def render_directory(self, directory: Union[str, Path]) -> str:
+        """Render the sum of every process's samples in ``directory``, this one's fresh."""
+
+        self.write_to(directory)
+        directory = Path(directory)
+        _fold_exited(directory)
+        collections = []
+        for path in directory.glob("*.json"):
+            if path.name != EXITED_FILE and _file_pid(path) is None:
+                continue
+            try:
+                collections.append(json.loads(path.read_text()))
+            except (OSError, ValueError):
+                continue  # removed or replaced while listing
+        return render_families(merge_families(collections))
+
+
+def _file_pid(path: Path) -> Optional[int]:
+    pid = path.stem.partition("-")[0]
+    return int(pid) if pid.isdigit() else None
+
+
+def _fold_exited(directory: Path) -> None:
+    """Merge the files of exited processes into ``EXITED_FILE`` and delete them."""
+
+    try:
+        import fcntl
+    except ImportError:  # no fork() either, so no other workers to fold
+        return
+
+    # One folder at a time, or two renders could add the same file twice
+    with open(directory / "exited.lock", "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        dead = []
+        for path in directory.glob("*.json"):
+            pid = _file_pid(path)
+            if pid is not None and not _process_alive(pid):
+                dead.append(path)
+        if not dead:
+            return
+        exited_path = directory / EXITED_FILE
+        collections = []
+        if exited_path.exists():
+            collections.append(json.loads(exited_path.read_text()))
+        for path in dead:
+            families = json.loads(path.read_text())
+            collections.append([family for family in families if family["kind"] != "gauge"])
+        tmp_path = exited_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(merge_families(collections)))
+        os.replace(tmp_path, exited_path)
+        for path in dead:
+            path.unlink()
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def merge_families(collections: Iterable[List[Family]]) -> List[Family]:
+    """Sum samples with the same metric name and labels across several processes."""
+
+    merged: Dict[str, Family] = {}
+    values: Dict[str, Dict[LabelValues, Any]] = {}
+    for families in collections:
+        for family in families:
+            name = family["name"]
+            if name not in merged:
+                merged[name] = {**family, "samples": []}
+                values[name] = {}
+            series = values[name]
+            for labels, *sample in family["samples"]:
+                key = tuple(labels)
+                current = series.get(key)
+                if current is None:
+                    series[key] = sample
+                elif len(sample) == 1:
+                    series[key] = [current[0] + sample[0]]
+                else:
+                    counts, total, count = sample
+                    series[key] = [[a + b for a, b in zip(current[0], counts)], current[1] + total, current[2] + count]
+    for name, family in merged.items():
+        family["samples"] = [[list(key), *sample] for key, sample in values[name].items()]
+    return list(merged.values())
+
+
+def render_families(families: Iterable[Family]) -> str:
+    """Prometheus text exposition of collected (or merged) metric families."""
+
+    lines: List[str] = []
+    for family in families:
+        name, labelnames = family["name"], family["labelnames"]
+        lines.append(f"# HELP {name} {family['help']}")
+        lines.append(f"# TYPE {name} {family['kind']}")
+        for labels, *sample in sorted(family["samples"]):
+            if "buckets" not in family:
+                lines.append(f"{name}{_format_labels(labelnames, labels)} {_format_value(sample[0])}")
+                continue
+            counts, total, count = sample
+            cumulative = 0
+            for bound, bucket_count in zip(family["buckets"], counts):
+                cumulative += bucket_count
+                le = f'le="{bound}"'
+                lines.append(f"{name}_bucket{_format_labels(labelnames, labels, le)} {cumulative}")
+            label_text = _format_labels(labelnames, labels)
+            lines.append(f"{name}_sum{label_text} {_format_value(total)}")
+            lines.append(f"{name}_count{label_text} {count}")
+    return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
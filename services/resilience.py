@@ -0,0 +1,161 @@
+"""Client-side protection for calls to a flaky or rate-limited upstream.
+
+Three small, thread-safe building blocks used by ``services.claude_client``:
+
+    from services.resilience import CircuitBreaker, RetryPolicy, TokenBucket
+
+    bucket = TokenBucket(rate=20, burst=40)       # at most ~20 calls/s
+    breaker = CircuitBreaker(failure_threshold=5, reset_timeout=30)
+    retry = RetryPolicy(max_attempts=3, base_delay=0.5, max_delay=8)
+
+    wait = bucket.reserve(max_wait=deadline_left)  # None -> would wait too long
+    if breaker.allow():
+        ...  # call, then breaker.record_success() / breaker.record_failure()
+    time.sleep(retry.delay(attempt, retry_after=header_seconds))
+
+None of them sleep on their own, so they work the same from threads and from
+asyncio code.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+
+class TokenBucket:
+    """Token bucket that hands out reservations instead of blocking.
+
+    ``reserve`` always takes a token, letting the balance go negative, and
+    returns how long the caller must wait for it; callers queue up fairly in
+    arrival order without a background refill thread.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, max_wait: Optional[float] = None) -> Optional[float]:
+        """Return seconds to wait before using the reserved token.
+
+        Returns ``None`` (and reserves nothing) when the wait would exceed ``max_wait``.
+        """
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            wait = max(0.0, (1 - self._tokens) / self.rate)
+            if max_wait is not None and wait > max_wait:
+                return None
+            self._tokens -= 1
+            return wait
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter, never shorter than ``retry-after``.
+
+    ``max_delay`` caps the backoff only. A ``retry-after`` is honoured in full;
+    callers should give up instead when it outlasts their deadline, or
+    ``max_retry_after`` when they have none.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0,
+        max_retry_after: float = 60.0,
+    ) -> None:
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Seconds to sleep after failed attempt number ``attempt`` (0-based)."""
+
+        backoff = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+        if retry_after is not None:
+            return max(backoff, retry_after)
+        return backoff
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``retry-after`` header given in seconds or as an HTTP date."""
+
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class CircuitBreaker:
+    """Stops calls after repeated failures, then lets one probe through per ``reset_timeout``.
+
+    closed -> (``failure_threshold`` consecutive failures) -> open -> (after
+    ``reset_timeout``) -> half-open: a single trial call decides whether to
+    close again or stay open for another period.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                self._state = self.HALF_OPEN
+                self._probe_in_flight = False
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
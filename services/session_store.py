@@ -0,0 +1,391 @@
+"""Server-side Flask sessions with pluggable storage backends.
+
+Flask's default session puts every value in a signed cookie, so the browser
+uploads (and the server re-verifies) the whole game state on every request.
+This module keeps the data on the server instead and only hands the browser a
+short, signed, opaque session id:
+
+    from services.session_store import ServerSideSessionInterface, SQLiteSessionBackend
+
+    app.session_interface = ServerSideSessionInterface(
+        SQLiteSessionBackend("instance/sessions.sqlite3")
+    )
+
+Two backends are provided: ``MemorySessionBackend`` for single-process
+development servers and ``SQLiteSessionBackend`` for anything that needs to
+survive restarts or be shared between worker processes. Other stores only need
+to implement ``load``, ``save`` and ``delete``.
+
+Requests of the same player can overlap (a long poll or an event stream next
+to a guess), so an existing session is never written back wholesale: only
+the keys a request changed are merged into the latest stored copy, in one
+atomic read-modify-write (``SessionBackend.merge``). Work that finishes after
+the response went out uses ``ServerSideSessionInterface.update``.
+"""
+
+from __future__ import annotations
+
+import secrets
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Set, Tuple, Union
+
+from flask.json.tag import TaggedJSONSerializer
+from flask.sessions import SessionInterface, SessionMixin
+from itsdangerous import BadSignature, Signer
+from werkzeug.datastructures import CallbackDict
+
+
+class SessionBackend:
+    """Storage for serialized session payloads keyed by session id."""
+
+    def load(self, sid: str) -> Optional[str]:
+        raise NotImplementedError
+
+    def save(self, sid: str, payload: str, ttl_seconds: float) -> None:
+        raise NotImplementedError
+
+    def delete(self, sid: str) -> None:
+        raise NotImplementedError
+
+    def merge(self, sid: str, merge: Callable[[Optional[str]], Optional[str]], ttl_seconds: float) -> None:
+        """Replace the payload with ``merge(current payload)``; None deletes the session.
+
+        Backends should make this atomic against concurrent saves; this
+        fallback is not.
+        """
+
+        payload = merge(self.load(sid))
+        if payload is None:
+            self.delete(sid)
+        else:
+            self.save(sid, payload, ttl_seconds)
+
+    def close(self) -> None:
+        """Release connections; backends without any can ignore this."""
+
+    def reopen(self) -> None:
+        """Reconnect after ``close()`` or in a freshly forked worker process."""
+
+
+class MemorySessionBackend(SessionBackend):
+    """Process-local backend; sessions vanish on restart and aren't shared."""
+
+    def __init__(self, *, purge_every: int = 1_000) -> None:
+        self._data: Dict[str, Tuple[float, str]] = {}
+        self._lock = threading.Lock()
+        self._purge_every = purge_every
+        self._writes = 0
+
+    def load(self, sid: str) -> Optional[str]:
+        with self._lock:
+            item = self._data.get(sid)
+            if item is None:
+                return None
+            expires_at, payload = item
+            if expires_at < time.time():
+                del self._data[sid]
+                return None
+            return payload
+
+    def save(self, sid: str, payload: str, ttl_seconds: float) -> None:
+        with self._lock:
+            self._save(sid, payload, ttl_seconds)
+
+    def delete(self, sid: str) -> None:
+        with self._lock:
+            self._data.pop(sid, None)
+
+    def merge(self, sid: str, merge: Callable[[Optional[str]], Optional[str]], ttl_seconds: float) -> None:
+        with self._lock:
+            item = self._data.get(sid)
+            payload = merge(item[1] if item is not None and item[0] >= time.time() else None)
+            if payload is None:
+                self._data.pop(sid, None)
+            else:
+                self._save(sid, payload, ttl_seconds)
+
+    def _save(self, sid: str, payload: str, ttl_seconds: float) -> None:
+        self._data[sid] = (time.time() + ttl_seconds, payload)
+        self._writes += 1
+        if self._writes % self._purge_every == 0:
+            now = time.time()
+            for key in [k for k, (exp, _) in self._data.items() if exp < now]:
+                del self._data[key]
+
+
+class SQLiteSessionBackend(SessionBackend):
+    """SQLite-backed sessions that survive restarts and work across processes."""
+
+    def __init__(self, path: Union[str, Path], *, purge_every: int = 1_000) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._purge_every = purge_every
+        self._writes = 0
+
+        self._conn = self._connect()
+
+    def load(self, sid: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, expires_at FROM sessions WHERE sid = ?", (sid,)
+            ).fetchone()
+        if row is None or row[1] < time.time():
+            return None
+        return row[0]
+
+    def save(self, sid: str, payload: str, ttl_seconds: float) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sessions (sid, payload, expires_at) VALUES (?, ?, ?)",
+                (sid, payload, now + ttl_seconds),
+            )
+            self._writes += 1
+            if self._writes % self._purge_every == 0:
+                self._conn.execute("DELETE FROM sessions WHERE expires_at < ?", (now,))
+
+    def delete(self, sid: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM sessions WHERE sid = ?", (sid,))
+
+    def merge(self, sid: str, merge: Callable[[Optional[str]], Optional[str]], ttl_seconds: float) -> None:
+        now = time.time()
+        with self._lock:
+            # IMMEDIATE takes the write lock up front, so other workers' merges queue behind this one
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT payload, expires_at FROM sessions WHERE sid = ?", (sid,)
+                ).fetchone()
+                payload = merge(row[0] if row is not None and row[1] >= now else None)
+                if payload is None:
+                    self._conn.execute("DELETE FROM sessions WHERE sid = ?", (sid,))
+                else:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO sessions (sid, payload, expires_at) VALUES (?, ?, ?)",
+                        (sid, payload, now + ttl_seconds),
+                    )
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def reopen(self) -> None:
+        """Replace the connection, e.g. in a worker process after ``fork()``."""
+
+        with self._lock:
+            self._conn = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sessions (
+                sid TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS sessions_expires ON sessions (expires_at)")
+        return conn
+
+
+class ServerSideSession(CallbackDict, SessionMixin):
+    """Session dict that remembers its id and which keys were changed.
+
+    Values mutated in place are not noticed (as with any Flask session);
+    assign them back to record the change.
+    """
+
+    def __init__(self, initial: Optional[Dict[str, Any]] = None, sid: str = "", new: bool = False) -> None:
+        def on_update(self) -> None:
+            self.modified = True
+
+        self.changed_keys: Set[str] = set()
+        super().__init__(initial, on_update)
+        self.sid = sid
+        self.new = new
+        self.modified = False
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.changed_keys.add(key)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        self.changed_keys.add(key)
+        super().__delitem__(key)
+
+    def pop(self, key: str, *default: Any) -> Any:
+        if key in self:
+            self.changed_keys.add(key)
+        return super().pop(key, *default)
+
+    def popitem(self) -> Tuple[str, Any]:
+        item = super().popitem()
+        self.changed_keys.add(item[0])
+        return item
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self.changed_keys.add(key)
+        return super().setdefault(key, default)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        items = dict(*args, **kwargs)
+        self.changed_keys.update(items)
+        super().update(items)
+
+    def clear(self) -> None:
+        self.changed_keys.update(self)
+        super().clear()
+
+
+class ServerSideSessionInterface(SessionInterface):
+    """Stores session data in a ``SessionBackend``; the cookie only holds a signed id."""
+
+    salt = "server-side-session"
+    serializer = TaggedJSONSerializer()
+    session_class = ServerSideSession
+
+    def __init__(self, backend: SessionBackend) -> None:
+        self.backend = backend
+
+    def _get_signer(self, app) -> Optional[Signer]:
+        if not app.secret_key:
+            return None
+        return Signer(app.secret_key, salt=self.salt)
+
+    def _new_session(self) -> ServerSideSession:
+        return self.session_class(sid=secrets.token_urlsafe(32), new=True)
+
+    def open_session(self, app, request) -> Optional[ServerSideSession]:
+        signer = self._get_signer(app)
+        if signer is None:
+            return None
+
+        cookie = request.cookies.get(self.get_cookie_name(app))
+        if not cookie:
+            return self._new_session()
+
+        try:
+            sid = signer.unsign(cookie).decode("utf-8")
+        except BadSignature:
+            return self._new_session()
+
+        payload = self.backend.load(sid)
+        if payload is None:
+            return self._new_session()
+
+        try:
+            data = self.serializer.loads(payload)
+        except Exception:
+            return self._new_session()
+        return self.session_class(data, sid=sid)
+
+    def _write_changes(self, app, session: ServerSideSession) -> None:
+        """Merge the keys ``session`` changed into the stored copy (all of it when new)."""
+
+        ttl = app.permanent_session_lifetime.total_seconds()
+        if session.new:
+            self.backend.save(session.sid, self.serializer.dumps(dict(session)), ttl)
+        else:
+            # ``modified`` set by hand, without a tracked key, means "write everything"
+            keys = set(session.changed_keys) or set(session)
+
+            def merge(payload: Optional[str]) -> Optional[str]:
+                data = self._loads(payload)
+                for key in keys:
+                    if key in session:
+                        data[key] = session[key]
+                    else:
+                        data.pop(key, None)
+                return self.serializer.dumps(data) if data else None
+
+            self.backend.merge(session.sid, merge, ttl)
+        session.new = False
+        session.modified = False
+        session.changed_keys.clear()
+
+    def _loads(self, payload: Optional[str]) -> Dict[str, Any]:
+        if payload is None:
+            return {}
+        try:
+            return self.serializer.loads(payload)
+        except Exception:
+            return {}
+
+    def update(self, app, session: ServerSideSession, change: Callable[[Dict[str, Any]], None]) -> None:
+        """Apply ``change`` to the latest stored session data, atomically.
+
+        For work that finishes after the response headers went out (server-sent
+        events): ``session`` is a snapshot from when the request started, and
+        other requests may have changed the session since. ``session`` gets
+        the updated data too.
+        """
+
+        result: Dict[str, Any] = {}
+
+        def merge(payload: Optional[str]) -> Optional[str]:
+            data = self._loads(payload)
+            change(data)
+            result.update(data)
+            return self.serializer.dumps(data) if data else None
+
+        self.backend.merge(session.sid, merge, app.permanent_session_lifetime.total_seconds())
+        session.clear()
+        session.update(result)
+        session.modified = False
+        session.changed_keys.clear()
+
+    def save_session(self, app, session: ServerSideSession, response) -> None:
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+        secure = self.get_cookie_secure(app)
+        samesite = self.get_cookie_samesite(app)
+        httponly = self.get_cookie_httponly(app)
+
+        if session.accessed:
+            response.vary.add("Cookie")
+
+        # If the session is modified to be empty, drop it and remove the cookie.
+        if not session:
+            if session.modified and not session.new:
+                self.backend.delete(session.sid)
+                response.delete_cookie(
+                    name, domain=domain, path=path, secure=secure, samesite=samesite, httponly=httponly
+                )
+                response.vary.add("Cookie")
+            return
+
+        is_new = session.new
+        if session.modified or session.new:
+            self._write_changes(app, session)
+
+        # The cookie never changes for an existing session, so only send it when
+        # it is new or when permanent sessions need their expiry refreshed.
+        if not (is_new or (session.permanent and app.config["SESSION_REFRESH_EACH_REQUEST"])):
+            return
+
+        response.set_cookie(
+            name,
+            self._get_signer(app).sign(session.sid).decode("utf-8"),
+            expires=self.get_expiration_time(app, session),
+            httponly=httponly,
+            domain=domain,
+            path=path,
+            secure=secure,
+            samesite=samesite,
+        )
+        response.vary.add("Cookie")
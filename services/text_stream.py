@@ -0,0 +1,78 @@
+"""Replayable text stream shared by one producer and any number of readers.
+
+A background job that streams a Claude reply appends the deltas here; request
+handlers that want to relay the reply (e.g. over server-sent events) iterate
+over it and get everything produced so far followed by new deltas as they
+arrive, so a late subscriber never needs a second upstream call:
+
+    from services.text_stream import TextStream
+
+    stream = TextStream()
+
+    def produce():
+        try:
+            for delta in claude.stream_text(prompt="..."):
+                stream.append(delta)
+        finally:
+            stream.close()
+
+    executor.submit(produce)
+    for delta in stream.iter(timeout=30):
+        send(delta)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Iterator, List, Optional
+
+
+class TextStream:
+    """Append-only list of text deltas with blocking iteration."""
+
+    def __init__(self) -> None:
+        self._parts: List[str] = []
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def append(self, delta: str) -> None:
+        if not delta:
+            return
+        with self._cond:
+            self._parts.append(delta)
+            self._cond.notify_all()
+
+    def close(self) -> None:
+        """Mark the stream finished (successfully or not) and wake every reader."""
+
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def text(self) -> str:
+        with self._cond:
+            return "".join(self._parts)
+
+    def iter(self, timeout: Optional[float] = None) -> Iterator[str]:
+        """Yield all deltas from the start until the stream closes or ``timeout`` passes."""
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        index = 0
+        while True:
+            with self._cond:
+                while index >= len(self._parts) and not self._closed:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return
+                    self._cond.wait(remaining)
+                pending = self._parts[index:]
+                index = len(self._parts)
+                finished = self._closed
+            yield from pending
+            if finished and not pending:
+                return
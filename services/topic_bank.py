@@ -0,0 +1,229 @@
+"""Reusable word banks for AI-generated custom topics.
+
+Generating words for a custom topic costs a Claude completion that only yields
+a handful of entries. ``TopicWordBank`` keeps every batch it has seen for a
+(normalised topic, difficulty) pair, deduplicated by word, so later games can
+draw from the bank and only go back to Claude when it runs low:
+
+    from services.topic_bank import TopicWordBank
+
+    bank = TopicWordBank("instance/topic_banks.sqlite3")
+    words = bank.words("80s Movies", "medium")
+    if not words:
+        words = bank.add("80s Movies", "medium", generate_words(...))
+    bank.refill_async("80s Movies", "medium", generate_words, executor)
+
+Banks live in SQLite so every worker process sees the same words, with the
+parsed words of recently used banks kept in memory. Each bank carries a
+version that goes up whenever words are added (or old ones dropped once it
+is full); ``snapshot()`` returns it so callers can tell when indexes built
+from a bank are out of date.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, Future
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+BankKey = Tuple[str, str]
+WordEntry = Dict[str, Any]
+
+MAX_TOPIC_LENGTH = 60
+
+
+def clean_topic(topic: str) -> str:
+    """Display form of a player-entered topic: collapsed whitespace, bounded length."""
+
+    return " ".join((topic or "").split())[:MAX_TOPIC_LENGTH].strip()
+
+
+def normalize_topic(topic: str) -> str:
+    """Case-, whitespace- and punctuation-insensitive form of a topic name."""
+
+    return re.sub(r"[^\w]+", " ", clean_topic(topic).casefold()).strip()
+
+
+class TopicWordBank:
+    """Thread-safe, SQLite-backed mapping of topic/difficulty to deduplicated words."""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        max_topics: int = 500,
+        max_words_per_topic: int = 100,
+        memory_topics: int = 200,
+    ) -> None:
+        self.path = Path(path)
+        self.max_topics = max_topics
+        self.max_words_per_topic = max_words_per_topic
+        self.memory_topics = memory_topics
+        self._memory: "OrderedDict[BankKey, Tuple[int, Tuple[WordEntry, ...]]]" = OrderedDict()
+        self._refilling: Dict[BankKey, "Future[Any]"] = {}
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = self._connect()
+
+    @staticmethod
+    def key(topic: str, difficulty: str) -> BankKey:
+        return (normalize_topic(topic), difficulty)
+
+    def snapshot(self, topic: str, difficulty: str) -> Tuple[int, Tuple[WordEntry, ...]]:
+        """Return ``(version, words)`` for the topic; ``(0, ())`` when unknown."""
+
+        key = self.key(topic, difficulty)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT version FROM topic_banks WHERE topic = ? AND difficulty = ?", key
+            ).fetchone()
+            if row is None:
+                self._memory.pop(key, None)
+                return 0, ()
+            cached = self._memory.get(key)
+            if cached is None or cached[0] != row[0]:
+                # Another process (or a refill) changed the bank since it was read
+                version, words = self._read(key)
+                cached = (version, tuple(words.values()))
+            self._remember(key, cached)
+            return cached
+
+    def words(self, topic: str, difficulty: str) -> Tuple[WordEntry, ...]:
+        """Return every banked word for the topic (empty tuple when unknown)."""
+
+        return self.snapshot(topic, difficulty)[1]
+
+    def add(self, topic: str, difficulty: str, new_words: List[WordEntry]) -> Tuple[WordEntry, ...]:
+        """Merge a batch into the bank, skipping duplicates, and return the bank."""
+
+        key = self.key(topic, difficulty)
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                version, bank = self._read(key)
+                added = False
+                for entry in new_words:
+                    word = (entry.get("word") or "").strip().upper()
+                    if not word or word in bank:
+                        continue
+                    bank[word] = {**entry, "word": word, "hint": entry.get("hint") or ""}
+                    added = True
+                while len(bank) > self.max_words_per_topic:
+                    bank.popitem(last=False)
+
+                if added:
+                    version += 1
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO topic_banks (topic, difficulty, words, version, updated_at)"
+                        " VALUES (?, ?, ?, ?, ?)",
+                        (*key, json.dumps(list(bank.values())), version, time.time()),
+                    )
+                    if version == 1:
+                        self._trim()
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            words = tuple(bank.values())
+            if version:
+                self._remember(key, (version, words))
+            return words
+
+    def refill_async(
+        self,
+        topic: str,
+        difficulty: str,
+        generate: Callable[[str, str, List[str]], List[WordEntry]],
+        executor: Executor,
+    ) -> Optional["Future[Any]"]:
+        """Top the bank up in the background; at most one refill per topic at a time.
+
+        ``generate(topic, difficulty, known_words)`` should return a fresh batch.
+        """
+
+        key = self.key(topic, difficulty)
+        known = [entry["word"] for entry in self.words(topic, difficulty)]
+        with self._lock:
+            if key in self._refilling:
+                return None
+            future = executor.submit(self._refill, topic, difficulty, generate, known)
+            self._refilling[key] = future
+
+        def done(_future: "Future[Any]") -> None:
+            with self._lock:
+                self._refilling.pop(key, None)
+
+        future.add_done_callback(done)
+        return future
+
+    # ------------------------------------------------------------------
+    # Resource management
+    # ------------------------------------------------------------------
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def reopen(self) -> None:
+        """Replace the connection, e.g. in a worker process after ``fork()``."""
+
+        with self._lock:
+            self._conn = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS topic_banks (
+                topic TEXT NOT NULL,
+                difficulty TEXT NOT NULL,
+                words TEXT NOT NULL,
+                version INTEGER NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (topic, difficulty)
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS topic_banks_updated ON topic_banks (updated_at)")
+        return conn
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _read(self, key: BankKey) -> Tuple[int, "OrderedDict[str, WordEntry]"]:
+        row = self._conn.execute(
+            "SELECT version, words FROM topic_banks WHERE topic = ? AND difficulty = ?", key
+        ).fetchone()
+        if row is None:
+            return 0, OrderedDict()
+        return row[0], OrderedDict((entry["word"], entry) for entry in json.loads(row[1]))
+
+    def _remember(self, key: BankKey, bank: Tuple[int, Tuple[WordEntry, ...]]) -> None:
+        self._memory[key] = bank
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_topics:
+            self._memory.popitem(last=False)
+
+    def _trim(self) -> None:
+        # Only a new bank can push the table past max_topics; drop the stalest ones
+        self._conn.execute(
+            "DELETE FROM topic_banks WHERE rowid IN (SELECT rowid FROM topic_banks"
+            " ORDER BY updated_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_topics,),
+        )
+
+    def _refill(
+        self,
+        topic: str,
+        difficulty: str,
+        generate: Callable[[str, str, List[str]], List[WordEntry]],
+        known: List[str],
+    ) -> Tuple[WordEntry, ...]:
+        return self.add(topic, difficulty, generate(topic, difficulty, known))
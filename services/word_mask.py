@@ -0,0 +1,84 @@
+"""Incremental masked-word state for a hangman game.
+
+Rather than rebuilding the masked string from the whole guess list on every
+request, a game carries a small JSON-serialisable mask that each guess updates
+in place. Reading the masked word or checking for a win is then a dict lookup:
+
+    from services.word_mask import apply_guess, new_mask
+
+    mask = new_mask("POLAR BEAR", guesses=[" "])
+    mask, hit = apply_guess("POLAR BEAR", mask, "A")
+    mask["masked"]         # "_ _ _ A _   _ _ A _"
+    mask["remaining"] == 0  # solved?
+
+A mask holds ``guessed`` (bitset of guessed characters), ``revealed`` (bitset
+of revealed positions), ``remaining`` (hidden positions left) and ``masked``
+(the rendered string). Per-letter position bitmasks are derived from the word
+and cached, so they never need to be stored with the game.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Tuple
+
+Mask = Dict[str, Any]
+
+
+def _char_bit(char: str) -> int:
+    # A-Z get the low 26 bits; anything else (space, accented letters) sits above them
+    offset = ord(char) - ord("A")
+    return 1 << (offset if 0 <= offset < 26 else 26 + ord(char))
+
+
+@lru_cache(maxsize=4096)
+def letter_positions(word: str) -> Dict[str, int]:
+    """Map each character of ``word`` to the bitmask of positions it occupies."""
+
+    positions: Dict[str, int] = {}
+    for index, char in enumerate(word):
+        positions[char] = positions.get(char, 0) | (1 << index)
+    return positions
+
+
+def _render(word: str, revealed: int) -> str:
+    return " ".join(char if revealed >> index & 1 else "_" for index, char in enumerate(word))
+
+
+def new_mask(word: str, guesses: Iterable[str] = ()) -> Mask:
+    """Build the mask for ``word`` with ``guesses`` already applied.
+
+    Non-alphabetic characters (spaces, hyphens) are always shown.
+    """
+
+    guessed = 0
+    revealed = 0
+    for char in set(guesses):
+        guessed |= _char_bit(char)
+    for char, positions in letter_positions(word).items():
+        if not char.isalpha() or guessed & _char_bit(char):
+            revealed |= positions
+    hidden = sum(1 for index in range(len(word)) if not revealed >> index & 1)
+    return {"guessed": guessed, "revealed": revealed, "remaining": hidden, "masked": _render(word, revealed)}
+
+
+def is_guessed(mask: Mask, letter: str) -> bool:
+    return bool(mask["guessed"] & _char_bit(letter))
+
+
+def apply_guess(word: str, mask: Mask, letter: str) -> Tuple[Mask, bool]:
+    """Return ``(new_mask, hit)`` after guessing ``letter``; ``mask`` is not modified."""
+
+    positions = letter_positions(word).get(letter, 0)
+    guessed = mask["guessed"] | _char_bit(letter)
+    newly_revealed = positions & ~mask["revealed"]
+    if not newly_revealed:
+        return {**mask, "guessed": guessed}, bool(positions)
+
+    revealed = mask["revealed"] | newly_revealed
+    return {
+        "guessed": guessed,
+        "revealed": revealed,
+        "remaining": mask["remaining"] - bin(newly_revealed).count("1"),
+        "masked": _render(word, revealed),
+    }, True
@@ -0,0 +1,312 @@
+"""The word data snapshots are compiled from, importable without the app.
+
+The built-in categories and difficulty settings live here next to the code
+that reads ``data/curriculum_words.json`` and ``data/learning_content.json``,
+so ``scripts.build_word_snapshot`` can compile a snapshot without importing
+``app`` (and starting its stores, schedulers and watchers):
+
+    from services.word_sources import CURRICULUM_PATH, LEARNING_CONTENT_PATH, build_snapshot
+
+    build_snapshot("instance/word_snapshot.bin", CURRICULUM_PATH, LEARNING_CONTENT_PATH)
+    # False when the snapshot already matches snapshot_fingerprint(...)
+
+``app`` loads its categories through the same functions, so both always
+agree on the fingerprint.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from itertools import chain
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from services.word_store import open_snapshot, source_fingerprint, write_snapshot
+
+Source = Tuple[str, Dict[str, Optional[str]], List[Dict[str, Any]]]
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+CURRICULUM_PATH = Path(os.getenv("CURRICULUM_PATH", BASE_DIR / "data" / "curriculum_words.json"))
+# Definitions/fun facts produced offline by scripts/pregenerate_learning.py
+LEARNING_CONTENT_PATH = BASE_DIR / "data" / "learning_content.json"
+# Bump whenever word normalisation (_word_record) changes so snapshots are rebuilt.
+SNAPSHOT_VERSION = "v1"
+
+# Difficulty settings (word_length bands are part of the snapshot)
+DIFFICULTY_SETTINGS = {
+    'easy': {
+        'attempts': 8,
+        'word_length': (3, 6),  # 3-6 letters
+        'ai_hint_cost': 0,  # Free hints
+    },
+    'medium': {
+        'attempts': 6,
+        'word_length': (5, 10),  # 5-10 letters
+        'ai_hint_cost': 0,  # Free hints
+    },
+    'hard': {
+        'attempts': 4,
+        'word_length': (8, 20),  # 8+ letters
+        'ai_hint_cost': 1,  # Costs 1 attempt
+    }
+}
+
+BASE_CATEGORIES = {
+    "Technology": [
+        {"word": "PYTHON", "hint": "A popular programming language named after a snake"},
+        {"word": "FLASK", "hint": "A micro web framework written in Python"},
+        {"word": "DEVELOPER", "hint": "Someone who writes code"},
+        {"word": "HANGMAN", "hint": "The name of this game"},
+        {"word": "CODING", "hint": "The act of writing computer programs"},
+        {"word": "ALGORITHM", "hint": "A step-by-step procedure for calculations"},
+        {"word": "DATABASE", "hint": "An organized collection of structured information"},
+        {"word": "SERVER", "hint": "Provides functionality for other programs or devices"},
+        {"word": "BROWSER", "hint": "Application for accessing the World Wide Web"},
+        {"word": "VARIABLE", "hint": "A container for storing data values"},
+        {"word": "INTERNET", "hint": "Global network of computers"},
+        {"word": "KEYBOARD", "hint": "Input device with keys"},
+        {"word": "MONITOR", "hint": "Output device that displays video"},
+        {"word": "SOFTWARE", "hint": "Instructions that tell a computer what to do"},
+        {"word": "HARDWARE", "hint": "Physical parts of a computer"},
+        {"word": "JAVASCRIPT", "hint": "Language of the web"},
+        {"word": "COMPILER", "hint": "Translates code into machine language"},
+        {"word": "ENCRYPTION", "hint": "Scrambling data for security"},
+        {"word": "FIREWALL", "hint": "Network security system"},
+        {"word": "ROBOTICS", "hint": "Branch of technology dealing with robots"},
+        {"word": "ARTIFICIAL INTELLIGENCE", "hint": "Simulation of human intelligence by machines"},
+        {"word": "CLOUD COMPUTING", "hint": "Delivery of computing services over the internet"},
+        {"word": "DEBUGGING", "hint": "Finding and fixing errors in code"},
+        {"word": "PIXEL", "hint": "Smallest unit of a digital image"},
+        {"word": "BANDWIDTH", "hint": "Maximum data transfer rate of a network"},
+        {"word": "CACHE", "hint": "Hardware or software component that stores data"},
+        {"word": "LINUX", "hint": "Open source operating system"},
+        {"word": "WINDOWS", "hint": "Operating system developed by Microsoft"},
+        {"word": "APPLE", "hint": "Tech company known for iPhones and Macs"}
+    ],
+    "Animals": [
+        {"word": "ELEPHANT", "hint": "The largest land animal"},
+        {"word": "GIRAFFE", "hint": "Has a very long neck"},
+        {"word": "PENGUIN", "hint": "A flightless bird that lives in the cold"},
+        {"word": "DOLPHIN", "hint": "A highly intelligent marine mammal"},
+        {"word": "KANGAROO", "hint": "A marsupial from Australia that hops"},
+        {"word": "LION", "hint": "The king of the jungle"},
+        {"word": "ZEBRA", "hint": "A horse-like animal with black and white stripes"},
+        {"word": "OCTOPUS", "hint": "A sea creature with eight arms"},
+        {"word": "SQUIRREL", "hint": "Small rodent with a bushy tail"},
+        {"word": "CHAMELEON", "hint": "Lizard known for changing colors"},
+        {"word": "CHEETAH", "hint": "Fastest land animal"},
+        {"word": "WHALE", "hint": "Largest marine mammal"},
+        {"word": "EAGLE", "hint": "Large bird of prey"},
+        {"word": "SHARK", "hint": "Predatory fish with cartilage skeleton"},
+        {"word": "PANDA", "hint": "Bear native to China that eats bamboo"},
+        {"word": "KOALA", "hint": "Australian marsupial that eats eucalyptus"},
+        {"word": "GORILLA", "hint": "Largest living primate"},
+        {"word": "WOLF", "hint": "Wild dog that travels in packs"},
+        {"word": "TIGER", "hint": "Largest cat species"},
+        {"word": "POLAR BEAR", "hint": "White bear from the Arctic"},
+        {"word": "RHINOCEROS", "hint": "Large herbivore with a horn on its nose"},
+        {"word": "HIPPOPOTAMUS", "hint": "Large semi-aquatic mammal from Africa"},
+        {"word": "CROCODILE", "hint": "Large aquatic reptile"},
+        {"word": "FLAMINGO", "hint": "Pink wading bird"},
+        {"word": "OWL", "hint": "Nocturnal bird of prey"},
+        {"word": "BUTTERFLY", "hint": "Insect with colorful wings"},
+        {"word": "TURTLE", "hint": "Reptile with a shell"},
+        {"word": "SLOTH", "hint": "Slow-moving tropical mammal"},
+        {"word": "OTTER", "hint": "Playful semi-aquatic mammal"}
+    ],
+    "Fruits": [
+        {"word": "BANANA", "hint": "A long curved yellow fruit"},
+        {"word": "STRAWBERRY", "hint": "Red fruit with seeds on the outside"},
+        {"word": "PINEAPPLE", "hint": "Tropical fruit with spiky skin"},
+        {"word": "WATERMELON", "hint": "Large green fruit with red flesh"},
+        {"word": "ORANGE", "hint": "A citrus fruit that shares its name with a color"},
+        {"word": "GRAPES", "hint": "Small round fruit used to make wine"},
+        {"word": "MANGO", "hint": "Tropical stone fruit with sweet yellow flesh"},
+        {"word": "AVOCADO", "hint": "Green fruit with a large pit, used in guacamole"},
+        {"word": "BLUEBERRY", "hint": "Small blue round berry"},
+        {"word": "KIWI", "hint": "Small brown fuzzy fruit with green flesh"},
+        {"word": "APPLE", "hint": "Common round fruit, red or green"},
+        {"word": "PEAR", "hint": "Sweet fruit with a narrow top and wide bottom"},
+        {"word": "CHERRY", "hint": "Small red stone fruit"},
+        {"word": "LEMON", "hint": "Sour yellow citrus fruit"},
+        {"word": "LIME", "hint": "Sour green citrus fruit"},
+        {"word": "PEACH", "hint": "Soft fuzzy fruit with a stone"},
+        {"word": "PLUM", "hint": "Purple fruit with a stone"},
+        {"word": "RASPBERRY", "hint": "Red aggregate fruit"},
+        {"word": "BLACKBERRY", "hint": "Dark purple aggregate fruit"},
+        {"word": "COCONUT", "hint": "Large seed with hard shell and white meat"},
+        {"word": "PAPAYA", "hint": "Tropical fruit with orange flesh and black seeds"},
+        {"word": "POMEGRANATE", "hint": "Fruit with many red juicy seeds"},
+        {"word": "DRAGONFRUIT", "hint": "Cactus fruit with pink skin and scales"},
+        {"word": "FIG", "hint": "Sweet fruit with many tiny seeds"},
+        {"word": "GUAVA", "hint": "Tropical fruit with pink or white flesh"},
+        {"word": "APRICOT", "hint": "Small orange fruit similar to a peach"},
+        {"word": "CANTALOUPE", "hint": "Melon with orange flesh"},
+        {"word": "GRAPEFRUIT", "hint": "Large sour citrus fruit"},
+        {"word": "LYCHEE", "hint": "Small fruit with rough red skin and white flesh"}
+    ],
+    "Countries": [
+        {"word": "FRANCE", "hint": "Home to the Eiffel Tower"},
+        {"word": "JAPAN", "hint": "Island nation known for sushi and anime"},
+        {"word": "BRAZIL", "hint": "Largest country in South America"},
+        {"word": "EGYPT", "hint": "Famous for pyramids and pharaohs"},
+        {"word": "AUSTRALIA", "hint": "Country and continent known for the Outback"},
+        {"word": "CANADA", "hint": "North American country known for maple syrup"},
+        {"word": "ITALY", "hint": "Boot-shaped country famous for pizza and pasta"},
+        {"word": "INDIA", "hint": "South Asian country with the Taj Mahal"},
+        {"word": "GERMANY", "hint": "European country known for Oktoberfest"},
+        {"word": "MEXICO", "hint": "North American country known for tacos and mariachi"},
+        {"word": "CHINA", "hint": "Most populous country in Asia"},
+        {"word": "UNITED STATES", "hint": "Country with 50 states"},
+        {"word": "UNITED KINGDOM", "hint": "Island nation in Europe"},
+        {"word": "RUSSIA", "hint": "Largest country by land area"},
+        {"word": "SPAIN", "hint": "European country known for bullfighting"},
+        {"word": "ARGENTINA", "hint": "South American country famous for tango"},
+        {"word": "SOUTH AFRICA", "hint": "Country at the southern tip of Africa"},
+        {"word": "THAILAND", "hint": "Southeast Asian country known for beaches and temples"},
+        {"word": "VIETNAM", "hint": "Southeast Asian country known for pho"},
+        {"word": "GREECE", "hint": "Cradle of Western civilization"},
+        {"word": "TURKEY", "hint": "Country bridging Europe and Asia"},
+        {"word": "SWEDEN", "hint": "Scandinavian country known for IKEA"},
+        {"word": "NORWAY", "hint": "Scandinavian country known for fjords"},
+        {"word": "SWITZERLAND", "hint": "Neutral country known for watches and chocolate"},
+        {"word": "NETHERLANDS", "hint": "Country known for tulips and windmills"},
+        {"word": "PERU", "hint": "Home to Machu Picchu"},
+        {"word": "NEW ZEALAND", "hint": "Island nation near Australia"},
+        {"word": "IRELAND", "hint": "The Emerald Isle"},
+        {"word": "PORTUGAL", "hint": "Country on the Iberian Peninsula"}
+    ]
+}
+
+
+# ----------------------------------------------------------------------
+# Reading the sources
+# ----------------------------------------------------------------------
+
+
+def _word_record(source, category, precomputed):
+    """Normalize a curriculum-style word dict; returns None without a word."""
+    word = (source.get("word") or "").strip().upper()
+    if not word:
+        return None
+    # Hand-written curriculum content always wins over generated text
+    generated = precomputed.get((category, word), {})
+    return {
+        "word": word,
+        "hint": source.get("hint") or source.get("definition") or "",
+        "definition": source.get("definition") or generated.get("definition"),
+        "fun_fact": source.get("fun_fact") or generated.get("fun_fact"),
+        "essential_question": source.get("essential_question"),
+    }
+
+
+def _category_source(name, sources, metadata, precomputed):
+    records = (_word_record(source, name, precomputed) for source in sources)
+    return name, metadata, [record for record in records if record]
+
+
+def _base_category_sources(precomputed):
+    for name, words in BASE_CATEGORIES.items():
+        yield _category_source(name, words, {
+            "subject": "General Knowledge",
+            "grade_band": "K-8",
+            "standard": None,
+            "description": f"Fun vocabulary about {name.lower()}",
+        }, precomputed)
+
+
+def _load_precomputed_learning(path):
+    """Return {(category, word): {"definition", "fun_fact"}} from ``path``."""
+    if not path.exists():
+        return {}
+
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except Exception as exc:
+        print(f"Failed to load precomputed learning content: {exc}")
+        return {}
+
+    content = {}
+    for cat in payload.get("categories", []):
+        name = (cat.get("name") or "").strip()
+        for entry in cat.get("words", []):
+            word = (entry.get("word") or "").strip().upper()
+            if not name or not word:
+                continue
+            fields = {f: entry[f] for f in ("definition", "fun_fact") if entry.get(f)}
+            if fields:
+                content[(name, word)] = fields
+    return content
+
+
+def _curriculum_category_sources(path, precomputed, strict=False):
+    """Yield curriculum categories; an unreadable file is skipped, or raises when strict."""
+    if not path.exists():
+        return
+
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        if not isinstance(payload, dict) or not isinstance(payload.get("categories", []), list):
+            raise ValueError("expected an object with a \"categories\" list")
+    except Exception as exc:
+        if strict:
+            raise ValueError(f"{path}: {exc}") from exc
+        print(f"Failed to load curriculum categories: {exc}")
+        return
+
+    for cat in payload.get("categories", []):
+        name = (cat.get("name") or "").strip()
+        if not name:
+            continue
+
+        source = _category_source(name, cat.get("words", []), {
+            "subject": cat.get("subject"),
+            "grade_band": cat.get("grade_band"),
+            "standard": cat.get("standard"),
+            "description": cat.get("description"),
+        }, precomputed)
+        if source[2]:
+            yield source
+
+
+# ----------------------------------------------------------------------
+# Compiling
+# ----------------------------------------------------------------------
+
+
+def word_bands() -> Dict[str, Tuple[int, int]]:
+    """Difficulty -> (min, max) stripped word length."""
+    return {difficulty: settings['word_length'] for difficulty, settings in DIFFICULTY_SETTINGS.items()}
+
+
+def word_sources(curriculum_path: Path, learning_content_path: Path, strict: bool = False) -> Iterator[Source]:
+    """Built-in plus curriculum categories as (name, metadata, records) triples."""
+    precomputed = _load_precomputed_learning(learning_content_path)
+    return chain(
+        _base_category_sources(precomputed),
+        _curriculum_category_sources(curriculum_path, precomputed, strict),
+    )
+
+
+def snapshot_fingerprint(curriculum_path: Path, learning_content_path: Path) -> bytes:
+    """Fingerprint of everything a snapshot is compiled from."""
+    return source_fingerprint(
+        SNAPSHOT_VERSION, BASE_CATEGORIES, word_bands(), curriculum_path, learning_content_path
+    )
+
+
+def build_snapshot(
+    snapshot_path: str, curriculum_path: Path, learning_content_path: Path, force: bool = False
+) -> bool:
+    """Compile the word data into ``snapshot_path`` unless it is current; True if written.
+
+    Raises ValueError (unreadable curriculum) or OSError without touching the
+    existing snapshot.
+    """
+    fingerprint = snapshot_fingerprint(curriculum_path, learning_content_path)
+    if not force and open_snapshot(snapshot_path, fingerprint) is not None:
+        return False
+    sources = word_sources(curriculum_path, learning_content_path, strict=True)
+    write_snapshot(snapshot_path, sources, fingerprint, word_bands())
+    return True
@@ -0,0 +1,395 @@
+"""Compact, array-backed storage for category word lists.
+
+Curriculum words used to be one dict per word, each holding its own copies of
+the category's ``subject``/``grade_band``/``standard``/``description`` plus a
+separate string object for every field. With 100k+ words that was most of a
+worker's memory. Here every category is packed into a single image instead:
+the UTF-8 text of all words back to back, ``uint32`` field offsets, a sorted
+index for lookups, and each category's metadata stored once:
+
+    from services.word_store import load_categories, pack_categories
+
+    image = pack_categories([("Biology", {"subject": "Science"}, [{"word": "CELL", "hint": "..."}])])
+    categories = load_categories(image)      # {"Biology": CategoryWords}
+    entry = categories["Biology"][0]
+    entry["word"], entry["hint"], entry.get("subject"), entry.get("fun_fact")  # None when missing
+    categories["Biology"].find("CELL")       # binary search, no per-word dict
+
+``CategoryWords`` and ``WordEntry`` are views over the image that read like
+the old lists of dicts, so game code is unchanged. Pack while the source JSON
+is alive and load after dropping it: the long-lived objects are then created
+once the parse garbage is gone instead of pinning its half-empty arenas.
+
+The image can also be written to a versioned snapshot file and memory-mapped
+back, which costs the same few milliseconds whatever the number of words and
+shares the pages between every process that maps it:
+
+    write_snapshot(path, sources, fingerprint, bands={"easy": (3, 6)})
+    categories = open_snapshot(path, fingerprint)  # None if missing or stale
+    categories["Biology"].bands["easy"]            # WordSubset, built at pack time
+
+As with the old dicts, optional fields that are empty are simply absent;
+``word`` and ``hint`` are always present.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+FIELDS = ("word", "hint", "definition", "fun_fact", "essential_question")
+CATEGORY_FIELDS = ("subject", "grade_band", "standard", "description")
+_FIELD_INDEX = {name: number for number, name in enumerate(FIELDS)}
+_ALWAYS_PRESENT = frozenset(("word", "hint"))
+
+# Image layout (native byte order, every section 4-byte aligned):
+#   header   category count, offset count, sorted count, band id count, metadata length
+#   table    per category: word count, first offset, first sorted id, metadata start, metadata end
+#   offsets  field boundaries, absolute positions in the buffer holding the image
+#   sorted   per category, word ids ordered by (word, id)
+#   bands    per category and band, the ids of the words in that band
+#   metadata one JSON object per category: {"name": ..., "digest": ..., "bands": {band: [start, end]}, ...}
+#   text     UTF-8 of every field of every word
+_HEADER = struct.Struct("=5I")
+_TABLE_FIELDS = 5
+
+# Snapshot file: magic, format version, byte-order mark, sha256 fingerprint of
+# the sources, image length; the image follows (the header keeps it 4-aligned).
+SNAPSHOT_MAGIC = b"HMWORDS\0"
+SNAPSHOT_VERSION = 2
+_BYTE_ORDER_MARK = 0x01020304
+_SNAPSHOT_HEADER = struct.Struct("=8sII32sQ")
+
+Buffer = Union[bytes, mmap.mmap]
+CategorySource = Tuple[str, Optional[Dict[str, Any]], Iterable[Dict[str, Any]]]
+# band name -> (min, max) word length, spaces not counted
+BandRanges = Dict[str, Tuple[int, int]]
+
+
+def image_sections(
+    categories: Iterable[CategorySource], bands: Optional[BandRanges] = None, start: int = 0
+) -> List[Any]:
+    """Build the image for ``(name, metadata, records)`` triples as a list of buffers.
+
+    ``records`` are dicts with any of ``FIELDS``. A name given twice replaces
+    the earlier category, like assigning into a dict. ``bands`` are indexed
+    here, while the words are at hand, so loading never has to scan them.
+    Concatenated, the buffers form the image ``load_categories`` reads;
+    ``start`` is where the image will sit in its buffer (a multiple of 4).
+    Each category also gets a ``digest`` of its words and metadata, so two
+    images can be compared category by category.
+    """
+
+    table, offsets, sorted_ids, band_ids = array("I"), array("I"), array("I"), array("I")
+    text, metadata_blob = bytearray(), bytearray()
+    text_positions = []  # relative to the text section until its start is known
+
+    for name, metadata, records in categories:
+        words, lengths = [], []
+        digest = hashlib.sha256(json.dumps(metadata or {}, sort_keys=True).encode("utf-8"))
+        first_offset = len(text_positions)
+        text_positions.append(len(text))
+        for record in records:
+            for field in FIELDS:
+                value = record.get(field) or ""
+                if field == "word":
+                    lengths.append(len(value.replace(" ", "")))
+                value = value.encode("utf-8")
+                if field == "word":
+                    words.append(value)
+                digest.update(len(value).to_bytes(4, "little"))
+                digest.update(value)
+                text += value
+                text_positions.append(len(text))
+        # Stable sort, so find() returns the first occurrence of a duplicate word
+        first_sorted = len(sorted_ids)
+        sorted_ids.extend(sorted(range(len(words)), key=words.__getitem__))
+        band_positions = {}
+        for band, (min_length, max_length) in (bands or {}).items():
+            band_start = len(band_ids)
+            band_ids.extend(index for index, length in enumerate(lengths) if min_length <= length <= max_length)
+            band_positions[band] = [band_start, len(band_ids)]
+        meta_start = len(metadata_blob)
+        metadata_blob += json.dumps(
+            {**(metadata or {}), "name": name, "digest": digest.hexdigest(), "bands": band_positions}
+        ).encode("utf-8")
+        table.extend((len(words), first_offset, first_sorted, meta_start, len(metadata_blob)))
+
+    metadata_blob += b"\0" * (-len(metadata_blob) % 4)
+    text_start = start + _HEADER.size + 4 * (
+        len(table) + len(text_positions) + len(sorted_ids) + len(band_ids)
+    ) + len(metadata_blob)
+    offsets.extend(text_start + position for position in text_positions)
+    header = _HEADER.pack(
+        len(table) // _TABLE_FIELDS, len(offsets), len(sorted_ids), len(band_ids), len(metadata_blob)
+    )
+    return [header, table, offsets, sorted_ids, band_ids, metadata_blob, text]
+
+
+def pack_categories(categories: Iterable[CategorySource], bands: Optional[BandRanges] = None) -> mmap.mmap:
+    """Pack categories (see ``image_sections``) into an anonymous memory map.
+
+    The map lives outside the malloc heap, so the garbage left by parsing the
+    source JSON can be handed back to the OS instead of sitting under it.
+    """
+
+    sections = image_sections(categories, bands)
+    image = mmap.mmap(-1, sum(memoryview(section).nbytes for section in sections))
+    for section in sections:
+        image.write(section)
+    return image
+
+
+def load_categories(image: Buffer, start: int = 0) -> Dict[str, "CategoryWords"]:
+    """Return ``{name: CategoryWords}`` viewing a ``pack_categories`` image.
+
+    ``image`` may be ``bytes`` or an ``mmap``; nothing is copied out of it
+    except each category's metadata. ``start`` is where the image begins, as
+    passed to ``image_sections``.
+    """
+
+    count, offset_count, sorted_count, band_count, metadata_length = _HEADER.unpack_from(image, start)
+    view = memoryview(image)
+    position = start + _HEADER.size
+
+    def section(items: int) -> memoryview:
+        nonlocal position
+        part = view[position:position + 4 * items].cast("I")
+        position += 4 * items
+        return part
+
+    table = section(count * _TABLE_FIELDS)
+    offsets = section(offset_count)
+    sorted_ids = section(sorted_count)
+    band_ids = section(band_count)
+    metadata_start = position
+
+    categories: Dict[str, CategoryWords] = {}
+    for number in range(count):
+        word_count, first_offset, first_sorted, meta_start, meta_end = table[
+            number * _TABLE_FIELDS:(number + 1) * _TABLE_FIELDS
+        ]
+        metadata = json.loads(bytes(view[metadata_start + meta_start:metadata_start + meta_end]))
+        name = sys.intern(metadata.pop("name"))
+        digest = metadata.pop("digest", None)
+        band_positions = metadata.pop("bands", {})
+        # A handful of values repeated across categories (subjects, grade bands)
+        metadata = {key: sys.intern(value) if isinstance(value, str) else value for key, value in metadata.items()}
+        words = categories[name] = CategoryWords(
+            name,
+            metadata,
+            image,
+            offsets[first_offset:first_offset + word_count * len(FIELDS) + 1],
+            sorted_ids[first_sorted:first_sorted + word_count],
+        )
+        words.digest = digest
+        words.bands = {
+            sys.intern(band): WordSubset(words, band_ids[band_start:band_end])
+            for band, (band_start, band_end) in band_positions.items()
+        }
+    return categories
+
+
+# ----------------------------------------------------------------------
+# Snapshot files
+# ----------------------------------------------------------------------
+def source_fingerprint(*parts: Any) -> bytes:
+    """sha256 over ``parts`` (JSON-serialisable; paths stand for their size and mtime)."""
+
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, Path):
+            try:
+                stat = part.stat()
+                part = [str(part), stat.st_size, stat.st_mtime_ns]
+            except FileNotFoundError:
+                part = [str(part), None]
+        digest.update(json.dumps(part, sort_keys=True, default=str).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.digest()
+
+
+def write_snapshot(
+    path: Union[str, Path],
+    categories: Iterable[CategorySource],
+    fingerprint: bytes,
+    bands: Optional[BandRanges] = None,
+) -> int:
+    """Write categories to a snapshot file atomically; returns its size in bytes.
+
+    The file is written next to ``path`` and renamed over it, so processes
+    that still map the previous snapshot keep reading a consistent image.
+    """
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    sections = image_sections(categories, bands, start=_SNAPSHOT_HEADER.size)
+    length = sum(memoryview(section).nbytes for section in sections)
+    header = _SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, _BYTE_ORDER_MARK, fingerprint, length)
+    temporary = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(temporary, "wb") as handle:
+            handle.write(header)
+            for section in sections:
+                handle.write(section)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temporary, path)
+    finally:
+        if temporary.exists():
+            temporary.unlink()
+    return len(header) + length
+
+
+def open_snapshot(path: Union[str, Path], fingerprint: Optional[bytes]) -> Optional[Dict[str, "CategoryWords"]]:
+    """Memory-map a snapshot read-only; None if it is missing, stale or from another format.
+
+    A ``fingerprint`` of None accepts whatever sources the snapshot was built
+    from (the last good word data when the sources cannot be compiled).
+    """
+
+    try:
+        with open(path, "rb") as handle:
+            if os.fstat(handle.fileno()).st_size < _SNAPSHOT_HEADER.size:
+                return None
+            image = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    except FileNotFoundError:
+        return None
+
+    magic, version, byte_order, stored_fingerprint, length = _SNAPSHOT_HEADER.unpack_from(image)
+    if (
+        magic != SNAPSHOT_MAGIC
+        or version != SNAPSHOT_VERSION
+        or byte_order != _BYTE_ORDER_MARK
+        or fingerprint is not None and stored_fingerprint != fingerprint
+        or len(image) != _SNAPSHOT_HEADER.size + length
+    ):
+        image.close()
+        return None
+    return load_categories(image, _SNAPSHOT_HEADER.size)
+
+
+class CategoryWords(Sequence):
+    """All words of one category, packed; ``self[i]`` is a ``WordEntry`` view."""
+
+    __slots__ = ("name", "metadata", "digest", "bands", "_text", "_offsets", "_sorted")
+
+    def __init__(self, name: str, metadata: Dict[str, Any], text: Buffer, offsets: Sequence, sorted_ids: Sequence) -> None:
+        self.name = name
+        self.metadata = metadata  # shared by every word of the category
+        self.digest: Optional[str] = None  # sha256 of words and metadata, when packed with one
+        self.bands: Dict[str, WordSubset] = {}  # band name -> words, when packed with bands
+        self._text = text
+        self._offsets = offsets  # len(FIELDS) * len(self) + 1 field boundaries into text
+        self._sorted = sorted_ids
+
+    # ------------------------------------------------------------------
+    # Sequence API
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._sorted)
+
+    def __getitem__(self, index: int) -> "WordEntry":  # type: ignore[override]
+        count = len(self._sorted)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("word index out of range")
+        return WordEntry(self, index)
+
+    def __iter__(self) -> Iterator["WordEntry"]:
+        for index in range(len(self._sorted)):
+            yield WordEntry(self, index)
+
+    def __repr__(self) -> str:
+        return f"<CategoryWords {self.name!r}: {len(self)} words>"
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+    def field(self, index: int, number: int) -> str:
+        slot = index * len(FIELDS) + number
+        return self._text[self._offsets[slot]:self._offsets[slot + 1]].decode("utf-8")
+
+    def _word_bytes(self, index: int) -> bytes:
+        slot = index * len(FIELDS)
+        return self._text[self._offsets[slot]:self._offsets[slot + 1]]
+
+    def find(self, word: str) -> Optional["WordEntry"]:
+        """Return the first entry whose word is ``word``, or None."""
+
+        target = word.encode("utf-8")
+        low, high = 0, len(self._sorted)
+        while low < high:
+            middle = (low + high) // 2
+            if self._word_bytes(self._sorted[middle]) < target:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(self._sorted) and self._word_bytes(self._sorted[low]) == target:
+            return WordEntry(self, self._sorted[low])
+        return None
+
+    def subset(self, indexes: Iterable[int]) -> "WordSubset":
+        return WordSubset(self, array("I", indexes))
+
+
+class WordSubset(Sequence):
+    """Index-backed view of some words of a ``CategoryWords`` (a difficulty band)."""
+
+    __slots__ = ("words", "_ids")
+
+    def __init__(self, words: CategoryWords, ids: Sequence) -> None:
+        self.words = words
+        self._ids = ids  # an array("I"), or a uint32 view into the image
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __getitem__(self, index: int) -> "WordEntry":  # type: ignore[override]
+        return WordEntry(self.words, self._ids[index])
+
+    def __iter__(self) -> Iterator["WordEntry"]:
+        for index in self._ids:
+            yield WordEntry(self.words, index)
+
+
+class WordEntry(Mapping):
+    """Read-only view of one word; behaves like ``{"word": ..., "hint": ..., ...}``."""
+
+    __slots__ = ("words", "index")
+
+    def __init__(self, words: CategoryWords, index: int) -> None:
+        self.words = words
+        self.index = index
+
+    def __getitem__(self, key: str) -> Any:
+        number = _FIELD_INDEX.get(key)
+        if number is not None:
+            value = self.words.field(self.index, number)
+            if value or key in _ALWAYS_PRESENT:
+                return value
+        elif key in CATEGORY_FIELDS:
+            value = self.words.metadata.get(key)
+            if value:
+                return value
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for key in FIELDS + CATEGORY_FIELDS:
+            if key in self:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"WordEntry({dict(self)!r})"
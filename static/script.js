@@ -1131,6 +1131,7 @@ function showVoiceFeedback(text) {
 let currentMode = 'random';
 let lastGameData = null;
 let currentLearningInfo = null;
+let learningPollKey = null;
 
 // Category themes configuration
 const categoryThemes = {
@@ -1555,14 +1556,29 @@ async function showAIHint() {
     aiHintText.style.display = 'block';
     
     try {
-        const response = await fetch('/api/ai-hint', {
+        const response = await fetch('/api/ai-hint/stream', {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json'
             }
         });
         
-        const data = await response.json();
+        // Errors before streaming starts come back as plain JSON
+        let data;
+        if (isEventStream(response)) {
+            let streamedText = '';
+            await readEventStream(response, (event, payload) => {
+                if (event === 'delta') {
+                    streamedText += payload.text;
+                    aiHintText.textContent = streamedText;
+                } else {
+                    data = payload;
+                }
+            });
+            data = data || { error: 'Hint stream ended early' };
+        } else {
+            data = await response.json();
+        }
         
         if (data.success && data.hint) {
             aiHintText.textContent = data.hint;
@@ -1778,7 +1794,103 @@ function updateLearningCard(info) {
     if (toggle) toggle.textContent = '📚 Show Curriculum Info';
 }
 
-function showCurriculumFact(info) {
+function isEventStream(response) {
+    return response.ok && (response.headers.get('Content-Type') || '').startsWith('text/event-stream');
+}
+
+// Minimal server-sent events reader for fetch() responses (EventSource can't POST)
+async function readEventStream(response, onEvent) {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    for (;;) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        let boundary;
+        while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+            const block = buffer.slice(0, boundary);
+            buffer = buffer.slice(boundary + 2);
+            let event = 'message';
+            let data = '';
+            for (const line of block.split('\n')) {
+                if (line.startsWith('event:')) event = line.slice(6).trim();
+                else if (line.startsWith('data:')) data += line.slice(5).trim();
+            }
+            if (data) onEvent(event, JSON.parse(data));
+        }
+    }
+}
+
+function applyLearningInfo(info) {
+    currentLearningInfo = info;
+    if (lastGameData) lastGameData.learning = info;
+    updateLearningCard(info);
+    if (lastGameData && lastGameData.game_over) {
+        showCurriculumFact(info);
+    }
+}
+
+// Stream learning info as it is generated; returns true once it has arrived
+async function streamLearningInfo(key, params) {
+    const response = await fetch(`/api/learning/stream?${params}`);
+    if (!isEventStream(response)) return false;
+    let delivered = false;
+    await readEventStream(response, (event, data) => {
+        if (learningPollKey !== key) return; // a different game took over
+        if (event === 'partial' && lastGameData && lastGameData.game_over) {
+            showCurriculumFact(data.learning, false);
+        } else if (event === 'learning' && data.learning) {
+            applyLearningInfo(data.learning);
+            delivered = true;
+        }
+    });
+    return delivered;
+}
+
+// Learning info is generated in the background; stream it, falling back to long-polling
+async function pollLearningInfo(mode, category) {
+    const key = `${mode}|${category}`;
+    if (learningPollKey === key) return; // already polling for this game
+    learningPollKey = key;
+
+    const params = new URLSearchParams({ mode, wait: 8 });
+    if (category) params.set('category', category);
+
+    const streamParams = new URLSearchParams({ mode });
+    if (category) streamParams.set('category', category);
+    try {
+        if (await streamLearningInfo(key, streamParams)) {
+            if (learningPollKey === key) learningPollKey = null;
+            return;
+        }
+    } catch (error) {
+        console.error('Error streaming learning info:', error);
+    }
+
+    for (let attempt = 0; attempt < 5 && learningPollKey === key; attempt++) {
+        try {
+            const response = await fetch(`/api/learning?${params}`);
+            if (!response.ok) break;
+            const data = await response.json();
+            if (learningPollKey !== key) return; // a different game took over
+            if (data.learning) {
+                applyLearningInfo(data.learning);
+                break;
+            }
+            // The server is holding too many polls open; try again shortly
+            if (data.retry_after) {
+                await new Promise(resolve => setTimeout(resolve, data.retry_after * 1000));
+            }
+        } catch (error) {
+            console.error('Error fetching learning info:', error);
+            break;
+        }
+    }
+    if (learningPollKey === key) learningPollKey = null;
+}
+
+function showCurriculumFact(info, announce = true) {
     const container = document.getElementById('fun-fact-container');
     const textEl = document.getElementById('fun-fact-text');
     if (!container || !textEl) return;
@@ -1799,8 +1911,8 @@ function showCurriculumFact(info) {
     textEl.innerHTML = segments.join('<br>');
     container.style.display = 'block';
     
-    // Speak the fact if voice is enabled
-    if (voiceEnabled) {
+    // Speak the fact if voice is enabled (not for partial, still-streaming text)
+    if (announce && voiceEnabled) {
         speak(speechSegments.join('. '));
     }
 }
@@ -1894,11 +2006,15 @@ function updateUI(data) {
     }
 
     if (data.learning) {
+        learningPollKey = null;
         currentLearningInfo = data.learning;
         updateLearningCard(data.learning);
     } else {
         currentLearningInfo = null;
         updateLearningCard(null);
+        if (data.learning_pending) {
+            pollLearningInfo(mode, data.category);
+        }
     }
     
     const messageEl = document.getElementById('message');
@@ -0,0 +1,18 @@
+import os
+import tempfile
+
+# app.py configures its stores from the environment at import time; keep test
+# runs off the repo's instance/ directory, the network and background threads.
+_INSTANCE = tempfile.mkdtemp(prefix="hangman-tests-")
+for name, value in {
+    "CLAUDE_API_KEY": "test",
+    "CLAUDE_BASE_URL": "http://127.0.0.1:9",
+    "CLAUDE_MAX_ATTEMPTS": "1",
+    "SESSION_BACKEND": "memory",
+    "LEARNING_CACHE_PATH": os.path.join(_INSTANCE, "learning_cache.sqlite3"),
+    "DAILY_DB_PATH": os.path.join(_INSTANCE, "daily.sqlite3"),
+    "TOPIC_BANK_PATH": os.path.join(_INSTANCE, "topic_banks.sqlite3"),
+    "WORD_SNAPSHOT_PATH": "",
+    "CURRICULUM_RELOAD_INTERVAL": "0",
+}.items():
+    os.environ.setdefault(name, value)
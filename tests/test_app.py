@@ -0,0 +1,231 @@
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+import app as hangman
+from services.claude_client import ClaudeConnectionError, ClaudeHTTPError
+
+
+@pytest.fixture
+def client():
+    return hangman.app.test_client()
+
+
+@pytest.mark.parametrize("mode", ["random", "daily"])
+def test_streamed_hint_keeps_guesses_made_while_streaming(client, monkeypatch, mode):
+    monkeypatch.setattr(hangman, "_ready_ai_hint", lambda *args: None)
+    monkeypatch.setattr(hangman, "_claude_stream_text", lambda **kwargs: iter(["Runs ", "on ", "code"]))
+    prefix = "/api/daily" if mode == "daily" else "/api"
+    client.post(f"{prefix}/start", json={"category": "Technology"})
+
+    stream = client.post("/api/ai-hint/stream", buffered=False)
+    events = iter(stream.response)
+    next(events)  # first delta: the session is loaded, Claude is still writing
+    guessed = client.post(f"{prefix}/guess", json={"letter": "E", "category": "Technology"}).get_json()
+    body = b"".join(events)
+    stream.close()
+
+    assert b'"hint": "Runs on code"' in body
+    status = client.get(f"{prefix}/status?category=Technology").get_json()
+    assert status["guesses"] == guessed["guesses"] == ["E"]
+
+    seen = []
+    monkeypatch.setattr(hangman, "_ready_ai_hint", lambda game, mask, history: seen.append(history) or "Beeps")
+    client.post("/api/ai-hint/stream").get_data()
+    assert seen == [["Runs on code"]]
+
+
+@pytest.mark.parametrize("mode", ["random", "daily"])
+def test_learning_long_poll_keeps_guesses_made_while_waiting(client, monkeypatch, mode):
+    waiting, release = threading.Event(), threading.Event()
+    info = {"definition": "d", "fun_fact": "f", "category": "Technology"}
+
+    def request_learning_info(word_data, category, wait=0):
+        if not wait:
+            return None
+        waiting.set()
+        release.wait(5)
+        return info
+
+    monkeypatch.setattr(hangman, "request_learning_info", request_learning_info)
+    monkeypatch.setattr(hangman, "_has_own_learning_content", lambda word_data: False)
+    prefix = "/api/daily" if mode == "daily" else "/api"
+    client.post(f"{prefix}/start", json={"category": "Technology"})
+    since = client.get(f"{prefix}/status?category=Technology&delta=1").get_json()["state"]
+
+    poller = hangman.app.test_client()
+    poller.set_cookie("session", client.get_cookie("session").value)
+    polled = {}
+    thread = threading.Thread(
+        target=lambda: polled.update(poller.get(f"/api/learning?mode={mode}&category=Technology&wait=5").get_json())
+    )
+    thread.start()
+    assert waiting.wait(5)
+    client.post(f"{prefix}/guess", json={"letter": "E", "category": "Technology"})
+    release.set()
+    thread.join(5)
+
+    assert polled["learning"] == info
+    delta = client.get(f"{prefix}/status?category=Technology&delta=1&since={since}").get_json()
+    assert delta["guesses_added"] == ["E"]
+
+
+def test_learning_long_poll_answers_at_once_when_all_slots_are_taken(client, monkeypatch):
+    monkeypatch.setattr(hangman, "request_learning_info", lambda *args, **kwargs: None)
+    client.post("/api/start", json={"category": "Technology"})
+    monkeypatch.setattr(hangman, "_LEARNING_POLL_SLOTS", threading.BoundedSemaphore(1))
+    hangman._LEARNING_POLL_SLOTS.acquire()
+
+    polled = client.get("/api/learning?wait=5").get_json()
+    assert polled["learning_pending"] is True
+    assert polled["retry_after"] == hangman.LEARNING_POLL_RETRY_AFTER
+
+
+def _fake_topic_words(monkeypatch):
+    def generate(topic, difficulty, avoid_words=None):
+        words = {"easy": ["CAT", "DOG"], "hard": ["ELEPHANT", "PLATYPUS"]}[difficulty]
+        return [{"word": word, "hint": f"{difficulty} {word.lower()}"} for word in words]
+
+    monkeypatch.setattr(hangman, "generate_custom_words_with_ai", generate)
+    monkeypatch.setattr(hangman, "request_learning_batch", lambda items: None)
+
+
+def test_custom_topics_are_indexed_per_difficulty(client, monkeypatch):
+    _fake_topic_words(monkeypatch)
+    client.post("/api/start", json={"category": "Custom", "custom_topic": "  Zoo   Animals ", "difficulty": "easy"})
+    started = client.post("/api/start", json={"category": "Custom", "custom_topic": "zoo animals", "difficulty": "hard"})
+
+    assert started.get_json()["category"] == "AI: zoo animals"
+    assert hangman._lookup_word_entry("AI: Zoo Animals", "CAT")["hint"] == "easy cat"
+    assert hangman._lookup_word_entry("AI: Zoo Animals", "PLATYPUS")["hint"] == "hard platypus"
+
+
+def test_custom_category_follows_the_bank_version(client, monkeypatch):
+    _fake_topic_words(monkeypatch)
+    client.post("/api/start", json={"category": "Custom", "custom_topic": "Farm", "difficulty": "easy"})
+    hangman.TOPIC_BANK.add("Farm", "easy", [{"word": "HEN", "hint": "lays eggs"}])
+
+    assert "HEN" in hangman._custom_category("Farm", "easy").by_word
+
+
+def test_categories_only_list_the_players_own_topics(client, monkeypatch):
+    _fake_topic_words(monkeypatch)
+    other = hangman.app.test_client()
+    other.post("/api/start", json={"category": "Custom", "custom_topic": "My Secret", "difficulty": "easy"})
+    client.post("/api/start", json={"category": "Custom", "custom_topic": "Pets", "difficulty": "easy"})
+
+    categories = client.get("/api/categories?include_custom=1").get_json()
+    assert "AI: Pets" in categories
+    assert "AI: My Secret" not in categories
+    assert "AI: Pets" not in client.get("/api/categories").get_json()
+
+
+@pytest.fixture
+def reload_state(monkeypatch):
+    monkeypatch.setattr(hangman, "WORD_SNAPSHOT_PATH", "snapshot.bin")
+    monkeypatch.setattr(hangman, "_word_snapshot_fingerprint", lambda: "edited")
+    monkeypatch.setattr(hangman, "_loaded_fingerprint", "original")
+    monkeypatch.setattr(hangman, "_reload_failures", 0)
+    monkeypatch.setattr(hangman, "_reload_retry_at", 0.0)
+
+
+def _failing_compile(monkeypatch, exc):
+    calls = []
+
+    def compile_snapshot(fingerprint):
+        calls.append(fingerprint)
+        raise exc
+
+    monkeypatch.setattr(hangman, "_compile_word_snapshot", compile_snapshot)
+    return calls
+
+
+def test_reload_does_not_retry_invalid_sources(monkeypatch, reload_state):
+    calls = _failing_compile(monkeypatch, ValueError("bad json"))
+
+    with pytest.raises(ValueError):
+        hangman.reload_categories()
+    assert hangman.reload_categories() == []
+    assert calls == ["edited"]
+
+
+def test_reload_retries_transient_errors_after_a_backoff(monkeypatch, reload_state):
+    calls = _failing_compile(monkeypatch, RuntimeError("compile timed out"))
+
+    with pytest.raises(RuntimeError):
+        hangman.reload_categories()
+    assert hangman.reload_categories() == []
+    assert hangman._loaded_fingerprint == "original"
+
+    monkeypatch.setattr(hangman, "_reload_retry_at", 0.0)
+    with pytest.raises(RuntimeError):
+        hangman.reload_categories()
+    assert calls == ["edited", "edited"]
+
+
+def test_importing_the_app_starts_no_watcher():
+    check = "import threading, app; print(sorted(t.name for t in threading.enumerate()))"
+    env = {**os.environ, "CURRICULUM_RELOAD_INTERVAL": "5"}
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run([sys.executable, "-c", check], cwd=root, env=env, capture_output=True, text=True, check=True)
+    assert "curriculum-watcher" not in result.stdout
+
+
+def test_snapshot_compile_does_not_import_the_app(tmp_path):
+    check = (
+        "import sys; from scripts import build_word_snapshot as script; "
+        "sys.argv = ['build_word_snapshot']; code = script.main(); print(code, 'app' in sys.modules)"
+    )
+    env = {**os.environ, "WORD_SNAPSHOT_PATH": str(tmp_path / "words.bin"), "DAILY_PRECOMPUTE": "1"}
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run([sys.executable, "-c", check], cwd=root, env=env, capture_output=True, text=True, check=True)
+    assert result.stdout.splitlines()[-1] == "0 False"
+    categories = hangman.open_snapshot(tmp_path / "words.bin", hangman._word_snapshot_fingerprint())
+    assert set(categories) == set(hangman.CATEGORIES)
+
+
+def test_a_game_is_never_served_the_same_pooled_hint_twice(client, monkeypatch):
+    monkeypatch.setattr(hangman, "_hint_pool_key", lambda *args: ("pool-test",))
+    monkeypatch.setattr(hangman, "_generate_pooled_hint", lambda *args: "fresh")
+    pooled = {f"hint {n}" for n in range(hangman.HINT_POOL.max_hints_per_key)}
+    for hint in pooled:
+        hangman.HINT_POOL.add(("pool-test",), hint)
+    client.post("/api/start", json={"category": "Technology"})
+
+    served = [client.post("/api/ai-hint").get_json()["hint"] for _ in range(len(pooled) + 1)]
+
+    assert set(served[:-1]) == pooled
+    assert served[-1] == "fresh"
+
+
+def _raise(exc):
+    raise exc
+
+
+@pytest.mark.parametrize("status, fallback", [(529, True), (400, False)])
+def test_hint_falls_back_once_claude_retries_are_spent(client, monkeypatch, status, fallback):
+    monkeypatch.setattr(hangman, "_ready_ai_hint", lambda *args: None)
+    monkeypatch.setattr(hangman, "_generate_pooled_hint", lambda *args: _raise(ClaudeHTTPError("no", status)))
+    client.post("/api/start", json={"category": "Technology"})
+
+    response = client.post("/api/ai-hint")
+
+    assert response.status_code == (200 if fallback else 500)
+    assert response.get_json().get("fallback", False) is fallback
+
+
+def test_streamed_hint_falls_back_when_the_connection_fails(client, monkeypatch):
+    def deltas(**kwargs):
+        raise ClaudeConnectionError("refused")
+        yield  # pragma: no cover
+
+    monkeypatch.setattr(hangman, "_ready_ai_hint", lambda *args: None)
+    monkeypatch.setattr(hangman, "_claude_stream_text", deltas)
+    client.post("/api/start", json={"category": "Technology"})
+
+    body = client.post("/api/ai-hint/stream").get_data()
+
+    assert b'"fallback": true' in body
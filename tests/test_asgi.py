@@ -0,0 +1,98 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+import app as hangman
+import asgi
+
+
+@pytest.fixture
+def server():
+    return asgi.create_app(threads=4)
+
+
+async def _call(server, method, path, body=None, cookie=None):
+    payload = json.dumps(body).encode() if body is not None else b""
+    headers = [(b"content-type", b"application/json")]
+    if cookie:
+        headers.append((b"cookie", cookie.encode()))
+    scope = {"type": "http", "method": method, "path": path, "query_string": b"", "headers": headers}
+    messages = [{"type": "http.request", "body": payload, "more_body": False}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    await server(scope, receive, send)
+    start = sent[0]
+    headers = {name.decode(): value.decode() for name, value in start["headers"]}
+    return start["status"], headers, b"".join(message.get("body", b"") for message in sent[1:])
+
+
+class FakeAsyncClaude:
+    def __init__(self, expected):
+        self.expected = expected
+        self.prompts = []
+        self.waiting = 0
+        self.all_waiting = asyncio.Event()
+
+    async def generate_text(self, **kwargs):
+        assert threading.current_thread() is threading.main_thread()  # on the event loop
+        self.prompts.append(kwargs["prompt"])
+        self.waiting += 1
+        if self.waiting == self.expected:
+            self.all_waiting.set()
+        await self.all_waiting.wait()
+        return "Fake hint"
+
+
+def test_hints_wait_on_claude_together_on_the_event_loop(server, monkeypatch):
+    monkeypatch.setattr(hangman, "_hint_pool_key", lambda *args: ("asgi-test",))
+
+    async def scenario():
+        status, headers, _ = await _call(server, "POST", "/api/start", {"category": "Technology"})
+        assert status == 200
+        cookie = headers["set-cookie"].split(";", 1)[0]
+        claude = FakeAsyncClaude(expected=20)
+        monkeypatch.setattr(hangman, "get_shared_async_client", lambda: claude)
+        monkeypatch.setattr(hangman.HINT_POOL, "pick", lambda *args, **kwargs: None)
+
+        replies = await asyncio.wait_for(
+            asyncio.gather(*(_call(server, "POST", "/api/ai-hint", cookie=cookie) for _ in range(20))), 5
+        )
+        assert {(status, json.loads(body)["hint"]) for status, _, body in replies} == {(200, "Fake hint")}
+
+        claude.expected, claude.waiting = 1, 0
+        claude.all_waiting.clear()
+        await _call(server, "POST", "/api/ai-hint", cookie=cookie)
+        assert "Avoid repeating these previous hints: Fake hint" in claude.prompts[-1]
+
+    asyncio.run(scenario())
+
+
+def test_async_hint_falls_back_when_claude_is_down(server, monkeypatch):
+    class DownClaude:
+        async def generate_text(self, **kwargs):
+            raise hangman.ClaudeUnavailableError("circuit open")
+
+    async def scenario():
+        _, headers, _ = await _call(server, "POST", "/api/start", {"category": "Technology"})
+        monkeypatch.setattr(hangman, "get_shared_async_client", DownClaude)
+        monkeypatch.setattr(hangman.HINT_POOL, "pick", lambda *args, **kwargs: None)
+        cookie = headers["set-cookie"].split(";", 1)[0]
+        return await _call(server, "POST", "/api/ai-hint", cookie=cookie)
+
+    status, _, body = asyncio.run(scenario())
+    assert status == 200 and json.loads(body)["fallback"] is True
+
+
+def test_other_routes_run_through_the_wsgi_app(server):
+    status, headers, body = asyncio.run(_call(server, "GET", "/api/categories"))
+
+    assert status == 200 and headers["content-type"] == "application/json"
+    assert "Technology" in json.loads(body)
@@ -0,0 +1,138 @@
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+import httpx
+import pytest
+import requests
+
+from services.claude_client import (
+    AsyncClaudeClient,
+    ClaudeClient,
+    ClaudeClientError,
+    ClaudeUnavailableError,
+    SingleFlight,
+)
+from services.resilience import CircuitBreaker, RetryPolicy
+
+
+def _slow_leader(flight, key, release, result="done"):
+    started = threading.Event()
+
+    def fn():
+        started.set()
+        release.wait(5)
+        return result
+
+    pool = ThreadPoolExecutor(max_workers=1)
+    leader = pool.submit(flight.do, key, fn)
+    started.wait(5)
+    pool.shutdown(wait=False)
+    return leader
+
+
+def test_single_flight_shares_the_leaders_result():
+    flight, release = SingleFlight(), threading.Event()
+    leader = _slow_leader(flight, "k", release)
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        follower = pool.submit(flight.do, "k", lambda: "not called")
+        release.set()
+        assert (leader.result(), follower.result()) == ("done", "done")
+    assert flight.coalesced == 1
+
+
+def test_single_flight_follower_stops_waiting_at_its_timeout():
+    flight, release = SingleFlight(), threading.Event()
+    leader = _slow_leader(flight, "k", release)
+
+    with pytest.raises(FutureTimeoutError):
+        flight.do("k", lambda: "not called", timeout=0.05)
+    release.set()
+    assert leader.result() == "done"
+
+
+def test_coalesced_call_keeps_its_own_deadline(monkeypatch):
+    client = ClaudeClient("test", coalesce=True)
+    started, release = threading.Event(), threading.Event()
+
+    def post_json(path, payload, deadline=None):
+        started.set()
+        release.wait(5)
+        return {"content": [{"type": "text", "text": "hello"}]}
+
+    monkeypatch.setattr(client, "_post_json", post_json)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        leader = pool.submit(client.generate_text, prompt="hi")
+        started.wait(5)
+        with pytest.raises(ClaudeUnavailableError):
+            client.generate_text(prompt="hi", deadline=0.05)
+        release.set()
+        assert leader.result() == "hello"
+
+
+def test_a_non_json_reply_is_a_client_error(monkeypatch):
+    client = ClaudeClient("test", retry=RetryPolicy(max_attempts=3))
+    calls = []
+
+    class HtmlResponse:
+        def json(self):
+            raise requests.exceptions.JSONDecodeError("Expecting value", "<html>", 0)
+
+    monkeypatch.setattr(client, "_send", lambda *args, **kwargs: calls.append(args) or HtmlResponse())
+
+    with pytest.raises(ClaudeClientError, match="Invalid JSON from Claude"):
+        client.generate_text(prompt="hi")
+    assert len(calls) == 1
+    assert client.breaker.state == CircuitBreaker.CLOSED
+
+
+def _async_client(monkeypatch, replies, **kwargs):
+    client = AsyncClaudeClient("test", retry=RetryPolicy(max_attempts=3, base_delay=0), **kwargs)
+    sent = []
+
+    def handler(request):
+        sent.append(json.loads(request.content))
+        return replies.pop(0)
+
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client, sent
+
+
+def test_async_client_retries_overload_and_returns_the_text(monkeypatch):
+    client, sent = _async_client(monkeypatch, [
+        httpx.Response(529, json={"error": {"message": "overloaded"}}),
+        httpx.Response(200, json={"content": [{"type": "text", "text": " hello "}]}),
+    ])
+
+    assert asyncio.run(client.generate_text(prompt="hi", deadline=5)) == "hello"
+    assert len(sent) == 2 and sent[0]["messages"] == [{"role": "user", "content": "hi"}]
+
+
+def test_async_client_rejects_a_non_json_reply(monkeypatch):
+    client, _ = _async_client(monkeypatch, [httpx.Response(200, text="<html>")])
+
+    with pytest.raises(ClaudeClientError, match="Invalid JSON from Claude"):
+        asyncio.run(client.chat([{"role": "user", "content": "hi"}]))
+
+
+def test_async_coalesced_call_keeps_its_own_deadline():
+    async def scenario():
+        client = AsyncClaudeClient("test", coalesce=True)
+        release = asyncio.Event()
+
+        async def post_json(path, payload, deadline=None):
+            await release.wait()
+            return {"content": [{"type": "text", "text": "hello"}]}
+
+        client._post_json = post_json
+        leader = asyncio.ensure_future(client.generate_text(prompt="hi"))
+        await asyncio.sleep(0)
+        with pytest.raises(ClaudeUnavailableError):
+            await client.generate_text(prompt="hi", deadline=0.05)
+        release.set()
+        return await leader
+
+    assert asyncio.run(scenario()) == "hello"
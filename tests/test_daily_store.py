@@ -0,0 +1,14 @@
+from services.daily_store import DailyStore
+
+
+def test_get_sees_records_rewritten_by_another_process(tmp_path):
+    path = tmp_path / "daily.sqlite3"
+    worker, other = DailyStore(path), DailyStore(path)
+    worker.put("2026-01-05", "Animals", {"word": "OTTER", "learning": None})
+    assert worker.get("2026-01-05", "Animals")["learning"] is None
+
+    other.put("2026-01-05", "Animals", {"word": "OTTER", "learning": {"definition": "an otter"}})
+
+    assert worker.get("2026-01-05", "Animals")["learning"] == {"definition": "an otter"}
+    other.prune("2026-01-06")
+    assert worker.get("2026-01-05", "Animals") is None
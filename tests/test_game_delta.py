@@ -0,0 +1,59 @@
+from services.game_delta import new_changes, record_change, respond, state_token
+
+
+def _game():
+    changes = record_change(new_changes(), "mask", "attempts", "learning")
+    response = {
+        "mode": "random",
+        "masked_word": "_ _ _",
+        "attempts_left": 6,
+        "hint": "a pet",
+        "guesses": [],
+        "learning": None,
+    }
+    return response, changes
+
+
+def test_without_a_usable_token_the_full_response_is_sent():
+    response, changes = _game()
+
+    full = respond(response, "g1", changes, since=None)
+    assert full == {**response, "state": "g1:1", "delta": False}
+    assert respond(response, "g1", changes, since="other:1")["delta"] is False
+    assert respond(response, "g1", changes, since="g1:9")["delta"] is False  # from the future
+    assert respond(response, "g1", changes, since="g1:x")["delta"] is False
+
+
+def test_delta_holds_only_what_changed_since_the_token():
+    response, changes = _game()
+    since = state_token("g1", changes)
+    changes = record_change(changes, "mask", guess=True)
+    response = {**response, "masked_word": "C _ _", "guesses": ["C"]}
+
+    delta = respond(response, "g1", changes, since=since)
+
+    assert delta == {"mode": "random", "masked_word": "C _ _", "guesses_added": ["C"], "state": "g1:2", "delta": True}
+
+
+def test_guesses_added_skip_untracked_older_guesses():
+    response, changes = _game()
+    changes = record_change(changes, "attempts", guess=True)  # miss: X
+    since = state_token("g1", changes)
+    changes = record_change(changes, "mask", guess=True)  # hit: C
+    changes = record_change(changes, "learning")
+    response = {**response, "guesses": [" ", "X", "C"], "learning": {"definition": "a cat"}}
+
+    delta = respond(response, "g1", changes, since=since)
+
+    assert delta["guesses_added"] == ["C"]
+    assert delta["learning"] == {"definition": "a cat"}
+    assert "attempts_left" not in delta and "hint" not in delta
+
+
+def test_record_change_leaves_the_old_log_alone():
+    changes = new_changes()
+    updated = record_change(changes, "mask", guess=True)
+
+    assert changes == new_changes()
+    assert updated == {"version": 1, "fields": {"mask": 1}, "guesses": [1]}
+    assert state_token("g1", None) == "g1:0"
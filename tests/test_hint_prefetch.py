@@ -0,0 +1,63 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from services import hint_prefetch
+from services.hint_prefetch import HintPrefetcher
+
+
+@pytest.fixture
+def executor():
+    executor = ThreadPoolExecutor(max_workers=1)
+    yield executor
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def test_budget_follows_the_player_across_new_games(executor):
+    prefetcher = HintPrefetcher(executor, budget_per_player=2)
+
+    assert prefetcher.schedule("alice", "game-1", "a", lambda: "hint")
+    assert prefetcher.schedule("alice", "game-2", "a", lambda: "hint")
+    assert not prefetcher.schedule("alice", "game-3", "a", lambda: "hint")
+    assert prefetcher.schedule("bob", "game-4", "a", lambda: "hint")
+
+    # Finishing a game frees its slot, not its player's budget
+    prefetcher.cancel("game-1")
+    assert not prefetcher.schedule("alice", "game-5", "a", lambda: "hint")
+
+
+def test_budget_refills_once_the_window_passes(executor, monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(hint_prefetch.time, "monotonic", lambda: now[0])
+    prefetcher = HintPrefetcher(executor, budget_per_player=1, window=60)
+
+    assert prefetcher.schedule("alice", "game-1", "a", lambda: "hint")
+    assert not prefetcher.schedule("alice", "game-1", "b", lambda: "hint")
+    now[0] += 60
+    assert prefetcher.schedule("alice", "game-1", "b", lambda: "hint")
+
+
+def test_a_new_state_cancels_the_stale_prefetch_of_that_game_only(executor):
+    release = threading.Event()
+    prefetcher = HintPrefetcher(executor)
+    prefetcher.schedule("alice", "game-1", "running", lambda: release.wait(5) and "running hint")
+    prefetcher.schedule("alice", "game-1", "stale", lambda: "stale hint")  # queued behind it
+    stale = prefetcher._slots["game-1"][1]
+    prefetcher.schedule("alice", "game-2", "other", lambda: "other hint")
+
+    prefetcher.schedule("alice", "game-1", "current", lambda: "current hint")
+    release.set()
+
+    assert stale.cancelled()
+    assert prefetcher.take("game-1", "stale") is None
+    assert prefetcher.take("game-1", "current", timeout=5) == "current hint"
+    assert prefetcher.take("game-2", "other", timeout=5) == "other hint"
+
+
+def test_abandoned_games_are_evicted_oldest_first(executor):
+    prefetcher = HintPrefetcher(executor, max_games=2)
+    for game in ("game-1", "game-2", "game-3"):
+        prefetcher.schedule("alice", game, "a", lambda: "hint")
+
+    assert list(prefetcher._slots) == ["game-2", "game-3"]
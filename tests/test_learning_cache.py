@@ -0,0 +1,71 @@
+import time
+
+import pytest
+
+from services.learning_cache import LearningCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = LearningCache(tmp_path / "cache.sqlite3", max_entries=3, touch_batch=100)
+    yield cache
+    cache.close()
+
+
+def _fill(cache, *words):
+    for word in words:
+        cache.set(word, "Animals", "v1", {"definition": word.lower()})
+        time.sleep(0.002)  # distinct accessed_at
+
+
+def test_memory_hits_keep_an_entry_from_being_evicted(cache):
+    _fill(cache, "CAT", "DOG", "EEL")
+    assert cache.get("CAT", "Animals", "v1") == {"definition": "cat"}  # served from memory
+
+    _fill(cache, "FOX")
+
+    assert cache.get("CAT", "Animals", "v1") is not None
+    assert cache.get("DOG", "Animals", "v1") is None
+    assert len(cache) == 3
+
+
+def test_eviction_only_drops_evicted_keys_from_memory(cache):
+    _fill(cache, "CAT", "DOG", "EEL", "FOX")
+
+    assert set(cache._memory) == {(word, "Animals", "v1") for word in ("DOG", "EEL", "FOX")}
+
+
+def test_memory_hits_are_written_in_batches(tmp_path):
+    cache = LearningCache(tmp_path / "cache.sqlite3", touch_batch=2)
+    _fill(cache, "CAT", "DOG")
+
+    def accessed_at(word):
+        return cache._conn.execute("SELECT accessed_at FROM learning_cache WHERE word = ?", (word,)).fetchone()[0]
+
+    before = accessed_at("CAT")
+    cache.get("CAT", "Animals", "v1")
+    assert accessed_at("CAT") == before
+    cache.get("DOG", "Animals", "v1")
+    assert accessed_at("CAT") > before
+    cache.close()
+
+
+def test_expired_entries_are_misses(tmp_path):
+    cache = LearningCache(tmp_path / "cache.sqlite3", ttl_seconds=0.01)
+    _fill(cache, "CAT")
+    time.sleep(0.02)
+    assert cache.get("CAT", "Animals", "v1") is None
+    assert cache.misses == 1
+    cache.close()
+
+
+def test_row_count_is_refreshed_from_the_table(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    other = LearningCache(path)
+    _fill(other, "CAT", "DOG", "EEL")
+    other.close()
+
+    cache = LearningCache(path, max_entries=3)
+    _fill(cache, "FOX")
+    assert len(cache) == 3
+    cache.close()
@@ -0,0 +1,17 @@
+import pytest
+
+from scripts.load_test import percentile
+
+
+@pytest.mark.parametrize(
+    "pct, expected",
+    [(50, 5), (90, 9), (95, 10), (99, 10), (100, 10), (10, 1), (0, 1)],
+)
+def test_percentile_uses_nearest_rank(pct, expected):
+    assert percentile([10, 9, 8, 7, 6, 5, 4, 3, 2, 1], pct) == expected
+
+
+def test_percentile_of_twenty_samples():
+    samples = list(range(1, 21))
+    assert percentile(samples, 95) == 19
+    assert percentile(samples, 50) == 10
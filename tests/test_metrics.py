@@ -0,0 +1,70 @@
+import json
+import os
+
+from services.metrics import Registry, merge_families, render_families
+
+
+def _registry(hits, latency):
+    registry = Registry()
+    registry.counter("hits_total", "Hits", ("cache",)).inc(hits, cache="learning")
+    registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0)).observe(latency)
+    registry.callback("open_streams", "Open streams", lambda: {(): 2}, kind="gauge")
+    return registry
+
+
+def test_render_matches_the_text_format():
+    text = _registry(3, 0.5).render()
+    assert '# TYPE hits_total counter\nhits_total{cache="learning"} 3.0' in text
+    assert 'latency_seconds_bucket{le="0.1"} 0' in text
+    assert 'latency_seconds_bucket{le="1.0"} 1' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 1' in text
+    assert "latency_seconds_count 1" in text
+    assert "open_streams 2.0" in text
+
+
+def test_families_from_several_processes_are_summed():
+    merged = merge_families([_registry(3, 0.5).collect(), _registry(4, 0.05).collect()])
+    text = render_families(merged)
+
+    assert 'hits_total{cache="learning"} 7.0' in text
+    assert 'latency_seconds_bucket{le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{le="1.0"} 2' in text
+    assert "latency_seconds_sum 0.55" in text
+    assert "latency_seconds_count 2" in text
+
+
+def test_render_directory_keeps_counters_but_not_gauges_of_exited_workers(tmp_path):
+    exited = _registry(4, 0.5).collect()
+    dead_pid = 2 ** 22 + 12345  # above the default pid_max
+    (tmp_path / f"{dead_pid}.json").write_text(json.dumps(exited))
+
+    text = _registry(3, 0.5).render_directory(tmp_path)
+
+    assert 'hits_total{cache="learning"} 7.0' in text
+    assert "open_streams 2.0" in text  # this process's gauge only
+    assert len(list(tmp_path.glob(f"{os.getpid()}-*.json"))) == 1
+
+
+def test_exited_workers_are_folded_into_one_file(tmp_path):
+    dead_pid = 2 ** 22 + 12345
+    (tmp_path / f"{dead_pid}-1.json").write_text(json.dumps(_registry(4, 0.5).collect()))
+    (tmp_path / f"{dead_pid + 1}-1.json").write_text(json.dumps(_registry(5, 0.5).collect()))
+    registry = _registry(3, 0.5)
+
+    first = registry.render_directory(tmp_path)
+    second = registry.render_directory(tmp_path)
+
+    assert 'hits_total{cache="learning"} 12.0' in first
+    assert first == second
+    assert sorted(path.name for path in tmp_path.glob("*.json") if path.name != "exited.json") == [
+        next(tmp_path.glob(f"{os.getpid()}-*.json")).name
+    ]
+
+
+def test_a_reused_pid_does_not_overwrite_an_exited_workers_samples(tmp_path):
+    # Written by an exited worker whose pid this process now has
+    (tmp_path / f"{os.getpid()}-1.json").write_text(json.dumps(_registry(4, 0.5).collect()))
+
+    text = _registry(3, 0.5).render_directory(tmp_path)
+
+    assert 'hits_total{cache="learning"} 7.0' in text
@@ -0,0 +1,80 @@
+import time
+
+import pytest
+
+from services import claude_client
+from services.claude_client import ClaudeClient, ClaudeHTTPError
+from services.resilience import CircuitBreaker, RetryPolicy, TokenBucket
+
+
+def test_retry_delay_honours_a_long_retry_after():
+    policy = RetryPolicy(base_delay=0.5, max_delay=8)
+
+    assert policy.delay(0, retry_after=20) == 20
+    assert 0 <= policy.delay(5) <= 8
+
+
+def _rate_limited_client(monkeypatch, retry_after):
+    client = ClaudeClient("test", retry=RetryPolicy(max_attempts=2, max_retry_after=60))
+    sleeps, calls = [], []
+    monkeypatch.setattr(claude_client.time, "sleep", sleeps.append)
+
+    def send(url, payload, timeout, stream=False):
+        calls.append(url)
+        raise ClaudeHTTPError("rate limited", 429, retry_after=retry_after)
+
+    monkeypatch.setattr(client, "_send", send)
+    return client, sleeps, calls
+
+
+def test_client_gives_up_when_retry_after_outlasts_the_deadline(monkeypatch):
+    client, sleeps, calls = _rate_limited_client(monkeypatch, retry_after=20)
+
+    with pytest.raises(ClaudeHTTPError):
+        client.generate_text(prompt="hi", deadline=5)
+    assert (len(calls), sleeps) == (1, [])
+
+
+def test_client_waits_out_retry_after_within_the_deadline(monkeypatch):
+    client, sleeps, calls = _rate_limited_client(monkeypatch, retry_after=20)
+
+    with pytest.raises(ClaudeHTTPError):
+        client.generate_text(prompt="hi", deadline=30)
+    assert len(calls) == 2
+    assert sleeps == [20]
+
+
+def test_breaker_opens_after_the_threshold_and_lets_one_probe_through():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    assert not breaker.allow()  # one probe at a time
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_failed_probe_reopens_the_breaker():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+
+def test_token_bucket_queues_reservations_and_refuses_long_waits():
+    bucket = TokenBucket(rate=10, burst=2)
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve(max_wait=0.05) is None
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
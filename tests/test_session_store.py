@@ -0,0 +1,109 @@
+import threading
+
+import pytest
+from flask import Flask, jsonify, session
+
+from services.session_store import MemorySessionBackend, ServerSideSessionInterface, SQLiteSessionBackend
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        return MemorySessionBackend()
+    return SQLiteSessionBackend(tmp_path / "sessions.sqlite3")
+
+
+@pytest.fixture
+def app(backend):
+    app = Flask(__name__)
+    app.secret_key = "test"
+    app.session_interface = ServerSideSessionInterface(backend)
+    app.poll_started = threading.Event()
+    app.poll_release = threading.Event()
+
+    @app.post("/start")
+    def start():
+        session["guesses"] = []
+        session["mode"] = "random"
+        return jsonify(ok=True)
+
+    @app.post("/guess/<letter>")
+    def guess(letter):
+        session["guesses"] = session["guesses"] + [letter]
+        return jsonify(guesses=session["guesses"])
+
+    @app.get("/poll")
+    def poll():
+        # A long poll: loads the session, waits, then changes another key
+        app.poll_started.set()
+        app.poll_release.wait(5)
+        session["learning_info"] = {"definition": "d"}
+        return jsonify(ok=True)
+
+    @app.get("/state")
+    def state():
+        return jsonify(dict(session))
+
+    return app
+
+
+def _client_with_cookie(app, cookie):
+    client = app.test_client()
+    client.set_cookie(cookie.key, cookie.value)
+    return client
+
+
+def test_overlapping_requests_keep_each_others_keys(app):
+    client = app.test_client()
+    client.post("/start")
+    cookie = client.get_cookie("session")
+
+    poller = threading.Thread(target=_client_with_cookie(app, cookie).get, args=("/poll",))
+    poller.start()
+    assert app.poll_started.wait(5)
+    client.post("/guess/E")
+    app.poll_release.set()
+    poller.join(5)
+
+    state = client.get("/state").get_json()
+    assert state["guesses"] == ["E"]
+    assert state["learning_info"] == {"definition": "d"}
+
+
+def test_removed_keys_are_removed_from_the_stored_copy(app):
+    @app.post("/forget")
+    def forget():
+        session.pop("mode", None)
+        return jsonify(ok=True)
+
+    client = app.test_client()
+    client.post("/start")
+    client.post("/forget")
+    assert "mode" not in client.get("/state").get_json()
+
+
+def test_update_applies_to_the_latest_stored_data(app):
+    @app.post("/late-write")
+    def late_write():
+        # Simulates an event stream: another request changes the session
+        # between this request's load and its post-response write.
+        other = _client_with_cookie(app, client.get_cookie("session"))
+        other.post("/guess/A")
+        app.session_interface.update(app, session, lambda data: data.update(hint="h"))
+        return jsonify(dict(session))
+
+    client = app.test_client()
+    client.post("/start")
+    seen = client.post("/late-write").get_json()
+
+    state = client.get("/state").get_json()
+    assert state["guesses"] == ["A"]
+    assert state["hint"] == "h"
+    assert seen["guesses"] == ["A"]
+
+
+def test_new_session_is_saved_whole_and_gets_a_cookie(app):
+    client = app.test_client()
+    response = client.post("/start")
+    assert "session=" in response.headers["Set-Cookie"]
+    assert client.get("/state").get_json() == {"guesses": [], "mode": "random"}
@@ -0,0 +1,54 @@
+from services.topic_bank import TopicWordBank, clean_topic, normalize_topic
+
+
+def _words(*words):
+    return [{"word": word, "hint": f"about {word.lower()}"} for word in words]
+
+
+def test_topics_are_cleaned_and_normalised():
+    assert clean_topic("  80s   Movies\n") == "80s Movies"
+    assert len(clean_topic("x" * 500)) == 60
+    assert normalize_topic("80S movies!!") == normalize_topic("80s Movies") == "80s movies"
+
+
+def test_add_deduplicates_and_bumps_the_version(tmp_path):
+    bank = TopicWordBank(tmp_path / "banks.sqlite3")
+    assert bank.snapshot("Space", "easy") == (0, ())
+
+    bank.add("Space", "easy", _words("MOON", "STAR"))
+    bank.add("space!", "easy", _words("moon", "COMET"))
+    version, words = bank.snapshot("SPACE", "easy")
+
+    assert version == 2
+    assert [entry["word"] for entry in words] == ["MOON", "STAR", "COMET"]
+    assert bank.words("Space", "hard") == ()
+
+
+def test_a_full_bank_still_changes_version(tmp_path):
+    bank = TopicWordBank(tmp_path / "banks.sqlite3", max_words_per_topic=2)
+    bank.add("Space", "easy", _words("MOON", "STAR"))
+    bank.add("Space", "easy", _words("COMET"))
+
+    version, words = bank.snapshot("Space", "easy")
+    assert version == 2
+    assert [entry["word"] for entry in words] == ["STAR", "COMET"]
+
+
+def test_banks_are_shared_between_processes(tmp_path):
+    path = tmp_path / "banks.sqlite3"
+    first, second = TopicWordBank(path), TopicWordBank(path)
+    first.add("Space", "easy", _words("MOON"))
+    assert [entry["word"] for entry in second.words("Space", "easy")] == ["MOON"]
+
+    first.add("Space", "easy", _words("STAR"))
+    assert second.snapshot("Space", "easy")[0] == 2
+    assert len(second.words("Space", "easy")) == 2
+
+
+def test_oldest_topics_are_dropped_past_max_topics(tmp_path):
+    bank = TopicWordBank(tmp_path / "banks.sqlite3", max_topics=2)
+    for topic in ("Space", "Oceans", "Birds"):
+        bank.add(topic, "easy", _words("WORD"))
+
+    assert bank.words("Space", "easy") == ()
+    assert bank.words("Birds", "easy")
@@ -0,0 +1,49 @@
+import random
+
+import pytest
+
+from services.word_mask import apply_guess, is_guessed, new_mask
+
+
+def _render(word, guesses):
+    # The mask as the app used to rebuild it from the whole guess list
+    return " ".join(char if char in guesses or not char.isalpha() else "_" for char in word)
+
+
+def test_new_mask_shows_punctuation_and_guessed_letters():
+    mask = new_mask("ICE-CREAM", guesses=["E"])
+
+    assert mask["masked"] == "_ _ E - _ _ E _ _"
+    assert mask["remaining"] == 6
+    assert is_guessed(mask, "E") and not is_guessed(mask, "C")
+
+
+def test_apply_guess_reports_hits_and_leaves_the_old_mask_alone():
+    mask = new_mask("POLAR BEAR")
+
+    after, hit = apply_guess("POLAR BEAR", mask, "A")
+    assert hit and after["masked"] == "_ _ _ A _   _ _ A _"
+    assert mask["remaining"] == 9
+
+    missed, hit = apply_guess("POLAR BEAR", after, "Z")
+    assert not hit
+    assert missed["masked"] == after["masked"] and is_guessed(missed, "Z")
+
+    again, hit = apply_guess("POLAR BEAR", after, "A")
+    assert hit and again == after
+
+
+@pytest.mark.parametrize("word", ["OTTER", "POLAR BEAR", "ÉCLAIR", "T-REX", "MISSISSIPPI"])
+def test_incremental_mask_matches_a_full_rebuild(word):
+    rng = random.Random(word)
+    letters = sorted(set(word + "ABCDEFGHIJKLMNOPQRSTUVWXYZ") - {" ", "-"})
+    rng.shuffle(letters)
+    mask, guesses = new_mask(word), []
+
+    for letter in letters:
+        mask, _ = apply_guess(word, mask, letter)
+        guesses.append(letter)
+        assert mask == new_mask(word, guesses)
+        assert mask["masked"] == _render(word, guesses)
+        assert mask["remaining"] == mask["masked"].split(" ").count("_")
+    assert mask["remaining"] == 0
@@ -0,0 +1,96 @@
+import os
+
+from services.word_store import (
+    load_categories,
+    open_snapshot,
+    pack_categories,
+    source_fingerprint,
+    write_snapshot,
+)
+
+SOURCES = [
+    ("Biology", {"subject": "Science", "grade_band": "6-8"}, [
+        {"word": "CELL", "hint": "unit of life", "definition": "the smallest living unit"},
+        {"word": "ÉCLAIR", "hint": "pastry"},
+        {"word": "ALGAE", "hint": "pond green"},
+        {"word": "CELL", "hint": "duplicate"},
+        {"word": "RED BLOOD CELL", "hint": "carries oxygen"},
+    ]),
+    ("Empty", None, []),
+]
+BANDS = {"easy": (3, 5), "hard": (6, 20)}
+
+
+def test_packed_entries_read_like_the_source_dicts():
+    categories = load_categories(pack_categories(SOURCES, BANDS))
+
+    biology = categories["Biology"]
+    assert [entry["word"] for entry in biology] == ["CELL", "ÉCLAIR", "ALGAE", "CELL", "RED BLOOD CELL"]
+    assert dict(biology[0]) == {
+        "word": "CELL",
+        "hint": "unit of life",
+        "definition": "the smallest living unit",
+        "subject": "Science",
+        "grade_band": "6-8",
+    }
+    assert "fun_fact" not in biology[1] and biology[1].get("fun_fact") is None
+    assert len(categories["Empty"]) == 0
+
+
+def test_find_uses_the_sorted_index():
+    biology = load_categories(pack_categories(SOURCES))["Biology"]
+
+    assert biology.find("CELL")["hint"] == "unit of life"  # first of the duplicates
+    assert biology.find("ÉCLAIR")["hint"] == "pastry"
+    assert biology.find("CEL") is None and biology.find("ZEBRA") is None
+    assert load_categories(pack_categories(SOURCES))["Empty"].find("CELL") is None
+
+
+def test_bands_index_words_by_length_without_spaces():
+    bands = load_categories(pack_categories(SOURCES, BANDS))["Biology"].bands
+
+    assert [entry["word"] for entry in bands["easy"]] == ["CELL", "ALGAE", "CELL"]
+    assert [entry["word"] for entry in bands["hard"]] == ["ÉCLAIR", "RED BLOOD CELL"]
+
+
+def test_digest_changes_only_with_the_category():
+    before = load_categories(pack_categories(SOURCES))
+    edited = [(SOURCES[0][0], SOURCES[0][1], [*SOURCES[0][2], {"word": "GENE", "hint": "heredity"}]), SOURCES[1]]
+    after = load_categories(pack_categories(edited))
+
+    assert before["Biology"].digest != after["Biology"].digest
+    assert before["Empty"].digest == after["Empty"].digest
+
+
+def test_snapshot_round_trip_and_staleness(tmp_path):
+    path = tmp_path / "words.bin"
+    write_snapshot(path, SOURCES, b"a" * 32, BANDS)
+
+    categories = open_snapshot(path, b"a" * 32)
+    assert categories["Biology"].find("ALGAE")["hint"] == "pond green"
+    assert len(categories["Biology"].bands["hard"]) == 2
+    assert open_snapshot(path, b"b" * 32) is None
+    assert open_snapshot(path, None) is not None  # last good snapshot, whatever its sources
+    assert open_snapshot(tmp_path / "missing.bin", b"a" * 32) is None
+
+
+def test_truncated_snapshot_is_rejected(tmp_path):
+    path = tmp_path / "words.bin"
+    size = write_snapshot(path, SOURCES, b"a" * 32)
+    with open(path, "r+b") as handle:
+        handle.truncate(size - 1)
+
+    assert open_snapshot(path, b"a" * 32) is None
+
+
+def test_source_fingerprint_follows_file_edits(tmp_path):
+    source = tmp_path / "curriculum.json"
+    missing = source_fingerprint(1, source)
+    source.write_text("{}")
+    written = source_fingerprint(1, source)
+    os.utime(source, ns=(0, 0))
+
+    assert len({missing, written, source_fingerprint(1, source)}) == 3
+    assert source_fingerprint(1, source) == source_fingerprint(1, source)
+    assert source_fingerprint(2, source) != source_fingerprint(1, source)
+
@@ -0,0 +1,27 @@
+"""WSGI entry point for production servers.
+
+    # from the hangman directory
+    python -m scripts.serve --workers 4 --threads 8     # recommended
+    gunicorn --preload 'wsgi:create_app()'              # any other WSGI server
+
+``scripts.serve`` runs gunicorn with the app preloaded in the master process
+and the fork hooks from ``app.prepare_for_fork`` / ``app.init_worker`` wired
+up. Other servers can use ``create_app()`` (or the module-level ``app``) but
+then have to call those hooks themselves when they fork after importing it;
+importing the app does not start the word-data watcher, ``init_worker`` does.
+"""
+
+from __future__ import annotations
+
+from flask import Flask
+
+
+def create_app() -> Flask:
+    """Import the application, building CATEGORIES and the word indexes."""
+
+    import app as application
+
+    return application.app
+
+
+app = create_app()